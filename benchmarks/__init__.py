@@ -0,0 +1 @@
+"""Benchmark-uri pe automate si gramatici sintetice (vezi rulare.py)."""
@@ -0,0 +1,5 @@
+import sys
+
+from benchmarks.rulare import main
+
+sys.exit(main())
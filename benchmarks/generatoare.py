@@ -0,0 +1,145 @@
+"""
+Generatoare deterministe (cu seed) de automate si gramatici sintetice, in formatele text din data/.
+
+Fiecare generator intoarce continutul fisierului ca string; acelasi seed da acelasi fisier,
+deci masuratorile facute pe masini sau versiuni diferite sunt comparabile.
+"""
+
+import random
+import string
+from pathlib import Path
+from typing import List
+
+# Simbolurile alfabetului: un singur caracter fiecare (vezi regula (2) din AFD.validare)
+SIMBOLURI = string.ascii_lowercase + string.digits
+# Neterminalele gramaticilor: S este mereu simbolul de start
+NETERMINALE = "S" + string.ascii_uppercase.replace("S", "")
+# Simbolul pentru λ (la fel ca AFN.SIMBOL_VID si Gramatica.SIMBOL_VID)
+SIMBOL_VID = "*"
+
+
+def _alfabet(nr_simboluri: int) -> List[str]:
+    if not 1 <= nr_simboluri <= len(SIMBOLURI):
+        raise ValueError(f"[Eroare] Numarul de simboluri trebuie sa fie intre 1 si {len(SIMBOLURI)}.")
+    return list(SIMBOLURI[:nr_simboluri])
+
+
+def _automat(stari: List[str], initiala: str, finale: List[str], sigma: List[str], reguli: List[str]) -> str:
+    # Formatul din data/afd si data/afn: Q, q0, F, Σ, apoi cate o tranzitie "q a p" pe linie
+    linii = [" ".join(stari), initiala, " ".join(finale), " ".join(sigma), *reguli]
+    return "\n".join(linii) + "\n"
+
+
+def afd_aleator(
+    nr_stari: int,
+    nr_simboluri: int,
+    densitate: float = 1.0,
+    proportie_finale: float = 0.3,
+    seed: int = 0,
+) -> str:
+    """
+    Un AFD cu starile q0..q{n-1}, in care fiecare pereche (q, a) are o tranzitie cu
+    probabilitatea `densitate` (1.0 = AFD complet), spre o stare aleasa uniform.
+    """
+    rng = random.Random(seed)
+    stari = [f"q{i}" for i in range(nr_stari)]
+    sigma = _alfabet(nr_simboluri)
+    finale = [q for q in stari if rng.random() < proportie_finale] or [stari[-1]]
+
+    reguli = [
+        f"{q} {a} {rng.choice(stari)}"
+        for q in stari
+        for a in sigma
+        if densitate >= 1.0 or rng.random() < densitate
+    ]
+    return _automat(stari, stari[0], finale, sigma, reguli)
+
+
+def afn_aleator(
+    nr_stari: int,
+    nr_simboluri: int,
+    tranzitii_per_stare: int = 3,
+    proportie_lambda: float = 0.1,
+    proportie_finale: float = 0.3,
+    seed: int = 0,
+) -> str:
+    """
+    Un AFN cu starile q0..q{n-1}, cu `tranzitii_per_stare` tranzitii aleatorii din fiecare stare;
+    o fractiune `proportie_lambda` dintre ele sunt λ-tranzitii.
+    """
+    rng = random.Random(seed)
+    stari = [f"q{i}" for i in range(nr_stari)]
+    sigma = _alfabet(nr_simboluri)
+    finale = [q for q in stari if rng.random() < proportie_finale] or [stari[-1]]
+
+    reguli = list()
+    for q in stari:
+        for _ in range(tranzitii_per_stare):
+            simbol = SIMBOL_VID if rng.random() < proportie_lambda else rng.choice(sigma)
+            reguli.append(f"{q} {simbol} {rng.choice(stari)}")
+    return _automat(stari, stari[0], finale, sigma, reguli)
+
+
+def afn_al_n_lea_de_la_final(n: int) -> str:
+    """
+    AFN-ul cu n + 1 stari pentru limbajul cuvintelor peste {a, b} al caror simbol al n-lea
+    de la final este a. Orice AFD echivalent are cel putin 2^n stari: este cazul cel mai
+    defavorabil pentru constructia submultimilor.
+    """
+    if n < 1:
+        raise ValueError("[Eroare] n trebuie sa fie cel putin 1.")
+    stari = [f"q{i}" for i in range(n + 1)]
+    reguli = ["q0 a q0", "q0 b q0", "q0 a q1"]
+    for i in range(1, n):
+        reguli += [f"q{i} a q{i + 1}", f"q{i} b q{i + 1}"]
+    return _automat(stari, "q0", [f"q{n}"], ["a", "b"], reguli)
+
+
+def gramatica_recursiva(
+    nr_neterminale: int,
+    nr_terminale: int,
+    productii_per_neterminal: int = 3,
+    lungime_maxima: int = 4,
+    liniara: bool = False,
+    seed: int = 0,
+) -> str:
+    """
+    O gramatica in formatul din data/gramatica, in care fiecare neterminal are o productie
+    terminala (deci toate neterminalele sunt productive) si `productii_per_neterminal`
+    productii recursive. Cu `liniara`, productiile recursive au forma „terminale + un neterminal”
+    (gramatica liniara la dreapta, deci regulata).
+    """
+    if not 1 <= nr_neterminale <= len(NETERMINALE):
+        raise ValueError(f"[Eroare] Numarul de neterminale trebuie sa fie intre 1 si {len(NETERMINALE)}.")
+    rng = random.Random(seed)
+    vn = list(NETERMINALE[:nr_neterminale])
+    vt = _alfabet(nr_terminale)
+
+    productii = list()
+    for x in vn:
+        productii.append(f"{x} {''.join(rng.choices(vt, k=rng.randint(1, lungime_maxima)))}")
+        for _ in range(productii_per_neterminal):
+            if liniara:
+                terminale = "".join(rng.choices(vt, k=rng.randint(1, lungime_maxima - 1)))
+                productii.append(f"{x} {terminale}{rng.choice(vn)}")
+                continue
+            # Cel putin un neterminal, restul simbolurilor amestecate
+            simboluri = [rng.choice(vn)] + rng.choices(vn + vt, k=rng.randint(1, lungime_maxima - 1))
+            rng.shuffle(simboluri)
+            productii.append(f"{x} {''.join(simboluri)}")
+
+    linii = [" ".join(vn), " ".join(vt), "S", *productii]
+    return "\n".join(linii) + "\n"
+
+
+def cuvinte_aleatoare(sigma: List[str], numar: int, lungime: int, seed: int = 0) -> List[str]:
+    """`numar` cuvinte de lungime `lungime`, cu simboluri alese uniform din `sigma`."""
+    rng = random.Random(seed)
+    return ["".join(rng.choices(sigma, k=lungime)) for _ in range(numar)]
+
+
+def scriere(file_path: Path, continut: str) -> Path:
+    """Scrie continutul generat in fisier (directoarele parinte sunt create la nevoie)."""
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    file_path.write_text(continut, encoding="utf-8")
+    return file_path
@@ -0,0 +1,309 @@
+"""
+Ruleaza benchmark-urile pe automate si gramatici generate (vezi generatoare.py) si scrie
+rezultatele ca JSON, pentru comparatii intre versiuni:
+
+    python -m benchmarks --marime mic --iesire rezultate.json
+    python -m benchmarks --marime mic --compara rezultate.json
+
+Operatiile masurate: citire (parse), validare, compilare, acceptare, determinizare, generare.
+Pentru fiecare se pastreaza cel mai bun timp din `repetari` rulari. Totul ruleaza local,
+fisierele generate sunt scrise intr-un director temporar (sau in --director).
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks import generatoare
+from src.afd import AFD
+from src.afn import AFN
+from src.gramatica import Gramatica
+from src.transformare import Transformator
+
+# Versiunea formatului JSON al rezultatelor
+VERSIUNE = 1
+
+# Dimensiunile rulate pentru fiecare marime predefinita. AFN-urile aleatorii raman mici:
+# numarul de stari AFD creste exponential cu numarul de stari AFN (100 de stari -> ~76.000)
+MARIMI: Dict[str, Dict] = {
+    "mic": {
+        "afd_stari": [100, 1_000],
+        "afn_stari": [10, 30],
+        "al_n_lea": [4, 8],
+        "gramatica_neterminale": [3, 8],
+        "nr_cuvinte": 1_000,
+        "lungime_cuvant": 50,
+        "nr_generari": 200,
+    },
+    "mediu": {
+        "afd_stari": [1_000, 10_000, 100_000],
+        "afn_stari": [30, 60, 90],
+        "al_n_lea": [6, 10, 12],
+        "gramatica_neterminale": [4, 12, 25],
+        "nr_cuvinte": 10_000,
+        "lungime_cuvant": 100,
+        "nr_generari": 1_000,
+    },
+    "mare": {
+        "afd_stari": [10_000, 100_000, 1_000_000],
+        "afn_stari": [60, 90, 120],
+        "al_n_lea": [10, 14, 16],
+        "gramatica_neterminale": [8, 16, 25],
+        "nr_cuvinte": 100_000,
+        "lungime_cuvant": 200,
+        "nr_generari": 5_000,
+    },
+}
+
+# Numarul de simboluri din alfabetul automatelor aleatorii
+NR_SIMBOLURI = 4
+# Lungimea maxima a cuvintelor generate de gramatici
+MAX_LEN_GENERARE = 30
+
+
+def cronometrare(functie: Callable[[], object], repetari: int) -> float:
+    """Cel mai bun timp (in secunde) din `repetari` apeluri ale functiei."""
+    cel_mai_bun = float("inf")
+    for _ in range(repetari):
+        start = time.perf_counter()
+        functie()
+        cel_mai_bun = min(cel_mai_bun, time.perf_counter() - start)
+    return cel_mai_bun
+
+
+class Benchmark:
+    """
+    Colecteaza masuratorile: fiecare rezultat are cazul (familia de date), parametrii
+    generatorului, operatia, numarul de unitati procesate si timpul.
+    """
+
+    def __init__(self, director: Path, repetari: int, seed: int, verbose: bool = True) -> None:
+        self.director = director
+        self.repetari = repetari
+        self.seed = seed
+        self.verbose = verbose
+        self.rezultate: List[Dict] = list()
+
+    def masoara(
+        self,
+        caz: str,
+        parametri: Dict,
+        operatie: str,
+        unitati: int,
+        unitate: str,
+        functie: Callable[[], object],
+    ) -> None:
+        secunde = cronometrare(functie, self.repetari)
+        rezultat = {
+            "caz": caz,
+            "parametri": parametri,
+            "operatie": operatie,
+            "unitati": unitati,
+            "unitate": unitate,
+            "secunde": secunde,
+            "pe_secunda": unitati / secunde if secunde > 0 else None,
+        }
+        self.rezultate.append(rezultat)
+        if self.verbose:
+            print(
+                f"{caz:<26} {json.dumps(parametri):<40} {operatie:<14} "
+                f"{secunde:10.4f}s  {unitati / secunde if secunde > 0 else 0:14,.0f} {unitate}/s",
+                file=sys.stderr,
+            )
+
+    def _fisier(self, nume: str, continut: str) -> Path:
+        return generatoare.scriere(self.director / nume, continut)
+
+    def _cuvinte(self, sigma: List[str], marime: Dict) -> List[str]:
+        return generatoare.cuvinte_aleatoare(
+            sigma, marime["nr_cuvinte"], marime["lungime_cuvant"], self.seed
+        )
+
+    def afd(self, nr_stari: int, marime: Dict) -> None:
+        """Citire, validare, compilare si acceptare (verificare_lot) pentru un AFD aleator complet."""
+        parametri = {"stari": nr_stari, "simboluri": NR_SIMBOLURI}
+        file_path = self._fisier(
+            f"afd-{nr_stari}.txt", generatoare.afd_aleator(nr_stari, NR_SIMBOLURI, seed=self.seed)
+        )
+
+        def citire() -> AFD:
+            afd = AFD()
+            afd.citire(file_path)
+            return afd
+
+        afd = citire()
+        nr_reguli = len(afd.Reguli)
+        self.masoara("afd_aleator", parametri, "citire", nr_reguli, "tranzitii", citire)
+        self.masoara(
+            "afd_aleator", parametri, "validare", nr_reguli, "tranzitii",
+            lambda: afd.validare(should_print=False),
+        )
+        self.masoara("afd_aleator", parametri, "compilare", nr_reguli, "tranzitii", afd.compilare)
+
+        cuvinte = self._cuvinte(afd.Sigma, marime)
+        self.masoara(
+            "afd_aleator", parametri, "acceptare", sum(map(len, cuvinte)), "simboluri",
+            lambda: deque(afd.verificare_lot(cuvinte), maxlen=0),
+        )
+
+    def afn(self, caz: str, parametri: Dict, continut: str, marime: Dict) -> None:
+        """Citire, validare, acceptare (simulare pe biti) si determinizare pentru un AFN."""
+        file_path = self._fisier(f"{caz}-{'-'.join(map(str, parametri.values()))}.txt", continut)
+
+        def citire() -> AFN:
+            afn = AFN()
+            afn.citire(file_path)
+            return afn
+
+        afn = citire()
+        nr_reguli = len(afn.Reguli)
+        self.masoara(caz, parametri, "citire", nr_reguli, "tranzitii", citire)
+        self.masoara(
+            caz, parametri, "validare", nr_reguli, "tranzitii",
+            lambda: afn.validare(should_print=False),
+        )
+
+        afn.compilare()
+        cuvinte = self._cuvinte(afn.Sigma, marime)
+        self.masoara(
+            caz, parametri, "acceptare", sum(map(len, cuvinte)), "simboluri",
+            lambda: deque(afn.accepta_lot(cuvinte), maxlen=0),
+        )
+
+        transformator = Transformator(afn)
+        afd = transformator.transformare_AFN_in_AFD(should_print=False)
+        self.masoara(
+            caz, parametri, "determinizare", len(afd.Stari), "stari AFD",
+            lambda: transformator.transformare_AFN_in_AFD(should_print=False),
+        )
+
+    def gramatica(self, nr_neterminale: int, liniara: bool, marime: Dict) -> None:
+        """Citire, verificare si generare (limitata la MAX_LEN_GENERARE) pentru o gramatica recursiva."""
+        caz = "gramatica_liniara" if liniara else "gramatica_recursiva"
+        parametri = {"neterminale": nr_neterminale, "terminale": NR_SIMBOLURI}
+        file_path = self._fisier(
+            f"{caz}-{nr_neterminale}.txt",
+            generatoare.gramatica_recursiva(
+                nr_neterminale, NR_SIMBOLURI, liniara=liniara, seed=self.seed
+            ),
+        )
+
+        def citire() -> Gramatica:
+            gramatica = Gramatica()
+            gramatica.citire(file_path)
+            return gramatica
+
+        gramatica = citire()
+        nr_productii = len(gramatica.productiile)
+        self.masoara(caz, parametri, "citire", nr_productii, "productii", citire)
+        self.masoara(
+            caz, parametri, "validare", nr_productii, "productii",
+            lambda: gramatica.verificare(should_print=False),
+        )
+
+        nr_generari = marime["nr_generari"]
+
+        def generare() -> None:
+            # Acelasi seed la fiecare repetare: aceleasi cuvinte, deci timpi comparabili
+            rng = random.Random(self.seed)
+            for _ in range(nr_generari):
+                gramatica.generare(
+                    should_print=False, cu_pasi=False, rng=rng, max_len=MAX_LEN_GENERARE
+                )
+
+        self.masoara(caz, parametri, "generare", nr_generari, "cuvinte", generare)
+
+    def ruleaza(self, marime: Dict) -> None:
+        for nr_stari in marime["afd_stari"]:
+            self.afd(nr_stari, marime)
+        for nr_stari in marime["afn_stari"]:
+            self.afn(
+                "afn_aleator",
+                {"stari": nr_stari, "simboluri": NR_SIMBOLURI},
+                generatoare.afn_aleator(nr_stari, NR_SIMBOLURI, seed=self.seed),
+                marime,
+            )
+        for n in marime["al_n_lea"]:
+            self.afn(
+                "afn_al_n_lea_de_la_final", {"n": n}, generatoare.afn_al_n_lea_de_la_final(n), marime
+            )
+        for nr_neterminale in marime["gramatica_neterminale"]:
+            self.gramatica(nr_neterminale, False, marime)
+            self.gramatica(nr_neterminale, True, marime)
+
+
+def _cheie(rezultat: Dict) -> str:
+    return f"{rezultat['caz']} {json.dumps(rezultat['parametri'], sort_keys=True)} {rezultat['operatie']}"
+
+
+def comparare(vechi: Dict, nou: Dict, prag: float = 0.1) -> List[str]:
+    """
+    Compara doua rulari (JSON-urile scrise de acest modul) si afiseaza raportul timpilor
+    (nou / vechi) pentru fiecare masuratoare comuna. Intoarce masuratorile mai lente cu
+    mai mult de `prag` (de ex. 0.1 = 10%).
+    """
+    timpi_vechi = {_cheie(r): r["secunde"] for r in vechi["rezultate"]}
+    regresii: List[str] = list()
+    for rezultat in nou["rezultate"]:
+        cheie = _cheie(rezultat)
+        if cheie not in timpi_vechi or timpi_vechi[cheie] <= 0:
+            continue
+        raport = rezultat["secunde"] / timpi_vechi[cheie]
+        marcaj = ""
+        if raport > 1 + prag:
+            regresii.append(cheie)
+            marcaj = "  <-- mai lent"
+        print(f"{cheie:<90} x{raport:6.2f}{marcaj}")
+    return regresii
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark-uri pentru AFD, AFN si gramatici.")
+    parser.add_argument("--marime", choices=sorted(MARIMI), default="mic")
+    parser.add_argument("--repetari", type=int, default=3, help="se pastreaza cel mai bun timp")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--iesire", type=Path, help="fisierul JSON cu rezultatele (implicit stdout)")
+    parser.add_argument("--director", type=Path, help="pastreaza fisierele generate in acest director")
+    parser.add_argument("--compara", type=Path, help="un JSON anterior, pentru detectarea regresiilor")
+    parser.add_argument("--prag", type=float, default=0.1, help="incetinirea tolerata la comparare")
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as temporar:
+        benchmark = Benchmark(args.director or Path(temporar), args.repetari, args.seed)
+        benchmark.ruleaza(MARIMI[args.marime])
+
+    rezultat = {
+        "versiune": VERSIUNE,
+        "mediu": {
+            "python": platform.python_version(),
+            "implementare": platform.python_implementation(),
+            "platforma": platform.platform(),
+            "marime": args.marime,
+            "repetari": args.repetari,
+            "seed": args.seed,
+        },
+        "rezultate": benchmark.rezultate,
+    }
+    text = json.dumps(rezultat, indent=2, ensure_ascii=False)
+    if args.iesire:
+        args.iesire.write_text(text + "\n", encoding="utf-8")
+    elif not args.compara:
+        print(text)
+
+    if args.compara:
+        vechi = json.loads(args.compara.read_text(encoding="utf-8"))
+        regresii = comparare(vechi, rezultat, args.prag)
+        print(f"\n{len(regresii)} masuratori mai lente cu peste {args.prag:.0%}.")
+        return 1 if regresii else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
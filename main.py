@@ -1,9 +1,33 @@
-from src.gramatica import Gramatica
-from src.afd import AFD
+from src import instrumentare
+from src.path import PathMaker
+from src.flux import (
+    clasificare_fisier,
+    clasificare_paralela,
+    loturi_linii,
+    DIMENSIUNE_LOT,
+)
+from src.cache import CacheAutomate
+from src.afd import AFD, Verdict
 from src.afn import AFN
+from src.gramatica import Gramatica
 from src.transformare import Transformator
-from src.path import PathMaker
-from typing import Set
+from src.esantionare import esantionare_paralela
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set, TextIO, Union
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import sys
+
+
+def get_cache() -> CacheAutomate:
+    """
+    Cache-ul pentru automatele si gramaticile compilate (directorul "cache" de langa main.py).
+    Fisierele sursa neschimbate sunt incarcate direct din formatul binar, fara o noua citire.
+    """
+    return CacheAutomate(PathMaker(__file__, "cache"))
 
 
 def run_exercise_1_solution():
@@ -16,12 +40,9 @@ def run_exercise_1_solution():
     path_maker = PathMaker(__file__, "data", "gramatica")
     file_path = path_maker.get_independent_OS_path("3.txt")
 
-    # Definim un obiect de tip Gramatica
-    G1 = Gramatica()
-
-    # Se citeste din fisier o gramatica
+    # Se citeste din fisier (sau din cache, daca fisierul nu s-a schimbat) o gramatica
     try:
-        G1.citire(file_path)
+        G1 = get_cache().gramatica(file_path)
     except Exception as e:
         print(e)
         return
@@ -30,29 +51,21 @@ def run_exercise_1_solution():
     if G1.verificare():
         G1.afisare()
 
+        # Se elimina productiile inutile; daca limbajul este vid nu are rost sa generam cuvinte
+        if not G1.eliminare_productii_inutile():
+            return
+
         # Se defineste un set care va contine n cuvinte finale distincte generate de gramatica
-        final_distinct_words: Set[str] = set()
         n = int(input("\nIntroduce-ti numarul de cuvinte de generat: "))
 
-        # Pentru a evita cazul unei bucle infinite definim un maxim rezonabil de incercari
-        attempt = 0
-        LOOP_MAX_ATTEMPTS = 100_000
-
-        # Se ruleaza functia de generare pana avem n cuvinte finale distincte
-        while len(final_distinct_words) < n and attempt < LOOP_MAX_ATTEMPTS:
-            attempt += 1
-            try:
-                steps = G1.generare()
-            except Exception as e:
-                print(e)
-                continue
-
-            # Daca nu exista pasi intermediari (lista e goala), treci la urmatoare incercare
-            if not steps:
-                continue
+        # Cuvintele distincte sunt enumerate sistematic, in ordinea crescatoare a lungimii,
+        # deci se iau direct primele n (fara incercari aleatorii repetate)
+        final_distinct_words: Set[str] = set(itertools.islice(G1.enumerare(), n))
 
-            # Se adauga cuvantul final in set
-            final_distinct_words.add(steps[-1])
+        # Daca limbajul este finit se pot obtine mai putine cuvinte decat s-au cerut
+        instr = instrumentare.curenta()
+        instr.numara("main.cuvinte_cerute", n)
+        instr.numara("main.cuvinte_generate", len(final_distinct_words))
 
         # Printeaza cuvintele finale
         print(
@@ -60,22 +73,44 @@ def run_exercise_1_solution():
         )
 
 
-def run_exercise_2_solution():
+def run_exercise_2_solution(
+    words_file: str | None = None, output_file: str | None = None
+):
+    """
+    Ruleaza solutia pentru exercitiul 2.
+    Daca se da `words_file` (un fisier din data/afd cu cate un cuvant pe linie), cuvintele sunt
+    clasificate in flux, fara interactiune. Verdictele sunt scrise in `output_file` (cale data de
+    apelant, relativa la directorul curent) sau, implicit, la stdout.
+    Altfel, cuvintele sunt cerute pe rand de la tastatura.
+    """
     path_maker = PathMaker(__file__, "data", "afd")
     file_path = path_maker.get_independent_OS_path("1.txt")
 
-    # Initializam un obiect AFD gol.
-    afd = AFD()
-
     try:
-        # Incercam sa citim definitia AFD-ului din fisier.
-        afd.citire(file_path)
+        # Incercam sa citim definitia AFD-ului din fisier (sau din cache, daca fisierul nu s-a schimbat).
+        afd = get_cache().afd(file_path)
     except Exception as e:
         # Daca apare o eroare la citire (format gresit, fisier lipsa, etc.),
         # o afisam si oprim executia functiei.
         print(e)
         return
-    
+
+    # Modul non-interactiv: fisierul de cuvinte este citit in flux si clasificat in blocuri,
+    # fara afisarea AFD-ului (iesirea contine doar verdictele)
+    if words_file is not None:
+        if not afd.validare():
+            return
+        words_path = path_maker.get_independent_OS_path(words_file)
+        if output_file is None:
+            statistici = clasificare_fisier(afd, words_path, sys.stdout)
+            # Statisticile merg la stderr, ca sa nu se amestece cu verdictele
+            print(f"Verdictele au fost scrise la stdout: {statistici}", file=sys.stderr)
+        else:
+            output_path = Path(output_file)
+            statistici = clasificare_fisier(afd, words_path, output_path)
+            print(f"Verdictele au fost scrise in '{output_path}': {statistici}")
+        return
+
     # Daca AFD-ul citit este valid conform regulilor de validare...
     if afd.validare():
         # ... il afisam (stari, alfabet, stare initiala, stari finale, tranzitii).
@@ -91,31 +126,343 @@ def run_exercise_2_solution():
 
             # Cerem un nou cuvant; daca se apasa doar Enter, bucla se opreste.
             cuvant = input("\nIntroduce-ti un cuvant pentru verificare: ")
-            
-            
+
+
 def run_exercise_3_solution():
     path_maker = PathMaker(__file__, "data", "afn")
     file_path = path_maker.get_independent_OS_path("1.txt")
-    
-    afn = AFN()
-    
+
+    cache = get_cache()
+
     try:
-        afn.citire(file_path)
+        afn = cache.afn(file_path)
     except Exception as e:
         print(e)
         return
-    
+
     if afn.validare():
         afn.afisare()
-        
-        transformare = Transformator(afn)
-        afd = transformare.transformare_AFN_in_AFD()
 
-def main() -> None:
+        # AFD-ul determinizat este si el pastrat in cache
+        afd = cache.afd_din_afn(file_path)
+        afd.afisare()
+
+
+def run_with_stats(exercise, *args, profile: bool = False):
+    """
+    Ruleaza un exercitiu cu instrumentarea activa si afiseaza la final contoarele si timpii
+    raportati de motoare (vezi src/instrumentare.py). Cu profile=True, exercitiul ruleaza
+    si sub cProfile, iar cele mai costisitoare functii sunt afisate.
+    """
+    instrumentare.activeaza()
+    try:
+        if profile:
+            instrumentare.profilare(exercise, *args)
+        else:
+            exercise(*args)
+    finally:
+        print(f"\nStatistici:\n{instrumentare.dezactiveaza()}")
+
+
+# ---------------------------------------------------------------------------------------------
+# Linia de comanda (fara input() interactiv), pentru folosirea in pipeline-uri:
+#
+#   python main.py validate afd data/afd/1.txt
+#   python main.py accept afd data/afd/1.txt data/afd/cuvinte.txt --workers 4
+#   cat cuvinte.txt | python main.py accept afn data/afn/1.txt --format tsv
+#   python main.py determinize data/afn/1.txt --minimize -o afd.txt
+#   python main.py generate data/gramatica/3.txt -n 100 --seed 1 --workers 4
+#   python main.py enumerate data/gramatica/3.txt --max-len 6
+#
+# Fara argumente, main.py ruleaza exercitiile ca pana acum.
+# ---------------------------------------------------------------------------------------------
+
+Automat = Union[AFD, AFN, Gramatica]
+
+
+def load(kind: str, file_path: Path, use_cache: bool = True) -> Automat:
+    """
+    Citeste un AFD, un AFN sau o gramatica din fisierul text dat (din cache, daca use_cache
+    este True si fisierul nu s-a schimbat).
+    """
+    if use_cache:
+        cache = get_cache()
+        return {"afd": cache.afd, "afn": cache.afn, "gramatica": cache.gramatica}[kind](
+            file_path
+        )
+
+    obiect: Automat = {"afd": AFD, "afn": AFN, "gramatica": Gramatica}[kind]()
+    obiect.citire(file_path)
+    return obiect
+
+
+def is_valid(obiect: Automat) -> bool:
+    # Mesajele de validare merg la stderr, ca sa nu amestece iesirea (JSONL/TSV) de pe stdout
+    with contextlib.redirect_stdout(sys.stderr):
+        if isinstance(obiect, Gramatica):
+            return obiect.verificare()
+        return obiect.validare()
+
+
+def write_records(iesire: TextIO, output_format: str, records: Iterable[Dict]) -> int:
+    """
+    Scrie fiecare inregistrare ca o linie JSON sau ca o linie TSV (valorile in ordinea cheilor,
+    None devine camp gol). Intoarce numarul de inregistrari scrise.
+    """
+    numar = 0
+    for record in records:
+        if output_format == "jsonl":
+            iesire.write(json.dumps(record, ensure_ascii=False) + "\n")
+        else:
+            iesire.write(
+                "\t".join("" if v is None else str(v) for v in record.values()) + "\n"
+            )
+        numar += 1
+    return numar
+
+
+def command_validate(args: argparse.Namespace, iesire: TextIO) -> int:
+    obiect = load(args.kind, args.file, not args.no_cache)
+    valid = is_valid(obiect)
+    write_records(
+        iesire,
+        args.format,
+        [{"fisier": str(args.file), "tip": args.kind, "valid": valid}],
+    )
+    return 0 if valid else 1
+
+
+def command_accept(args: argparse.Namespace, iesire: TextIO) -> int:
+    automat = load(args.kind, args.automaton, not args.no_cache)
+    if not is_valid(automat):
+        print(
+            f"[Eroare] Automatul din '{args.automaton}' nu este valid.", file=sys.stderr
+        )
+        return 1
+
+    # Cuvintele: un fisier (citit prin mmap) sau stdin, impartite in loturi pentru workeri
+    sursa = sys.stdin if args.words in (None, "-") else Path(args.words)
+    loturi = loturi_linii(sursa, args.batch_size)
+
+    def records() -> Iterable[Dict]:
+        for cuvant, rezultat in clasificare_paralela(automat, loturi, args.workers):
+            if isinstance(rezultat, Verdict):
+                yield {
+                    "cuvant": cuvant.strip(),
+                    "rezultat": rezultat.rezultat,
+                    "pozitie": rezultat.pozitie,
+                }
+            else:
+                yield {
+                    "cuvant": cuvant.strip(),
+                    "rezultat": "acceptat" if rezultat else "neacceptat",
+                }
+
+    write_records(iesire, args.format, records())
+    return 0
+
+
+def command_determinize(args: argparse.Namespace, iesire: TextIO) -> int:
+    afn = load("afn", args.automaton, not args.no_cache)
+    if not is_valid(afn):
+        print(f"[Eroare] AFN-ul din '{args.automaton}' nu este valid.", file=sys.stderr)
+        return 1
+
+    with contextlib.redirect_stdout(sys.stderr):
+        if args.no_cache:
+            afd = Transformator(afn).transformare_AFN_in_AFD()
+        else:
+            afd = get_cache().afd_din_afn(args.automaton)
+        if args.minimize:
+            afd = afd.minimizeaza()
+
+    # AFD-ul rezultat este scris in formatul din data/afd, deci poate fi citit din nou
+    iesire.write(afd.in_text())
+    return 0
+
+
+def load_grammar(args: argparse.Namespace) -> Optional[Gramatica]:
+    # Gramatica trebuie sa fie valida; productiile inutile sunt eliminate inainte de generare
+    gramatica = load("gramatica", args.grammar, not args.no_cache)
+    if not is_valid(gramatica):
+        print(
+            f"[Eroare] Gramatica din '{args.grammar}' nu este valida.", file=sys.stderr
+        )
+        return None
+    if not gramatica.eliminare_productii_inutile(should_print=False):
+        print(
+            f"[Eroare] Gramatica din '{args.grammar}' genereaza limbajul vid.",
+            file=sys.stderr,
+        )
+        return None
+    return gramatica
+
+
+def command_generate(args: argparse.Namespace, iesire: TextIO) -> int:
+    gramatica = load_grammar(args)
+    if gramatica is None:
+        return 1
+
+    statistici: Dict[str, int] = dict()
+    cuvinte = esantionare_paralela(
+        gramatica,
+        args.n,
+        seed=args.seed,
+        workers=args.workers,
+        statistici=statistici,
+        max_len=args.max_len,
+        max_pasi=args.max_steps,
+    )
+    numar = write_records(
+        iesire, args.format, ({"cuvant": cuvant} for cuvant in cuvinte)
+    )
+
+    # Generarile esuate (ValueError in generare) sunt reincercate de esantionare
+    instr = instrumentare.curenta()
+    instr.numara("main.cuvinte_cerute", args.n)
+    instr.numara("main.cuvinte_generate", numar)
+    instr.numara("main.generari_esuate", statistici["esecuri"])
+
+    if numar < args.n:
+        print(
+            f"S-au generat doar {numar} cuvinte distincte din {args.n} cerute "
+            f"({statistici['generari']} generari, dintre care {statistici['esecuri']} esuate).",
+            file=sys.stderr,
+        )
+    return 0
+
+
+def command_enumerate(args: argparse.Namespace, iesire: TextIO) -> int:
+    if args.n is None and args.max_len is None:
+        print(
+            "[Eroare] Pentru enumerare trebuie dat -n si/sau --max-len.",
+            file=sys.stderr,
+        )
+        return 2
+    gramatica = load_grammar(args)
+    if gramatica is None:
+        return 1
+
+    cuvinte = itertools.islice(gramatica.enumerare(args.max_len), args.n)
+    write_records(iesire, args.format, ({"cuvant": cuvant} for cuvant in cuvinte))
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    # Optiunile comune tuturor subcomenzilor
+    comune = argparse.ArgumentParser(add_help=False)
+    comune.add_argument(
+        "--format", choices=("jsonl", "tsv"), default="jsonl", help="formatul iesirii"
+    )
+    comune.add_argument(
+        "-o", "--output", type=Path, help="fisierul de iesire (implicit stdout)"
+    )
+    comune.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="nu folosi cache-ul de automate compilate",
+    )
+
+    parser = argparse.ArgumentParser(
+        description="AFD, AFN si gramatici din linia de comanda."
+    )
+    subcomenzi = parser.add_subparsers(dest="command", required=True)
+
+    validate = subcomenzi.add_parser(
+        "validate", parents=[comune], help="valideaza un fisier"
+    )
+    validate.add_argument("kind", choices=("afd", "afn", "gramatica"))
+    validate.add_argument("file", type=Path)
+    validate.set_defaults(run=command_validate)
+
+    accept = subcomenzi.add_parser(
+        "accept", parents=[comune], help="verifica cuvinte cu un AFD/AFN"
+    )
+    accept.add_argument("kind", choices=("afd", "afn"))
+    accept.add_argument("automaton", type=Path)
+    accept.add_argument(
+        "words", nargs="?", help="fisier cu un cuvant pe linie (implicit stdin)"
+    )
+    accept.add_argument(
+        "--workers", type=int, default=1, help="procese (0 = cate unul per procesor)"
+    )
+    accept.add_argument(
+        "--batch-size", type=int, default=DIMENSIUNE_LOT, help="cuvinte per lot"
+    )
+    accept.set_defaults(run=command_accept)
+
+    determinize = subcomenzi.add_parser(
+        "determinize", parents=[comune], help="transforma un AFN in AFD"
+    )
+    determinize.add_argument("automaton", type=Path)
+    determinize.add_argument(
+        "--minimize", action="store_true", help="minimizeaza AFD-ul rezultat"
+    )
+    determinize.set_defaults(run=command_determinize)
+
+    generate = subcomenzi.add_parser(
+        "generate", parents=[comune], help="genereaza aleatoriu cuvinte distincte"
+    )
+    generate.add_argument("grammar", type=Path)
+    generate.add_argument("-n", type=int, required=True, help="numarul de cuvinte")
+    generate.add_argument("--seed", type=int, default=0)
+    generate.add_argument(
+        "--workers", type=int, default=1, help="procese (0 = cate unul per procesor)"
+    )
+    generate.add_argument(
+        "--max-len", type=int, help="lungimea maxima a cuvintelor generate"
+    )
+    generate.add_argument(
+        "--max-steps", type=int, help="numarul maxim de pasi de derivare per cuvant"
+    )
+    generate.set_defaults(run=command_generate)
+
+    enumerate_ = subcomenzi.add_parser(
+        "enumerate", parents=[comune], help="enumera cuvintele in ordinea lungimii"
+    )
+    enumerate_.add_argument("grammar", type=Path)
+    enumerate_.add_argument("-n", type=int, help="numarul maxim de cuvinte")
+    enumerate_.add_argument("--max-len", type=int, help="lungimea maxima a cuvintelor")
+    enumerate_.set_defaults(run=command_enumerate)
+
+    return parser
+
+
+def run_cli(argv: List[str]) -> int:
+    args = build_parser().parse_args(argv)
+    # --workers 0 inseamna cate un proces per procesor (vezi clasificare_paralela)
+    if getattr(args, "workers", None) == 0:
+        args.workers = None
+
+    try:
+        if args.output is None:
+            return args.run(args, sys.stdout)
+        with args.output.open("w", encoding="utf-8") as iesire:
+            return args.run(args, iesire)
+    except BrokenPipeError:
+        # Cititorul iesirii (de ex. head) s-a oprit: nu este o eroare. Redirectionam stdout
+        # spre devnull, ca Python sa nu mai raporteze pipe-ul inchis la iesire
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 0
+    except (OSError, ValueError) as e:
+        print(e, file=sys.stderr)
+        return 1
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if argv:
+        return run_cli(argv)
+
     run_exercise_1_solution()
     # run_exercise_2_solution()
+    # run_exercise_2_solution("cuvinte.txt")
+    # run_exercise_2_solution("cuvinte.txt", "verdicte.txt")
     # run_exercise_3_solution()
+    # run_with_stats(run_exercise_2_solution, "cuvinte.txt")
+    # run_with_stats(run_exercise_3_solution, profile=True)
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -1,9 +1,24 @@
-from typing import List
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, NamedTuple, Optional, Sequence
+from itertools import repeat
+from operator import add, mul
 from pathlib import Path
+import random
+
+from src import instrumentare
+from src.reguli import ListaReguli, pozitii_nule, valori_reguli
+
+if TYPE_CHECKING:
+    from src.numarare import EsantionatorUniform
 
 
 class Tranzitie:
     # Reprezintă o tranziție a automatului: δ(q, a) = q'
+    # Fără __dict__: tranzițiile din Reguli sunt vederi construite la cerere (vezi ListaReguli)
+    __slots__ = ("membrul_stang", "simbol", "membrul_drept")
+
+    # Numele câmpurilor, în ordinea coloanelor din ListaReguli
+    CAMPURI = __slots__
+
     def __init__(self, membrul_stang: str, simbol: str, membrul_drept: str) -> None:
         # starea din care plecăm (q)
         self.membrul_stang = membrul_stang
@@ -17,6 +32,153 @@ class Tranzitie:
         return f"δ({self.membrul_stang}, {self.simbol}) = {self.membrul_drept}"
 
 
+class Verdict(NamedTuple):
+    # Rezultatul verificării unui cuvânt: "acceptat" / "neacceptat" / "blocaj"
+    rezultat: str
+    # Poziția (indexul simbolului) la care s-a produs blocajul, None altfel
+    pozitie: Optional[int]
+
+
+def _raporteaza_verdict(
+    instr: instrumentare.Instrumentare, verdict: Verdict, tranzitii: int
+) -> None:
+    # Contoarele pentru un cuvânt verificat: tranzițiile efectuate, verdictul, poziția blocajului
+    instr.numara("afd.cuvinte")
+    instr.numara("afd.tranzitii", tranzitii)
+    instr.observa("afd.tranzitii_per_cuvant", tranzitii)
+    instr.numara(f"afd.{verdict.rezultat}")
+    if verdict.pozitie is not None:
+        instr.observa("afd.pozitie_blocaj", verdict.pozitie)
+
+
+class TabelTranzitii:
+    """
+    Forma compilată a lui δ pentru un AFD.
+
+    Stările și simbolurile sunt mapate la numere întregi (id-uri), iar δ devine
+    un tabel plat `tranzitii[q * nr_simboluri + a] = q'` (-1 dacă nu există tranziție).
+    Astfel, un pas al automatului costă o singură căutare, indiferent de |δ|.
+
+    Atribute:
+        stari        - id -> numele stării
+        stare_id     - numele stării -> id
+        simboluri    - id -> simbol
+        simbol_id    - simbol -> id
+        tranzitii    - tabelul plat al lui δ
+        finale       - finale[q] este True dacă q ∈ F
+        initiala     - id-ul stării inițiale
+    """
+
+    # Valoarea din tabel pentru o tranziție inexistentă (blocaj)
+    FARA_TRANZITIE = -1
+
+    def __init__(self, afd: "AFD") -> None:
+        self.stari: List[Optional[str]] = list()
+        self.stare_id: Dict[Optional[str], int] = dict()
+
+        def interneaza(stare: Optional[str]) -> int:
+            # Întoarce id-ul stării, creându-l la prima apariție
+            if stare not in self.stare_id:
+                self.stare_id[stare] = len(self.stari)
+                self.stari.append(stare)
+            return self.stare_id[stare]
+
+        # Stările din Q primesc primele id-uri, în ordinea din fișier
+        for stare in afd.Stari:
+            interneaza(stare)
+
+        # Simbolurile din Σ (un cuvânt cu simboluri din afara lui Σ nu este parcurs niciodată)
+        self.simboluri: List[str] = list()
+        self.simbol_id: Dict[str, int] = dict()
+        for simbol in afd.Sigma:
+            if simbol not in self.simbol_id:
+                self.simbol_id[simbol] = len(self.simboluri)
+                self.simboluri.append(simbol)
+        self.nr_simboluri = len(self.simboluri)
+
+        # Starea inițială (chiar și None, ca să păstrăm comportamentul de blocaj)
+        self.initiala = interneaza(afd.StareInitiala)
+
+        # Pentru o ListaReguli cu stări din Q și simboluri din Σ, tabelul vine direct din coloane
+        tranzitii = self._tranzitii_din_coloane(afd.Reguli)
+        if tranzitii is not None:
+            self.tranzitii: List[int] = tranzitii
+        else:
+            # Colectăm tranzițiile; stările care apar doar în reguli sunt și ele internate
+            perechi: Dict[int, int] = dict()
+            # (valorile câmpurilor, fără a construi câte un obiect Tranzitie per regulă)
+            for stanga, simbol, dreapta in valori_reguli(afd.Reguli, Tranzitie.CAMPURI):
+                a = self.simbol_id.get(simbol)
+                if a is None:
+                    continue
+                q = interneaza(stanga)
+                cheie = q * self.nr_simboluri + a
+                # Ca în parcurgerea inițială a lui Reguli, prima regulă găsită are prioritate
+                if cheie not in perechi:
+                    perechi[cheie] = interneaza(dreapta)
+
+            # Tabelul se construiește după ce știm numărul final de stări
+            self.tranzitii = [self.FARA_TRANZITIE] * (len(self.stari) * self.nr_simboluri)
+            for cheie, q_nou in perechi.items():
+                self.tranzitii[cheie] = q_nou
+
+        stari_finale = set(afd.StariFinale)
+        self.finale: List[bool] = [stare in stari_finale for stare in self.stari]
+
+    def _tranzitii_din_coloane(self, reguli: Iterable) -> Optional[List[int]]:
+        """
+        Tabelul plat al lui δ calculat direct pe coloanele de id-uri ale unei ListaReguli.
+        Întoarce None dacă regulile folosesc stări din afara lui Q sau simboluri din afara
+        lui Σ: atunci se folosește parcurgerea regulă cu regulă, care le tratează.
+        """
+        if not isinstance(reguli, ListaReguli) or not len(reguli):
+            return None
+        stangi, simboluri, drepte = reguli.coloane
+        # Id-ul de stare, respectiv de simbol, al fiecărui nume din Reguli (-1 dacă nu există)
+        stare_nume = [self.stare_id.get(nume, -1) for nume in reguli.nume]
+        simbol_nume = [self.simbol_id.get(nume, -1) for nume in reguli.nume]
+        q = list(map(stare_nume.__getitem__, stangi))
+        a = list(map(simbol_nume.__getitem__, simboluri))
+        q_nou = list(map(stare_nume.__getitem__, drepte))
+        if min(q) < 0 or min(a) < 0 or min(q_nou) < 0:
+            return None
+
+        tranzitii = [self.FARA_TRANZITIE] * (len(self.stari) * self.nr_simboluri)
+        chei = map(add, map(mul, q, repeat(self.nr_simboluri)), a)
+        # Scriem de la coadă spre cap: ca în parcurgerea lui Reguli, prima regulă are prioritate
+        for cheie, p in zip(list(chei)[::-1], reversed(q_nou)):
+            tranzitii[cheie] = p
+        return tranzitii
+
+    @classmethod
+    def din_componente(
+        cls,
+        stari: List[Optional[str]],
+        simboluri: List[str],
+        tranzitii: Sequence[int],
+        finale: List[bool],
+        initiala: int,
+    ) -> "TabelTranzitii":
+        """
+        Reconstruiește un tabel deja compilat (de ex. încărcat din cache), fără a parcurge Reguli.
+        `tranzitii` poate fi orice secvență de int-uri, inclusiv un memoryview peste un fișier mapat.
+        """
+        tabel = cls.__new__(cls)
+        tabel.stari = stari
+        tabel.stare_id = {stare: i for i, stare in enumerate(stari)}
+        tabel.simboluri = simboluri
+        tabel.simbol_id = {simbol: i for i, simbol in enumerate(simboluri)}
+        tabel.nr_simboluri = len(simboluri)
+        tabel.tranzitii = tranzitii  # type: ignore[assignment]
+        tabel.finale = finale
+        tabel.initiala = initiala
+        return tabel
+
+    def pas(self, q: int, a: int) -> int:
+        # δ(q, a) ca id, sau FARA_TRANZITIE
+        return self.tranzitii[q * self.nr_simboluri + a]
+
+
 class AFD:
     """
     Clasa care modelează un Automat Finit Determinist.
@@ -37,13 +199,46 @@ class AFD:
         self.Sigma: List[str] = list()
         # Delta nu este o valoare, ci o referință la clasa Tranzitie (pentru a crea obiecte)
         self.Delta = Tranzitie
-        # Lista de tranziții efective δ ⊆ Q × Σ × Q
-        self.Reguli: List[Tranzitie] = list()
+        # Lista de tranziții efective δ ⊆ Q × Σ × Q, păstrată compact (vezi ListaReguli)
+        self.Reguli: ListaReguli[Tranzitie] = ListaReguli(Tranzitie, Tranzitie.CAMPURI)
         # q0 - starea inițială (poate fi None până o citim din fișier)
         self.StareInitiala: str | None = None
         # F - mulțimea stărilor finale
         self.StariFinale: List[str] = list()
+        # Forma compilată a lui δ (vezi compilare), construită la nevoie
+        self._tabel: Optional[TabelTranzitii] = None
+        # Eșantionatorul uniform (vezi esantion), cu tabelele de numărare păstrate între apeluri
+        self._esantionator: Optional["EsantionatorUniform"] = None
 
+    @instrumentare.cronometrat("afd.compilare")
+    def compilare(self) -> TabelTranzitii:
+        """
+        Construiește (o singură dată) tabelul indexat de tranziții folosit la verificare.
+        Dacă definiția AFD-ului se modifică după compilare, apelați din nou compilare(),
+        sau reseteaza_compilarea() înainte de verificare.
+        """
+        self._tabel = TabelTranzitii(self)
+        return self._tabel
+
+    def reseteaza_compilarea(self) -> None:
+        # Invalidează tabelul compilat (de ex. după modificarea lui Reguli)
+        self._tabel = None
+
+    def tabel(self) -> TabelTranzitii:
+        # Întoarce tabelul compilat, compilând automatul dacă este nevoie
+        if self._tabel is None:
+            return self.compilare()
+        return self._tabel
+
+    def __getstate__(self) -> Dict:
+        # La trimiterea către alt proces (multiprocessing) nu copiem formele compilate:
+        # pot fi mari sau mapate dintr-un fișier cache, iar procesul le reconstruiește la nevoie
+        stare = self.__dict__.copy()
+        stare["_tabel"] = None
+        stare["_esantionator"] = None
+        return stare
+
+    @instrumentare.cronometrat("afd.citire")
     def citire(self, file_path: Path):
         """
         Citește definiția AFD-ului dintr-un fișier text.
@@ -55,41 +250,56 @@ class AFD:
         4: alfabetul (Σ)
         5+: câte o tranziție pe linie: <stare_stânga> <simbol> <stare_dreapta>
         """
+        # O nouă definiție invalidează orice tabel compilat anterior
+        self._tabel = None
+
+        # Citim tot fișierul deodată; liniile de tranziții sunt procesate într-o buclă strânsă
         with file_path.open("r", encoding="utf-8") as f:
-            for index, line in enumerate(f, start=1):
-                # Eliminăm spațiile de la început/sfârșit
-                line = line.strip()
+            lines = f.read().splitlines()
 
-                # Dacă avem o linie complet goală, o considerăm eroare de format
-                if not line:
-                    raise ValueError(
-                        f"[Eroare de format] Linia {index} este goala in fisierul: {file_path}"
-                    )
+        for index, line in enumerate(lines[:4], start=1):
+            # Eliminăm spațiile de la început/sfârșit
+            line = line.strip()
 
-                if index == 1:
-                    # Linia 1: stările, separate prin spații
-                    self.Stari = list(line.split())
+            # Dacă avem o linie complet goală, o considerăm eroare de format
+            if not line:
+                raise ValueError(
+                    f"[Eroare de format] Linia {index} este goala in fisierul: {file_path}"
+                )
 
-                elif index == 2:
-                    # Linia 2: starea inițială
-                    self.StareInitiala = line
+            if index == 1:
+                # Linia 1: stările, separate prin spații
+                self.Stari = list(line.split())
 
-                elif index == 3:
-                    # Linia 3: stările finale, separate prin spații
-                    self.StariFinale = list(line.split())
+            elif index == 2:
+                # Linia 2: starea inițială
+                self.StareInitiala = line
 
-                elif index == 4:
-                    # Linia 4: alfabetul, simboluri separate prin spații
-                    self.Sigma = list(line.split())
+            elif index == 3:
+                # Linia 3: stările finale, separate prin spații
+                self.StariFinale = list(line.split())
 
-                else:
-                    # Liniile 5+ conțin tranziții: q a q'
-                    [stanga, simbol, dreapta] = line.split()
-                    # Construim o tranziție folosind clasa Tranzitie
-                    tranzitie = self.Delta(stanga, simbol, dreapta)
-                    # Și o adăugăm în lista de reguli
-                    self.Reguli.append(tranzitie)
+            elif index == 4:
+                # Linia 4: alfabetul, simboluri separate prin spații
+                self.Sigma = list(line.split())
+
+        # Liniile 5+ conțin tranziții: q a q'.
+        # Sunt adăugate deodată ca id-uri în coloanele lui Reguli, fără obiecte Tranzitie.
+        if set(map(len, map(str.split, lines[4:]))) - {3}:
+            # Căutăm prima linie greșită doar dacă există una
+            for index, parts in enumerate(map(str.split, lines[4:]), start=5):
+                if not parts:
+                    raise ValueError(
+                        f"[Eroare de format] Linia {index} este goala in fisierul: {file_path}"
+                    )
+                if len(parts) != 3:
+                    raise ValueError(
+                        f"[Eroare de format] Linia {index} trebuie sa aiba 3 campuri: "
+                        f"<stanga> <simbol> <dreapta>. Gasit: {parts}"
+                    )
+        self.Reguli.adauga_randuri(" ".join(lines[4:]).split())
 
+    @instrumentare.cronometrat("afd.validare")
     def validare(self, should_print: bool = True) -> bool:
         """
         Validează AFD-ul citit, conform condițiilor:
@@ -98,6 +308,8 @@ class AFD:
             - fiecare tranziție are: starea din Q, simbol din Σ și stare rezultată din Q
             - starea inițială este în Q
             - F este inclus în Q
+            - δ nu conține tranziții repetate
+            - pentru fiecare pereche (q, a) există cel mult o tranziție (determinism)
         Returnează True dacă este valid, False în caz contrar.
         """
         este_valid: bool = True
@@ -125,36 +337,79 @@ class AFD:
             este_valid = False
             print_invalid_rule(f"(2) Alfabetul sigma nu are simboluri simple.")
 
-        # Validăm fiecare tranziție din δ
-        for index, tranzitie in enumerate(self.Reguli):
+        # Validăm δ direct pe coloanele de id-uri ale lui Reguli: apartenența la Q și la Σ este
+        # un tablou indexat după id-ul numelui, iar determinismul o mulțime de perechi (q, a)
+        reguli = self.Reguli
+        if not isinstance(reguli, ListaReguli):
+            reguli = ListaReguli(Tranzitie, Tranzitie.CAMPURI)
+            reguli.extend(self.Reguli)
+        stangi, simboluri, drepte = reguli.coloane
+        in_q = reguli.apartenenta(stari_set)
+        in_sigma = reguli.apartenenta(set(self.Sigma))
+        stanga_in_q = bytes(map(in_q.__getitem__, stangi))
+        simbol_in_sigma = bytes(map(in_sigma.__getitem__, simboluri))
+        dreapta_in_q = bytes(map(in_q.__getitem__, drepte))
+        # Perechea (q, a) codificată ca un singur int: id_q * |nume| + id_a
+        perechi = list(map(add, map(mul, stangi, repeat(len(reguli.nume))), simboluri))
+
+        # Tranzițiile cu probleme sunt căutate (și raportate, în ordine) doar dacă există
+        gresite = set(pozitii_nule(stanga_in_q, simbol_in_sigma, dreapta_in_q))
+        # Prima tranziție găsită pentru fiecare pereche (q, a) repetată
+        prima: Dict[int, int] = dict()
+        if len(set(perechi)) != len(perechi):
+            vazute: Dict[int, int] = dict()
+            for index, pereche in enumerate(perechi):
+                anterior = vazute.setdefault(pereche, index)
+                if anterior != index:
+                    prima[index] = anterior
+                    gresite.add(index)
+
+        nume = reguli.nume
+        for index in sorted(gresite):
             # Verificăm membrul stâng (starea de plecare)
-            if tranzitie.membrul_stang not in self.Stari:
+            if not stanga_in_q[index]:
                 este_valid = False
                 print_invalid_rule(
                     f"(3) In tranzitia {index} membrul stang nu este o stare in Q."
                 )
 
             # Verificăm simbolul
-            if tranzitie.simbol not in self.Sigma:
+            if not simbol_in_sigma[index]:
                 este_valid = False
                 print_invalid_rule(
                     f"(3) In tranzitia {index} simbolul nu se afla in alfabetul Sigma."
                 )
 
             # Verificăm membrul drept (starea de sosire)
-            if tranzitie.membrul_drept not in self.Stari:
+            if not dreapta_in_q[index]:
                 este_valid = False
                 print_invalid_rule(
                     f"(3) In tranzitia {index} membrul drept nu este o stare in Q."
                 )
 
+            # Verificăm că δ(q, a) este definită cel mult o dată (automat determinist)
+            if index in prima:
+                este_valid = False
+                q, a = nume[stangi[index]], nume[simboluri[index]]
+                if drepte[index] == drepte[prima[index]]:
+                    # Aceeași tranziție scrisă de două ori: duplicat, nu nedeterminism
+                    print_invalid_rule(
+                        f"(6) Tranzitia {index} δ({q}, {a}) = {nume[drepte[index]]} "
+                        f"repeta tranzitia {prima[index]}."
+                    )
+                else:
+                    print_invalid_rule(
+                        f"(6) In tranzitia {index} δ({q}, {a}) este deja definita "
+                        f"in tranzitia {prima[index]}: AFD-ul nu este determinist."
+                    )
+
         # Verificăm starea inițială
-        if self.StareInitiala not in self.Stari:
+        if self.StareInitiala not in stari_set:
             este_valid = False
             print_invalid_rule(f"(4) Starea initiala nu este din Q.")
 
         # Verificăm că F este inclus în Q
-        if not set(self.StariFinale).issubset(set(self.Stari)):
+        if not set(self.StariFinale).issubset(stari_set):
             este_valid = False
             print_invalid_rule(f"(5) Starile finale F nu sunt stari incluse in Q.")
 
@@ -187,58 +442,267 @@ class AFD:
         # Folosim comprehensiune ca să adăugăm un spațiu în față pentru format mai frumos
         print("\n".join({" " + str(r) for r in self.Reguli}))
 
-    def verificare(self, cuvant: str):
+    def in_text(self) -> str:
+        """
+        Definiția AFD-ului în formatul text citit de citire: Q, q0, F, Σ, apoi câte o tranziție
+        „q a q'” pe linie, în ordinea din Reguli.
+        """
+        linii = [
+            " ".join(self.Stari),
+            str(self.StareInitiala),
+            " ".join(self.StariFinale),
+            " ".join(self.Sigma),
+        ]
+        linii.extend(" ".join(valori) for valori in valori_reguli(self.Reguli, Tranzitie.CAMPURI))
+        return "\n".join(linii) + "\n"
+
+    def minimizeaza(self, should_print: bool = True) -> "AFD":
+        """
+        Întoarce AFD-ul minimal echivalent (algoritmul lui Hopcroft, vezi src/minimizare.py).
+        Dacă should_print este True, afișează numărul de stări înainte și după minimizare.
+        """
+        from src.minimizare import minimizare_hopcroft
+
+        return minimizare_hopcroft(self, should_print)
+
+    def intersectie(self, other: "AFD") -> "AFD":
+        """AFD-ul pentru L(self) ∩ L(other), doar cu perechile accesibile (vezi src/produs.py)."""
+        from src.produs import intersectie
+
+        return intersectie(self, other)
+
+    def reuniune(self, other: "AFD") -> "AFD":
+        """AFD-ul pentru L(self) ∪ L(other), doar cu perechile accesibile (vezi src/produs.py)."""
+        from src.produs import reuniune
+
+        return reuniune(self, other)
+
+    def diferenta(self, other: "AFD") -> "AFD":
+        """AFD-ul pentru L(self) \\ L(other), doar cu perechile accesibile (vezi src/produs.py)."""
+        from src.produs import diferenta
+
+        return diferenta(self, other)
+
+    def complement(self) -> "AFD":
+        """AFD-ul pentru Σ* \\ L(self) (vezi src/produs.py)."""
+        from src.produs import complement
+
+        return complement(self)
+
+    def echivalent(self, other: "AFD") -> Optional[str]:
+        """
+        Întoarce None dacă cele două AFD-uri acceptă același limbaj, altfel un cuvânt acceptat
+        de exact unul dintre ele (algoritmul Hopcroft–Karp, vezi src/produs.py).
+        """
+        from src.produs import echivalent
+
+        return echivalent(self, other)
+
+    def numara(self, n: int, modul: Optional[int] = None) -> int:
+        """
+        Numărul de cuvinte de lungime n acceptate (exact, sau modulo `modul`), vezi src/numarare.py.
+        """
+        from src.numarare import numara
+
+        return numara(self, n, modul)
+
+    def numara_pana_la(self, n: int, modul: Optional[int] = None) -> int:
+        """Numărul de cuvinte de lungime cel mult n acceptate, vezi src/numarare.py."""
+        from src.numarare import numara_pana_la
+
+        return numara_pana_la(self, n, modul)
+
+    def esantion(self, n: int, rng: Optional[random.Random] = None) -> str:
+        """
+        Un cuvânt de lungime n ales uniform aleator dintre cele acceptate (fără respingeri),
+        vezi EsantionatorUniform. Tabelele de numărare sunt refolosite între apeluri.
+        """
+        from src.numarare import EsantionatorUniform
+
+        if self._esantionator is None or self._esantionator.tabel is not self.tabel():
+            self._esantionator = EsantionatorUniform(self)
+        return self._esantionator.esantion(n, rng)
+
+    def stari_utile(self) -> List[bool]:
+        """
+        utile[q] este True dacă din starea q (id din tabelul compilat) se poate ajunge
+        într-o stare finală; celelalte stări nu mai pot duce la acceptare.
+        """
+        tabel = self.tabel()
+        nr_simboluri = tabel.nr_simboluri
+        predecesori: List[List[int]] = [list() for _ in tabel.stari]
+        for cheie, p in enumerate(tabel.tranzitii):
+            if p >= 0:
+                predecesori[p].append(cheie // nr_simboluri)
+
+        utile = list(tabel.finale)
+        de_procesat = [q for q, finala in enumerate(utile) if finala]
+        while de_procesat:
+            for q in predecesori[de_procesat.pop()]:
+                if not utile[q]:
+                    utile[q] = True
+                    de_procesat.append(q)
+        return utile
+
+    def enumerare(self, max_len: Optional[int] = None) -> Iterator[str]:
+        """
+        Generează leneș cuvintele acceptate, în ordinea crescătoare a lungimii (și în ordinea
+        simbolurilor din Σ pentru aceeași lungime), cel mult de lungime max_len dacă este dat.
+        Drumurile care intră în stări din care nu se mai poate accepta sunt tăiate.
+        """
+        tabel = self.tabel()
+        utile = self.stari_utile()
+        nr_simboluri = tabel.nr_simboluri
+
+        nivel = [(tabel.initiala, "")] if utile[tabel.initiala] else []
+        lungime = 0
+        while nivel and (max_len is None or lungime <= max_len):
+            urmatorul = list()
+            for q, cuvant in nivel:
+                if tabel.finale[q]:
+                    yield cuvant
+                baza = q * nr_simboluri
+                for a in range(nr_simboluri):
+                    p = tabel.tranzitii[baza + a]
+                    if p >= 0 and utile[p]:
+                        urmatorul.append((p, cuvant + tabel.simboluri[a]))
+            nivel = urmatorul
+            lungime += 1
+
+    def verificare(self, cuvant: str, should_print: bool = True) -> str:
         """
         Verifică dacă un cuvânt este:
             - "acceptat"    dacă se termină într-o stare finală
             - "neacceptat"  dacă se termină într-o stare care nu este finală
             - "blocaj"      dacă la un moment dat nu există tranziție definită
-        În plus, afișează toate etapele prin care trece cuvântul.
+        În plus, dacă should_print este True, afișează toate etapele prin care trece cuvântul.
         """
-        # Eliminăm spațiile din jurul cuvântului
-        cuvant = cuvant.strip()
+        return self._parcurgere(cuvant.strip(), should_print).rezultat
+
+    def verificare_lot(
+        self, cuvinte: Iterable[str], should_print: bool = False
+    ) -> Iterator[Verdict]:
+        """
+        Verifică, pe rând, fiecare cuvânt din `cuvinte` și întoarce (leneș) câte un Verdict:
+            - rezultat: "acceptat" / "neacceptat" / "blocaj" (aceeași semantică ca la verificare)
+            - pozitie:  indexul simbolului la care s-a produs blocajul (None altfel)
+
+        Implicit nu se afișează nimic; afișarea etapelor (ca la verificare) este opțională.
+        """
+        if should_print:
+            for cuvant in cuvinte:
+                yield self._parcurgere(cuvant.strip(), True)
+            return
+
+        # Variabile locale pentru bucla fierbinte
+        tabel = self.tabel()
+        tranzitii = tabel.tranzitii
+        nr_simboluri = tabel.nr_simboluri
+        simbol_id = tabel.simbol_id
+        finale = tabel.finale
+        initiala = tabel.initiala
+
+        # Verdictele fără poziție sunt mereu aceleași obiecte
+        acceptat = Verdict("acceptat", None)
+        neacceptat = Verdict("neacceptat", None)
+
+        # Instrumentarea este verificată o dată per cuvânt, nu per simbol
+        instr = instrumentare.curenta()
+
+        for cuvant in cuvinte:
+            cuvant = cuvant.strip()
+            stare_curenta = initiala
+            verdict = None
+            efectuate = len(cuvant)
+
+            for pozitie, simbol in enumerate(cuvant):
+                a = simbol_id.get(simbol)
+                # Simbol din afara alfabetului
+                if a is None:
+                    verdict = neacceptat
+                    efectuate = pozitie
+                    break
+                stare_curenta = tranzitii[stare_curenta * nr_simboluri + a]
+                if stare_curenta < 0:
+                    # Un simbol invalid mai încolo are prioritate față de blocaj (ca la verificare)
+                    if all(c in simbol_id for c in cuvant[pozitie + 1 :]):
+                        verdict = Verdict("blocaj", pozitie)
+                    else:
+                        verdict = neacceptat
+                    efectuate = pozitie
+                    break
+
+            if verdict is None:
+                verdict = acceptat if finale[stare_curenta] else neacceptat
+            if instr.activ:
+                _raporteaza_verdict(instr, verdict, efectuate)
+            yield verdict
+
+    def _parcurgere(self, cuvant: str, should_print: bool) -> Verdict:
+        # Parcurge cuvântul pas cu pas în tabelul compilat, afișând opțional etapele
+        tabel = self.tabel()
+        tranzitii = tabel.tranzitii
+        nr_simboluri = tabel.nr_simboluri
+        instr = instrumentare.curenta()
 
         # Mai întâi verificăm dacă toate simbolurile din cuvânt sunt în alfabet
         for c in cuvant:
-            if c not in self.Sigma:
+            if c not in tabel.simbol_id:
                 # Afișăm mesaj corespunzător pentru simbol invalid
-                print(
-                    f"simbol invalid '{c}' in cuvant. "
-                    f"Alfabetul este {{{', '.join(self.Sigma)}}}"
-                )
-                return "neacceptat"
+                if should_print:
+                    print(
+                        f"simbol invalid '{c}' in cuvant. "
+                        f"Alfabetul este {{{', '.join(self.Sigma)}}}"
+                    )
+                verdict = Verdict("neacceptat", None)
+                if instr.activ:
+                    _raporteaza_verdict(instr, verdict, 0)
+                return verdict
 
         # Pornim din starea inițială
-        print(f"Stare initiala: {self.StareInitiala}")
-        stare_curenta = self.StareInitiala
+        if should_print:
+            print(f"Stare initiala: {self.StareInitiala}")
+        stare_curenta = tabel.initiala
 
         # Parcurgem cuvântul simbol cu simbol
-        for simbol in cuvant:
-            print(simbol)  # Afișăm simbolul curent
-            exista_regula = False
-
-            # Căutăm o tranziție definită din starea curentă cu simbolul curent
-            for regula in self.Reguli:
-                if regula.membrul_stang == stare_curenta and regula.simbol == simbol:
-                    exista_regula = True
-                    # Afișăm tranziția efectuată
-                    print(f"{stare_curenta} --{simbol}--> {regula.membrul_drept}")
-                    # Trecem în noua stare
-                    stare_curenta = regula.membrul_drept
-                    break
+        for pozitie, simbol in enumerate(cuvant):
+            if should_print:
+                print(simbol)  # Afișăm simbolul curent
+
+            # Căutăm tranziția definită din starea curentă cu simbolul curent (un singur acces)
+            stare_noua = tranzitii[stare_curenta * nr_simboluri + tabel.simbol_id[simbol]]
 
-            # Dacă nu s-a găsit nicio tranziție, automatul se blochează
-            if not exista_regula:
+            # Dacă nu există tranziție, automatul se blochează
+            if stare_noua == TabelTranzitii.FARA_TRANZITIE:
+                if should_print:
+                    print(
+                        f"Blocaj: nu exista tranzitie din {tabel.stari[stare_curenta]} cu simbol {simbol}"
+                    )
+                verdict = Verdict("blocaj", pozitie)
+                if instr.activ:
+                    _raporteaza_verdict(instr, verdict, pozitie)
+                return verdict
+
+            # Afișăm tranziția efectuată și trecem în noua stare
+            if should_print:
                 print(
-                    f"Blocaj: nu exista tranzitie din {stare_curenta} cu simbol {simbol}"
+                    f"{tabel.stari[stare_curenta]} --{simbol}--> {tabel.stari[stare_noua]}"
                 )
-                return "blocaj"
+            stare_curenta = stare_noua
 
         # După ce am citit tot cuvântul, verificăm în ce stare am ajuns
-        print(f"Stare finala dupa citirea intregului cuvant: {stare_curenta}")
-        if stare_curenta in self.StariFinale:
-            print("Cuvant acceptat")
-            return "acceptat"
+        if should_print:
+            print(
+                f"Stare finala dupa citirea intregului cuvant: {tabel.stari[stare_curenta]}"
+            )
+        if tabel.finale[stare_curenta]:
+            if should_print:
+                print("Cuvant acceptat")
+            verdict = Verdict("acceptat", None)
         else:
-            print("Cuvant neacceptat")
-            return "neacceptat"
+            if should_print:
+                print("Cuvant neacceptat")
+            verdict = Verdict("neacceptat", None)
+        if instr.activ:
+            _raporteaza_verdict(instr, verdict, len(cuvant))
+        return verdict
@@ -0,0 +1,137 @@
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from src.afd import AFD, Verdict
+
+# Codurile rezultatelor din tablourile NumPy
+ACCEPTAT = 0
+NEACCEPTAT = 1
+BLOCAJ = 2
+
+REZULTATE = ("acceptat", "neacceptat", "blocaj")
+
+
+class MotorVectorizat:
+    """
+    Execută un AFD pe loturi mari de cuvinte folosind NumPy.
+
+    Cuvintele de aceeași lungime sunt codificate într-o matrice de simboluri
+    (un rând per cuvânt, o coloană per poziție), iar starea tuturor cuvintelor
+    avansează coloană cu coloană printr-o matrice densă de tranziții (|Q| + 1, |Σ| + 1):
+        - ultima stare („moartă”) reprezintă blocajul;
+        - ultima coloană reprezintă un simbol din afara alfabetului.
+
+    Semantica este aceeași cu AFD.verificare / AFD.verificare_lot.
+    """
+
+    def __init__(self, afd: AFD) -> None:
+        tabel = afd.tabel()
+        nr_stari = len(tabel.stari)
+        nr_simboluri = tabel.nr_simboluri
+
+        # Starea moartă și simbolul invalid sunt ultimele id-uri
+        self.stare_moarta = nr_stari
+        self.simbol_invalid = nr_simboluri
+        self.initiala = tabel.initiala
+
+        # Matricea densă de tranziții; orice tranziție lipsă duce în starea moartă
+        delta = np.array(tabel.tranzitii, dtype=np.int64).reshape(
+            nr_stari, nr_simboluri
+        )
+        delta = np.where(delta < 0, self.stare_moarta, delta)
+        self.tranzitii = np.full(
+            (nr_stari + 1, nr_simboluri + 1), self.stare_moarta, dtype=np.int32
+        )
+        self.tranzitii[:nr_stari, :nr_simboluri] = delta
+
+        self.finale = np.zeros(nr_stari + 1, dtype=bool)
+        self.finale[:nr_stari] = tabel.finale
+
+        # Codurile Unicode ale simbolurilor, sortate, pentru codificarea prin searchsorted
+        simboluri = [(ord(s), i) for s, i in tabel.simbol_id.items() if len(s) == 1]
+        simboluri.sort()
+        self._coduri = np.array([c for c, _ in simboluri], dtype=np.uint32)
+        self._id_uri = np.array([i for _, i in simboluri], dtype=np.int64)
+
+        # uint8 ajunge pentru alfabete mici, altfel uint16
+        self.dtype_simboluri = np.uint8 if nr_simboluri + 1 <= 0xFF else np.uint16
+
+    def codificare(self, cuvinte: Sequence[str]) -> np.ndarray:
+        """
+        Transformă o listă de cuvinte de aceeași lungime într-o matrice (n, L) de id-uri
+        de simboluri. Simbolurile din afara alfabetului primesc id-ul `simbol_invalid`.
+        """
+        if not cuvinte:
+            return np.zeros((0, 0), dtype=self.dtype_simboluri)
+
+        lungime = len(cuvinte[0])
+        if any(len(cuvant) != lungime for cuvant in cuvinte):
+            raise ValueError(
+                "[Eroare] Toate cuvintele dintr-o matrice trebuie sa aiba aceeasi lungime."
+            )
+
+        # UTF-32 are lungime fixă: un punct de cod per simbol
+        text = "".join(cuvinte).encode("utf-32-le")
+        puncte = np.frombuffer(text, dtype=np.uint32).reshape(len(cuvinte), lungime)
+
+        if len(self._coduri) == 0:
+            return np.full(puncte.shape, self.simbol_invalid, dtype=self.dtype_simboluri)
+
+        pozitii = np.searchsorted(self._coduri, puncte)
+        pozitii_sigure = np.minimum(pozitii, len(self._coduri) - 1)
+        gasit = self._coduri[pozitii_sigure] == puncte
+        id_uri = np.where(gasit, self._id_uri[pozitii_sigure], self.simbol_invalid)
+        return id_uri.astype(self.dtype_simboluri)
+
+    def executare(self, simboluri: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Rulează automatul pe o matrice (n, L) de id-uri de simboluri.
+        Întoarce (rezultate, pozitii):
+            - rezultate[i] este ACCEPTAT / NEACCEPTAT / BLOCAJ
+            - pozitii[i] este coloana la care s-a produs blocajul (-1 altfel)
+        """
+        nr_cuvinte, lungime = simboluri.shape
+        stari = np.full(nr_cuvinte, self.initiala, dtype=np.int32)
+        pozitii = np.full(nr_cuvinte, -1, dtype=np.int64)
+
+        for coloana in range(lungime):
+            stari = self.tranzitii[stari, simboluri[:, coloana]]
+            # Cuvintele care tocmai au intrat în starea moartă își memorează poziția
+            blocate_acum = (stari == self.stare_moarta) & (pozitii < 0)
+            pozitii[blocate_acum] = coloana
+
+        rezultate = np.where(self.finale[stari], ACCEPTAT, NEACCEPTAT).astype(np.int8)
+        rezultate[pozitii >= 0] = BLOCAJ
+
+        # Un simbol invalid oriunde în cuvânt înseamnă "neacceptat" (ca la verificare)
+        if lungime:
+            invalide = (simboluri == self.simbol_invalid).any(axis=1)
+            rezultate[invalide] = NEACCEPTAT
+            pozitii[invalide] = -1
+
+        return rezultate, pozitii
+
+    def verificare_lot(self, cuvinte: Sequence[str]) -> List[Verdict]:
+        """
+        Verifică un lot de cuvinte de lungimi arbitrare: cuvintele sunt grupate după
+        lungime, fiecare grup este executat vectorizat, iar verdictele sunt întoarse
+        în ordinea inițială.
+        """
+        cuvinte = [cuvant.strip() for cuvant in cuvinte]
+
+        # Grupăm indicii cuvintelor după lungime
+        grupuri: Dict[int, List[int]] = dict()
+        for index, cuvant in enumerate(cuvinte):
+            grupuri.setdefault(len(cuvant), list()).append(index)
+
+        verdicte: List[Verdict] = [Verdict("neacceptat", None)] * len(cuvinte)
+        for indici in grupuri.values():
+            matrice = self.codificare([cuvinte[i] for i in indici])
+            rezultate, pozitii = self.executare(matrice)
+            for i, rezultat, pozitie in zip(indici, rezultate.tolist(), pozitii.tolist()):
+                verdicte[i] = Verdict(
+                    REZULTATE[rezultat], pozitie if rezultat == BLOCAJ else None
+                )
+
+        return verdicte
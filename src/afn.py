@@ -1,6 +1,10 @@
+from collections import defaultdict, deque
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Dict, Tuple, Set, Optional
+from typing import DefaultDict, List, Dict, Tuple, Set, Optional, Iterable, Iterator
+
+from src import instrumentare
+from src.reguli import ListaReguli, pozitii_nule
 
 Stare = str
 Simbol = str
@@ -13,6 +17,12 @@ class Tranzitie:
     (Atenție: În AFN, funcția δ(q, a) produce o mulțime de stări,
      dar o regulă individuală tot e "q, a -> p".)
     """
+    # Fără __dict__: regulile din AFN.Reguli sunt vederi construite la cerere (vezi ListaReguli)
+    __slots__ = ("membrul_stang", "simbol", "membrul_drept")
+
+    # Numele câmpurilor, în ordinea coloanelor din ListaReguli
+    CAMPURI = __slots__
+
     membrul_stang: Stare
     simbol: Simbol
     membrul_drept: Stare
@@ -21,17 +31,168 @@ class Tranzitie:
         return f"δ({self.membrul_stang}, {self.simbol}) = {self.membrul_drept}"
 
 
+class TabelBitset:
+    """
+    Forma compilată a unui AFN pentru simulare fără determinizare.
+
+    Fiecare stare primește un id (bitul ei), iar o mulțime de stări este un int folosit ca
+    mască de biți. Pentru fiecare simbol a și stare q se precalculează masca λ-închiderii
+    lui δ(q, a), deci un pas (mulțime, a) -> mulțime este doar un SAU între măștile
+    stărilor active. λ-închiderile se calculează o singură dată, pe componente tare conexe.
+    """
+
+    def __init__(self, afn: "AFN") -> None:
+        # id-urile stărilor, în ordinea din Q (plus eventualele stări care apar doar în δ)
+        self.stari: List[Stare] = list()
+        self.stare_id: Dict[Stare, int] = dict()
+        for q in afn.Stari:
+            self._interneaza(q)
+        for (q, _), destinatii in afn.Delta.items():
+            self._interneaza(q)
+            for p in destinatii:
+                self._interneaza(p)
+        if afn.StareInitiala is not None:
+            self._interneaza(afn.StareInitiala)
+
+        self.simbol_id: Dict[Simbol, int] = {
+            a: i for i, a in enumerate(dict.fromkeys(afn.Sigma)) if a != AFN.SIMBOL_VID
+        }
+
+        # inchideri[q] = masca λ-închiderii stării q (q inclusă)
+        self.inchideri: List[int] = self._inchideri_lambda(afn)
+
+        # succesori[a][q] = masca λ-închiderii lui δ(q, a)
+        self.succesori: List[List[int]] = [
+            [0] * len(self.stari) for _ in range(len(self.simbol_id))
+        ]
+        for (q, a), destinatii in afn.Delta.items():
+            if a not in self.simbol_id:
+                continue
+            masca = 0
+            for p in destinatii:
+                masca |= self.inchideri[self.stare_id[p]]
+            self.succesori[self.simbol_id[a]][self.stare_id[q]] |= masca
+
+        self.initiala: int = 0
+        if afn.StareInitiala is not None:
+            self.initiala = self.inchideri[self.stare_id[afn.StareInitiala]]
+
+        self.finale: int = 0
+        for q in afn.StariFinale:
+            if q in self.stare_id:
+                self.finale |= 1 << self.stare_id[q]
+
+    def _inchideri_lambda(self, afn: "AFN") -> List[int]:
+        """
+        Calculează λ-închiderea fiecărei stări. Graful λ-tranzițiilor este descompus în
+        componente tare conexe (Tarjan, iterativ); componentele ies în ordine topologică
+        inversă, deci închiderea unei componente este reuniunea stărilor ei cu închiderile
+        componentelor deja calculate spre care are λ-tranziții.
+        """
+        n = len(self.stari)
+        vecini: List[List[int]] = [list() for _ in range(n)]
+        for (q, a), destinatii in afn.Delta.items():
+            if a == AFN.SIMBOL_VID:
+                vecini[self.stare_id[q]].extend(self.stare_id[p] for p in destinatii)
+
+        inchideri = [0] * n
+        # Fără λ-tranziții, fiecare stare este propria închidere
+        if not any(vecini):
+            return [1 << q for q in range(n)]
+
+        index = [-1] * n
+        minim = [0] * n
+        pe_stiva = [False] * n
+        stiva: List[int] = list()
+        contor = 0
+
+        for radacina in range(n):
+            if index[radacina] != -1:
+                continue
+            # Stiva de apeluri: (stare, poziția următorului vecin de vizitat)
+            apeluri = [(radacina, 0)]
+            index[radacina] = minim[radacina] = contor
+            contor += 1
+            stiva.append(radacina)
+            pe_stiva[radacina] = True
+
+            while apeluri:
+                q, i = apeluri[-1]
+                if i < len(vecini[q]):
+                    apeluri[-1] = (q, i + 1)
+                    p = vecini[q][i]
+                    if index[p] == -1:
+                        index[p] = minim[p] = contor
+                        contor += 1
+                        stiva.append(p)
+                        pe_stiva[p] = True
+                        apeluri.append((p, 0))
+                    elif pe_stiva[p]:
+                        minim[q] = min(minim[q], index[p])
+                    continue
+
+                apeluri.pop()
+                if apeluri:
+                    parinte = apeluri[-1][0]
+                    minim[parinte] = min(minim[parinte], minim[q])
+
+                if minim[q] == index[q]:
+                    # q este rădăcina unei componente: o scoatem de pe stivă
+                    componenta: List[int] = list()
+                    while True:
+                        p = stiva.pop()
+                        pe_stiva[p] = False
+                        componenta.append(p)
+                        if p == q:
+                            break
+
+                    masca = 0
+                    for p in componenta:
+                        masca |= 1 << p
+                    for p in componenta:
+                        for r in vecini[p]:
+                            # Componentele succesoare sunt deja închise (ordine topologică inversă)
+                            if not pe_stiva[r]:
+                                masca |= inchideri[r]
+                    for p in componenta:
+                        inchideri[p] = masca
+
+        return inchideri
+
+    def _interneaza(self, q: Stare) -> int:
+        if q not in self.stare_id:
+            self.stare_id[q] = len(self.stari)
+            self.stari.append(q)
+        return self.stare_id[q]
+
+    def pas(self, masca: int, a: int) -> int:
+        # Mulțimea stărilor în care se ajunge din `masca` cu simbolul cu id-ul a
+        succesori = self.succesori[a]
+        rezultat = 0
+        while masca:
+            bit = masca & -masca
+            rezultat |= succesori[bit.bit_length() - 1]
+            masca ^= bit
+        return rezultat
+
+    def multime(self, masca: int) -> Set[Stare]:
+        # Transformă o mască înapoi într-o mulțime de nume de stări
+        return {self.stari[i] for i in range(masca.bit_length()) if masca >> i & 1}
+
+
 class AFN:
     """
     AFN definit ca:
         M = (Q, Σ, δ, q0, F)
     - Q: stări (lista, păstrăm ordinea din fișier)
     - Σ: alfabet (lista)
-    - δ: dict care mapează (q, a) -> set(stări)
+    - δ: dict care mapează (q, a) -> set(stări), unde a poate fi și SIMBOL_VID (λ-tranziție)
     - q0: stare inițială
     - F: stări finale
     """
 
+    SIMBOL_VID = "*"  # pentru λ-tranziții (la fel ca in Gramatica)
+
     def __init__(self) -> None:
         self.Stari: List[Stare] = []
         self.Sigma: List[Simbol] = []
@@ -40,25 +201,66 @@ class AFN:
         # deci (q, a) -> {p1, p2, ...}
         self.Delta: Dict[Tuple[Stare, Simbol], Set[Stare]] = {}
 
-        # Opțional: păstrăm și regulile individuale pentru afișare / validare ușoară
-        self.Reguli: List[Tranzitie] = []
+        # Opțional: păstrăm și regulile individuale pentru afișare / validare ușoară,
+        # compact, ca id-uri (vezi ListaReguli)
+        self.Reguli: ListaReguli[Tranzitie] = ListaReguli(Tranzitie, Tranzitie.CAMPURI)
 
         self.StareInitiala: Optional[Stare] = None
         self.StariFinale: List[Stare] = []
 
+        # Forma compilată pentru simulare (vezi compilare), construită la nevoie
+        self._tabel: Optional[TabelBitset] = None
+
+    @instrumentare.cronometrat("afn.compilare")
+    def compilare(self) -> TabelBitset:
+        """
+        Construiește tabelul de măști de succesori folosit de accepta / accepta_lot.
+        Tabelul este invalidat automat la adăugarea unei tranziții.
+        """
+        self._tabel = TabelBitset(self)
+        return self._tabel
+
+    def tabel(self) -> TabelBitset:
+        # Întoarce tabelul compilat, compilând automatul dacă este nevoie
+        if self._tabel is None:
+            return self.compilare()
+        return self._tabel
+
+    def __getstate__(self) -> Dict:
+        # La trimiterea către alt proces (multiprocessing) tabelul compilat nu este copiat,
+        # procesul îl reconstruiește la nevoie
+        stare = self.__dict__.copy()
+        stare["_tabel"] = None
+        return stare
+
     def adauga_tranzitie(self, q: Stare, a: Simbol, p: Stare) -> None:
         # Validări de bază (pe baza listelor citite)
         if q not in self.Stari or p not in self.Stari:
             raise ValueError("Starile trebuie sa existe in Q pentru a adauga o tranzitie.")
-        if a not in self.Sigma:
+        if a not in self.Sigma and a != self.SIMBOL_VID:
             raise ValueError("Simbolul trebuie sa fie in alfabetul Sigma pentru a adauga o tranzitie.")
 
-        t = Tranzitie(q, a, p)
-        self.Reguli.append(t)
+        self.Reguli.adauga(q, a, p)
+        self._tabel = None
 
         # Actualizăm δ(q, a) (mulțime de stări)
         self.Delta.setdefault((q, a), set()).add(p)
 
+    def _adauga_in_delta(self, inceput: int = 0) -> None:
+        """
+        Actualizează δ(q, a) (mulțime de stări) cu regulile din Reguli începând de la indexul dat,
+        fără buclă Python per regulă: mulțimile noi sunt create de defaultdict. Numele vin din
+        tabelul lui Reguli, deci aparițiile aceluiași nume folosesc același obiect str.
+        """
+        nume = self.Reguli.nume.__getitem__
+        stangi, simboluri, drepte = (coloana[inceput:] for coloana in self.Reguli.coloane)
+        delta: DefaultDict[Tuple[Stare, Simbol], Set[Stare]] = defaultdict(set, self.Delta)
+        chei = zip(map(nume, stangi), map(nume, simboluri))
+        deque(map(set.add, map(delta.__getitem__, chei), map(nume, drepte)), maxlen=0)
+        self.Delta = dict(delta)
+        self._tabel = None
+
+    @instrumentare.cronometrat("afn.citire")
     def citire(self, file_path: Path) -> None:
         """
         Format fișier (din ce ai scris tu):
@@ -66,47 +268,73 @@ class AFN:
         2) linia 2: starea inițială
         3) linia 3: stările finale
         4) linia 4: alfabetul
-        5+) tranziții: <stanga> <simbol> <dreapta>
+        5+) tranziții: <stanga> <simbol> <dreapta>, unde <simbol> poate fi SIMBOL_VID (λ)
         """
+        # Citim tot fișierul deodată; liniile de tranziții sunt procesate într-o buclă strânsă
         with file_path.open("r", encoding="utf-8") as f:
-            for index, raw_line in enumerate(f, start=1):
-                line = raw_line.strip()
+            lines = f.read().splitlines()
 
-                # Dacă vrei STRICT fără linii goale, păstrează raise.
-                # Dacă accepți linii goale, înlocuiește cu `continue`.
-                if not line:
-                    raise ValueError(
-                        f"[Eroare de format] Linia {index} este goala in fisierul: {file_path}"
-                    )
+        for index, raw_line in enumerate(lines[:4], start=1):
+            line = raw_line.strip()
 
-                if index == 1:
-                    self.Stari = line.split()
+            # Dacă vrei STRICT fără linii goale, păstrează raise.
+            # Dacă accepți linii goale, înlocuiește cu `continue`.
+            if not line:
+                raise ValueError(
+                    f"[Eroare de format] Linia {index} este goala in fisierul: {file_path}"
+                )
 
-                elif index == 2:
-                    self.StareInitiala = line
+            if index == 1:
+                self.Stari = line.split()
 
-                elif index == 3:
-                    self.StariFinale = line.split()
+            elif index == 2:
+                self.StareInitiala = line
 
-                elif index == 4:
-                    self.Sigma = line.split()
+            elif index == 3:
+                self.StariFinale = line.split()
 
-                else:
-                    parts = line.split()
-                    if len(parts) != 3:
-                        raise ValueError(
-                            f"[Eroare de format] Linia {index} trebuie sa aiba 3 campuri: "
-                            f"<stanga> <simbol> <dreapta>. Gasit: {parts}"
-                        )
-                    stanga, simbol, dreapta = parts
-                    self.adauga_tranzitie(stanga, simbol, dreapta)
+            elif index == 4:
+                self.Sigma = line.split()
 
+        # Liniile 5+ sunt adăugate deodată ca id-uri în coloanele lui Reguli (ca la AFD.citire)
+        if set(map(len, map(str.split, lines[4:]))) - {3}:
+            # Căutăm prima linie greșită doar dacă există una
+            for index, parts in enumerate(map(str.split, lines[4:]), start=5):
+                if not parts:
+                    raise ValueError(
+                        f"[Eroare de format] Linia {index} este goala in fisierul: {file_path}"
+                    )
+                if len(parts) != 3:
+                    raise ValueError(
+                        f"[Eroare de format] Linia {index} trebuie sa aiba 3 campuri: "
+                        f"<stanga> <simbol> <dreapta>. Gasit: {parts}"
+                    )
+        reguli = self.Reguli
+        inceput = len(reguli)
+        reguli.adauga_randuri(" ".join(lines[4:]).split())
+        stangi, simboluri, drepte = (coloana[inceput:] for coloana in reguli.coloane)
+
+        # Aceleași validări ca în adauga_tranzitie, dar pe coloanele de id-uri (prima linie greșită)
+        in_q = reguli.apartenenta(set(self.Stari))
+        in_sigma = reguli.apartenenta(set(self.Sigma) | {self.SIMBOL_VID})
+        stari_gresite = pozitii_nule(
+            bytes(map(in_q.__getitem__, stangi)), bytes(map(in_q.__getitem__, drepte))
+        )
+        simboluri_gresite = pozitii_nule(bytes(map(in_sigma.__getitem__, simboluri)))
+        if stari_gresite and (not simboluri_gresite or stari_gresite[0] <= simboluri_gresite[0]):
+            raise ValueError("Starile trebuie sa existe in Q pentru a adauga o tranzitie.")
+        if simboluri_gresite:
+            raise ValueError("Simbolul trebuie sa fie in alfabetul Sigma pentru a adauga o tranzitie.")
+
+        self._adauga_in_delta(inceput)
+
+    @instrumentare.cronometrat("afn.validare")
     def validare(self, should_print: bool = True) -> bool:
         """
         Verifică:
         (1) Q: stări distincte
         (2) Σ: simboluri distincte (+ simbol simplu dacă asta cere cursul)
-        (3) Tranzițiile folosesc doar elemente din Q și Σ
+        (3) Tranzițiile folosesc doar elemente din Q și Σ (sau SIMBOL_VID pentru λ)
         (4) q0 ∈ Q
         (5) F ⊆ Q
         """
@@ -131,25 +359,38 @@ class AFN:
             este_valid = False
             print_invalid_rule("(2) Alfabetul Sigma nu are simboluri simple (un singur caracter).")
 
-        # (3) Validăm regulile
-        for idx, t in enumerate(self.Reguli, start=1):
-            if t.membrul_stang not in self.Stari:
+        # (3) Validăm regulile direct pe coloanele de id-uri (apartenența este un tablou indexat
+        # după id-ul numelui); regulile greșite sunt parcurse doar dacă există
+        stari_set = set(self.Stari)
+        reguli = self.Reguli
+        if not isinstance(reguli, ListaReguli):
+            reguli = ListaReguli(Tranzitie, Tranzitie.CAMPURI)
+            reguli.extend(self.Reguli)
+        stangi, simboluri, drepte = reguli.coloane
+        in_q = reguli.apartenenta(stari_set)
+        in_sigma = reguli.apartenenta(set(self.Sigma) | {self.SIMBOL_VID})
+        stanga_in_q = bytes(map(in_q.__getitem__, stangi))
+        simbol_in_sigma = bytes(map(in_sigma.__getitem__, simboluri))
+        dreapta_in_q = bytes(map(in_q.__getitem__, drepte))
+        for index in pozitii_nule(stanga_in_q, simbol_in_sigma, dreapta_in_q):
+            idx = index + 1
+            if not stanga_in_q[index]:
                 este_valid = False
                 print_invalid_rule(f"(3) In tranzitia {idx} membrul stang nu este o stare in Q.")
-            if t.simbol not in self.Sigma:
+            if not simbol_in_sigma[index]:
                 este_valid = False
                 print_invalid_rule(f"(3) In tranzitia {idx} simbolul nu se afla in alfabetul Sigma.")
-            if t.membrul_drept not in self.Stari:
+            if not dreapta_in_q[index]:
                 este_valid = False
                 print_invalid_rule(f"(3) In tranzitia {idx} membrul drept nu este o stare in Q.")
 
         # (4) q0
-        if self.StareInitiala is None or self.StareInitiala not in self.Stari:
+        if self.StareInitiala is None or self.StareInitiala not in stari_set:
             este_valid = False
             print_invalid_rule("(4) Starea initiala nu este din Q.")
 
         # (5) F ⊆ Q
-        if not set(self.StariFinale).issubset(set(self.Stari)):
+        if not set(self.StariFinale).issubset(stari_set):
             este_valid = False
             print_invalid_rule("(5) Starile finale F nu sunt stari incluse in Q.")
 
@@ -172,3 +413,55 @@ class AFN:
         print("\n".join([" " + str(r) for r in self.Reguli]))
         
     
+
+    def accepta(self, cuvant: str) -> bool:
+        """
+        Verifică dacă AFN-ul acceptă cuvântul, simulând direct mulțimea stărilor curente
+        (fără a construi AFD-ul echivalent). Un simbol din afara lui Σ respinge cuvântul.
+        """
+        return next(self.accepta_lot([cuvant]))
+
+    def accepta_lot(self, cuvinte: Iterable[str]) -> Iterator[bool]:
+        """Ca accepta, dar pentru mai multe cuvinte; întoarce (leneș) câte un bool per cuvânt."""
+        tabel = self.tabel()
+        simbol_id = tabel.simbol_id
+        succesori = tabel.succesori
+        initiala = tabel.initiala
+        finale = tabel.finale
+        # Instrumentarea este verificată o dată per cuvânt, nu per simbol
+        instr = instrumentare.curenta()
+
+        for cuvant in cuvinte:
+            masca = initiala
+            cuvant = cuvant.strip()
+            pasi = len(cuvant)
+            for pozitie, simbol in enumerate(cuvant):
+                a = simbol_id.get(simbol)
+                if a is None:
+                    masca = 0
+                    pasi = pozitie
+                    break
+
+                # Un pas: SAU între măștile de succesori ale stărilor active
+                succesori_a = succesori[a]
+                urmatoarea = 0
+                while masca:
+                    bit = masca & -masca
+                    urmatoarea |= succesori_a[bit.bit_length() - 1]
+                    masca ^= bit
+                masca = urmatoarea
+
+                # Nicio stare activă: cuvântul nu mai poate fi acceptat
+                if not masca:
+                    pasi = pozitie + 1
+                    break
+
+            acceptat = bool(masca & finale)
+            if instr.activ:
+                instr.numara("afn.cuvinte")
+                instr.numara("afn.pasi", pasi)
+                instr.numara("afn.acceptate" if acceptat else "afn.respinse")
+                if not masca and pasi < len(cuvant):
+                    # Respins înainte de finalul cuvântului (simbol invalid sau nicio stare activă)
+                    instr.observa("afn.pozitie_respingere", pasi)
+            yield acceptat
@@ -0,0 +1,303 @@
+import hashlib
+import json
+import mmap
+import struct
+import sys
+from array import array
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Sequence, Tuple, TypeVar
+
+from src.afd import AFD, TabelTranzitii
+from src.afn import AFN, Tranzitie as TranzitieAFN
+from src.gramatica import Gramatica, Productie
+from src.path import PathMaker
+from src.reguli import ListaReguli
+from src.transformare import Transformator
+
+# Antetul fisierului: semnatura, versiunea formatului si lungimea antetului JSON
+SEMNATURA = b"LFCA"
+VERSIUNE = 2
+ANTET = struct.Struct("<4sII")
+
+# Tablourile sunt aliniate la 8 octeti in fisier
+ALINIERE = 8
+
+T = TypeVar("T")
+
+
+def _scriere(file_path: Path, antet: Dict, tablouri: Dict[str, array]) -> None:
+    """
+    Scrie un fisier binar: antetul fix, apoi antetul JSON (tabelele de nume, pozitiile tablourilor),
+    apoi tablourile de int-uri, fiecare aliniat, in ordinea octetilor a masinii curente.
+    """
+    # Pozitiile tablourilor sunt relative la inceputul zonei de date
+    pozitie = 0
+    sectiuni: Dict[str, List] = dict()
+    for nume, tablou in tablouri.items():
+        sectiuni[nume] = [pozitie, len(tablou), tablou.typecode]
+        pozitie += len(tablou) * tablou.itemsize
+        pozitie += -pozitie % ALINIERE
+
+    antet = dict(antet, sectiuni=sectiuni, ordine_octeti=sys.byteorder)
+    text = json.dumps(antet, ensure_ascii=False).encode("utf-8")
+    text += b" " * (-(ANTET.size + len(text)) % ALINIERE)
+
+    # Scriem intr-un fisier temporar si il redenumim, ca un cititor sa nu vada un fisier partial
+    temporar = file_path.with_suffix(".tmp")
+    with temporar.open("wb") as f:
+        f.write(ANTET.pack(SEMNATURA, VERSIUNE, len(text)))
+        f.write(text)
+        for tablou in tablouri.values():
+            date = tablou.tobytes()
+            f.write(date)
+            f.write(b"\0" * (-len(date) % ALINIERE))
+    temporar.replace(file_path)
+
+
+def _citire(file_path: Path) -> Tuple[Dict, Dict[str, memoryview]]:
+    """
+    Mapeaza fisierul in memorie si intoarce antetul JSON si tablourile ca memoryview-uri
+    peste fisier (fara copiere). Ridica ValueError daca fisierul nu are formatul asteptat.
+    """
+    with file_path.open("rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    semnatura, versiune, lungime = ANTET.unpack_from(mm, 0)
+    if semnatura != SEMNATURA or versiune != VERSIUNE:
+        raise ValueError(f"[Eroare] Fisier cache invalid: {file_path}")
+    antet = json.loads(bytes(mm[ANTET.size : ANTET.size + lungime]).decode("utf-8"))
+    if antet["ordine_octeti"] != sys.byteorder:
+        raise ValueError(f"[Eroare] Fisierul cache a fost scris pe o alta arhitectura: {file_path}")
+
+    inceput = ANTET.size + lungime
+    date = memoryview(mm)
+    tablouri: Dict[str, memoryview] = dict()
+    for nume, (pozitie, numar, typecode) in antet["sectiuni"].items():
+        marime = array(typecode).itemsize
+        bucata = date[inceput + pozitie : inceput + pozitie + numar * marime]
+        tablouri[nume] = bucata.cast(typecode)
+    return antet, tablouri
+
+
+def _coloane_reguli(reguli: Iterable, fabrica: Callable, campuri: Sequence[str]) -> ListaReguli:
+    # Regulile ca ListaReguli (tabelul de nume si coloanele de id-uri se scriu direct in fisier)
+    if isinstance(reguli, ListaReguli):
+        return reguli
+    compacte = ListaReguli(fabrica, campuri)
+    compacte.extend(reguli)
+    return compacte
+
+
+def _sectiuni_reguli(reguli: ListaReguli) -> Dict[str, array]:
+    # Cate o sectiune "regula_<camp>" pentru fiecare coloana de id-uri
+    return {f"regula_{camp}": coloana for camp, coloana in zip(reguli.campuri, reguli.coloane)}
+
+
+def _incarcare_reguli(
+    antet: Dict, tablouri: Dict[str, memoryview], fabrica: Callable, campuri: Sequence[str]
+) -> ListaReguli:
+    # Reconstruieste regulile din coloanele mapate (o copiere de octeti per coloana)
+    return ListaReguli.din_coloane(
+        fabrica, campuri, antet["nume"], [tablouri[f"regula_{camp}"] for camp in campuri]
+    )
+
+
+def salvare_afd(afd: AFD, file_path: Path) -> None:
+    """Salveaza AFD-ul (regulile si tabelul compilat) in formatul binar al cache-ului."""
+    reguli = _coloane_reguli(afd.Reguli, afd.Delta, afd.Delta.CAMPURI)
+
+    tabel = afd.tabel()
+    antet = {
+        "tip": "AFD",
+        "Stari": afd.Stari,
+        "Sigma": afd.Sigma,
+        "StareInitiala": afd.StareInitiala,
+        "StariFinale": afd.StariFinale,
+        "nume": reguli.nume,
+        "tabel_stari": tabel.stari,
+        "tabel_simboluri": tabel.simboluri,
+        "tabel_finale": tabel.finale,
+        "tabel_initiala": tabel.initiala,
+    }
+    _scriere(
+        file_path,
+        antet,
+        dict(_sectiuni_reguli(reguli), tranzitii=array("i", tabel.tranzitii)),
+    )
+
+
+def incarcare_afd(file_path: Path) -> AFD:
+    """
+    Incarca un AFD salvat cu salvare_afd. Tabelul compilat este folosit direct din fisierul mapat.
+    """
+    antet, tablouri = _citire(file_path)
+    if antet["tip"] != "AFD":
+        raise ValueError(f"[Eroare] Fisierul cache nu contine un AFD: {file_path}")
+
+    afd = AFD()
+    afd.Stari = antet["Stari"]
+    afd.Sigma = antet["Sigma"]
+    afd.StareInitiala = antet["StareInitiala"]
+    afd.StariFinale = antet["StariFinale"]
+
+    afd.Reguli = _incarcare_reguli(antet, tablouri, afd.Delta, afd.Delta.CAMPURI)
+
+    afd._tabel = TabelTranzitii.din_componente(
+        antet["tabel_stari"],
+        antet["tabel_simboluri"],
+        tablouri["tranzitii"],
+        antet["tabel_finale"],
+        antet["tabel_initiala"],
+    )
+    return afd
+
+
+def salvare_afn(afn: AFN, file_path: Path) -> None:
+    """Salveaza AFN-ul (regulile ca o coloana de id-uri per camp) in formatul binar al cache-ului."""
+    reguli = _coloane_reguli(afn.Reguli, TranzitieAFN, TranzitieAFN.CAMPURI)
+
+    antet = {
+        "tip": "AFN",
+        "Stari": afn.Stari,
+        "Sigma": afn.Sigma,
+        "StareInitiala": afn.StareInitiala,
+        "StariFinale": afn.StariFinale,
+        "nume": reguli.nume,
+    }
+    _scriere(file_path, antet, _sectiuni_reguli(reguli))
+
+
+def incarcare_afn(file_path: Path) -> AFN:
+    """Incarca un AFN salvat cu salvare_afn (regulile au fost deja validate la salvare)."""
+    antet, tablouri = _citire(file_path)
+    if antet["tip"] != "AFN":
+        raise ValueError(f"[Eroare] Fisierul cache nu contine un AFN: {file_path}")
+
+    afn = AFN()
+    afn.Stari = antet["Stari"]
+    afn.Sigma = antet["Sigma"]
+    afn.StareInitiala = antet["StareInitiala"]
+    afn.StariFinale = antet["StariFinale"]
+
+    afn.Reguli = _incarcare_reguli(antet, tablouri, TranzitieAFN, TranzitieAFN.CAMPURI)
+    afn._adauga_in_delta()
+    return afn
+
+
+def salvare_gramatica(gramatica: Gramatica, file_path: Path) -> None:
+    """Salveaza gramatica (productiile ca o coloana de id-uri per camp) in formatul binar al cache-ului."""
+    productii = _coloane_reguli(gramatica.productiile, Productie, Productie.CAMPURI)
+
+    antet = {
+        "tip": "Gramatica",
+        "VN": sorted(gramatica.VN),
+        "VT": sorted(gramatica.VT),
+        "S": gramatica.S,
+        "nume": productii.nume,
+    }
+    _scriere(file_path, antet, _sectiuni_reguli(productii))
+
+
+def incarcare_gramatica(file_path: Path) -> Gramatica:
+    """Incarca o gramatica salvata cu salvare_gramatica."""
+    antet, tablouri = _citire(file_path)
+    if antet["tip"] != "Gramatica":
+        raise ValueError(f"[Eroare] Fisierul cache nu contine o gramatica: {file_path}")
+
+    gramatica = Gramatica()
+    gramatica.VN = set(antet["VN"])
+    gramatica.VT = set(antet["VT"])
+    gramatica.S = antet["S"]
+
+    gramatica.productiile = _incarcare_reguli(antet, tablouri, Productie, Productie.CAMPURI)
+    return gramatica
+
+
+class CacheAutomate:
+    """
+    Cache pe disc pentru automate si gramatici compilate.
+
+    Fiecare intrare este cheiata dupa continutul (SHA-256) fisierului text sursa si dupa tipul
+    obiectului, deci un fisier sursa neschimbat este incarcat direct din formatul binar, fara
+    citire text, validarea tranzitiilor sau (pentru AFN) determinizare. Directorul cache-ului
+    este rezolvat prin PathMaker.
+
+    Exemplu de utilizare din main.py:
+
+        cache = CacheAutomate(PathMaker(__file__, "cache"))
+        afd = cache.afd(file_path)
+    """
+
+    def __init__(self, path_maker: PathMaker, *parts: str) -> None:
+        self.director = path_maker.get_independent_OS_dir(*parts)
+
+    def cale(self, source_path: Path, tip: str) -> Path:
+        """Calea fisierului cache pentru sursa data si tipul de obiect."""
+        rezumat = hashlib.sha256()
+        with source_path.open("rb") as f:
+            for bloc in iter(lambda: f.read(1 << 20), b""):
+                rezumat.update(bloc)
+        return self.director / f"{tip}-{rezumat.hexdigest()[:32]}.bin"
+
+    def _obtine(
+        self,
+        source_path: Path,
+        tip: str,
+        construieste: Callable[[], T],
+        salveaza: Callable[[T, Path], None],
+        incarca: Callable[[Path], T],
+    ) -> T:
+        # Incarca din cache daca exista o intrare valida, altfel construieste si salveaza
+        cale = self.cale(source_path, tip)
+        if cale.exists():
+            try:
+                return incarca(cale)
+            except (ValueError, KeyError, struct.error):
+                # Intrare corupta sau dintr-o versiune veche: o reconstruim
+                pass
+        obiect = construieste()
+        salveaza(obiect, cale)
+        return obiect
+
+    def afd(self, source_path: Path) -> AFD:
+        """AFD-ul definit in fisierul text (vezi AFD.citire), din cache daca este posibil."""
+
+        def construieste() -> AFD:
+            afd = AFD()
+            afd.citire(source_path)
+            return afd
+
+        return self._obtine(source_path, "afd", construieste, salvare_afd, incarcare_afd)
+
+    def afn(self, source_path: Path) -> AFN:
+        """AFN-ul definit in fisierul text (vezi AFN.citire), din cache daca este posibil."""
+
+        def construieste() -> AFN:
+            afn = AFN()
+            afn.citire(source_path)
+            return afn
+
+        return self._obtine(source_path, "afn", construieste, salvare_afn, incarcare_afn)
+
+    def afd_din_afn(self, source_path: Path) -> AFD:
+        """AFD-ul obtinut prin determinizarea AFN-ului din fisierul text, din cache daca este posibil."""
+
+        def construieste() -> AFD:
+            transformare = Transformator(self.afn(source_path))
+            return transformare.transformare_AFN_in_AFD(should_print=False)
+
+        return self._obtine(
+            source_path, "afd_din_afn", construieste, salvare_afd, incarcare_afd
+        )
+
+    def gramatica(self, source_path: Path) -> Gramatica:
+        """Gramatica definita in fisierul text (vezi Gramatica.citire), din cache daca este posibil."""
+
+        def construieste() -> Gramatica:
+            gramatica = Gramatica()
+            gramatica.citire(source_path)
+            return gramatica
+
+        return self._obtine(
+            source_path, "gramatica", construieste, salvare_gramatica, incarcare_gramatica
+        )
@@ -0,0 +1,122 @@
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, Tuple
+
+from src.afn import AFN
+
+# Memoria implicită (în octeți) a tranzițiilor AFD păstrate în cache
+CAPACITATE_IMPLICITA = 64 * 1024 * 1024
+
+# Costul estimat (în octeți) al unei intrări, în afara măștilor: nodul din OrderedDict,
+# tuplul cheie și obiectele int (antetul lor)
+COST_INTRARE = 200
+
+
+class AFDLenes:
+    """
+    Determinizare „la cerere” a unui AFN.
+
+    O stare AFD este o mulțime de stări AFN, reprezentată ca mască de biți (vezi TabelBitset).
+    Tranziția (stare AFD, simbol) este calculată prin simularea AFN-ului doar prima dată
+    când un cuvânt ajunge în ea, apoi este păstrată într-un cache LRU limitat la
+    `capacitate` octeți. O intrare costă COST_INTRARE plus dimensiunea celor două măști
+    (bit_length() // 8 fiecare), deci pentru un AFN cu multe stări încap mai puține tranziții.
+    Când cache-ul este plin, cele mai vechi tranziții sunt eliminate, iar la nevoie vor fi
+    recalculate din AFN.
+
+    Contoare: hituri (tranziții găsite în cache), ratari (calculate din AFN), evictari.
+    """
+
+    def __init__(self, afn: AFN, capacitate: int = CAPACITATE_IMPLICITA) -> None:
+        if capacitate < 1:
+            raise ValueError("Capacitatea cache-ului (in octeti) trebuie sa fie cel putin 1.")
+
+        self.afn = afn
+        self.capacitate = capacitate
+        self._cache: "OrderedDict[Tuple[int, int], int]" = OrderedDict()
+        # Memoria estimată a intrărilor din cache (vezi _cost)
+        self.octeti = 0
+        # Tabelul AFN pentru care sunt valabile tranzițiile din cache
+        self._tabel = afn.tabel()
+
+        self.hituri = 0
+        self.ratari = 0
+        self.evictari = 0
+
+    def tranzitie(self, masca: int, a: int) -> int:
+        """Starea AFD în care se ajunge din `masca` cu simbolul cu id-ul a."""
+        cheie = (masca, a)
+        cache = self._cache
+
+        urmatoarea = cache.get(cheie)
+        if urmatoarea is not None:
+            self.hituri += 1
+            cache.move_to_end(cheie)
+            return urmatoarea
+
+        # Ratare: pasul se calculează prin simularea AFN-ului
+        self.ratari += 1
+        urmatoarea = self._tabel.pas(masca, a)
+
+        # O tranziție mai mare decât întregul cache nu este păstrată
+        cost = self._cost(masca, urmatoarea)
+        if cost > self.capacitate:
+            return urmatoarea
+        while self.octeti + cost > self.capacitate:
+            (masca_veche, _), urmatoarea_veche = cache.popitem(last=False)
+            self.octeti -= self._cost(masca_veche, urmatoarea_veche)
+            self.evictari += 1
+        cache[cheie] = urmatoarea
+        self.octeti += cost
+        return urmatoarea
+
+    @staticmethod
+    def _cost(masca: int, urmatoarea: int) -> int:
+        # Memoria estimată a unei intrări: partea fixă plus cele două măști de biți
+        return COST_INTRARE + masca.bit_length() // 8 + urmatoarea.bit_length() // 8
+
+    def accepta(self, cuvant: str) -> bool:
+        """Verifică dacă AFN-ul acceptă cuvântul, folosind tranzițiile AFD din cache."""
+        return next(self.accepta_lot([cuvant]))
+
+    def accepta_lot(self, cuvinte: Iterable[str]) -> Iterator[bool]:
+        """Ca accepta, dar pentru mai multe cuvinte; întoarce (leneș) câte un bool per cuvânt."""
+        # Dacă AFN-ul a fost recompilat între timp, tranzițiile din cache nu mai sunt valabile
+        tabel = self.afn.tabel()
+        if tabel is not self._tabel:
+            self._tabel = tabel
+            self.goleste_cache()
+        simbol_id = tabel.simbol_id
+
+        for cuvant in cuvinte:
+            masca = tabel.initiala
+            for simbol in cuvant.strip():
+                a = simbol_id.get(simbol)
+                if a is None:
+                    masca = 0
+                    break
+                masca = self.tranzitie(masca, a)
+                if not masca:
+                    break
+
+            yield bool(masca & tabel.finale)
+
+    def statistici(self) -> Dict[str, int]:
+        """Contoarele cache-ului, utile pentru dimensionarea capacității (în octeți)."""
+        return {
+            "hituri": self.hituri,
+            "ratari": self.ratari,
+            "evictari": self.evictari,
+            "tranzitii_in_cache": len(self._cache),
+            "stari_in_cache": len({masca for masca, _ in self._cache}),
+            "octeti_in_cache": self.octeti,
+            "capacitate": self.capacitate,
+        }
+
+    def reseteaza_statistici(self) -> None:
+        self.hituri = 0
+        self.ratari = 0
+        self.evictari = 0
+
+    def goleste_cache(self) -> None:
+        self._cache.clear()
+        self.octeti = 0
@@ -0,0 +1,112 @@
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Set, Tuple
+
+if TYPE_CHECKING:
+    from src.gramatica import Gramatica
+
+# Un item Earley: (indexul productiei, pozitia punctului, pozitia de start in cuvant)
+Item = Tuple[int, int, int]
+
+
+class ParserEarley:
+    """
+    Test de apartenenta pentru gramatici independente de context (membrul stang al fiecarei
+    productii este un singur neterminal), cu algoritmul lui Earley.
+
+    λ-productiile (SIMBOL_VID) sunt tratate direct: la predictia unui neterminal care poate
+    deriva λ, punctul este avansat imediat peste el (Aycock & Horspool).
+    Tabelele gramaticii (productiile dupa membrul stang, neterminalele anulabile) se construiesc
+    o singura data si sunt refolosite pentru toate cuvintele.
+    """
+
+    def __init__(self, gramatica: "Gramatica") -> None:
+        if not gramatica.este_independenta_de_context():
+            raise ValueError(
+                "[Eroare] Testul de apartenenta cere ca fiecare membru stang sa fie un singur neterminal."
+            )
+
+        self.start = gramatica.S
+        self.terminale: Set[str] = set(gramatica.VT)
+
+        # Productiile ca (membru stang, membru drept ca tuplu); λ devine tuplul vid
+        self.stangi: List[str] = list()
+        self.drepti: List[Tuple[str, ...]] = list()
+        self.dupa_stang: Dict[str, List[int]] = {symbol: list() for symbol in gramatica.VN}
+        for productie in gramatica.productiile:
+            right = "" if productie.right == gramatica.SIMBOL_VID else productie.right
+            self.dupa_stang[productie.left].append(len(self.stangi))
+            self.stangi.append(productie.left)
+            self.drepti.append(tuple(right))
+
+        self.anulabile: Set[str] = {
+            symbol for symbol, lungime in gramatica.lungimi_minime().items() if lungime == 0
+        }
+
+    def apartine(self, cuvant: str) -> bool:
+        """Verifica daca gramatica genereaza cuvantul."""
+        if self.start not in self.dupa_stang:
+            return False
+        if not set(cuvant).issubset(self.terminale):
+            return False
+
+        n = len(cuvant)
+        stangi, drepti = self.stangi, self.drepti
+        dupa_stang, anulabile = self.dupa_stang, self.anulabile
+
+        # multimi[i] = itemii din setul Earley i; asteptare[i][X] = itemii din setul i care asteapta X
+        multimi: List[Set[Item]] = [set() for _ in range(n + 1)]
+        asteptare: List[Dict[str, List[Item]]] = [dict() for _ in range(n + 1)]
+        multimi[0] = {(p, 0, 0) for p in dupa_stang[self.start]}
+
+        for i in range(n + 1):
+            curent = multimi[i]
+            agenda = list(curent)
+            prezise: Set[str] = set()
+            urmatorul_simbol = cuvant[i] if i < n else None
+
+            while agenda:
+                p, punct, origine = agenda.pop()
+                right = drepti[p]
+
+                if punct == len(right):
+                    # Completare: avansam itemii din setul de origine care asteptau membrul stang
+                    for p2, punct2, origine2 in asteptare[origine].get(stangi[p], ()):
+                        item = (p2, punct2 + 1, origine2)
+                        if item not in curent:
+                            curent.add(item)
+                            agenda.append(item)
+                    continue
+
+                simbol = right[punct]
+                if simbol in dupa_stang:
+                    # Predictie
+                    asteptare[i].setdefault(simbol, list()).append((p, punct, origine))
+                    if simbol not in prezise:
+                        prezise.add(simbol)
+                        for q in dupa_stang[simbol]:
+                            item = (q, 0, i)
+                            if item not in curent:
+                                curent.add(item)
+                                agenda.append(item)
+                    # Un neterminal anulabil poate fi sarit imediat
+                    if simbol in anulabile:
+                        item = (p, punct + 1, origine)
+                        if item not in curent:
+                            curent.add(item)
+                            agenda.append(item)
+                elif simbol == urmatorul_simbol:
+                    # Scanare
+                    multimi[i + 1].add((p, punct + 1, origine))
+
+            # Niciun item nu a trecut peste simbolul i: cuvantul nu poate fi generat
+            if i < n and not multimi[i + 1]:
+                return False
+
+        return any(
+            origine == 0 and punct == len(drepti[p]) and stangi[p] == self.start
+            for p, punct, origine in multimi[n]
+        )
+
+    def apartine_lot(self, cuvinte: Iterable[str]) -> Iterator[bool]:
+        """Ca apartine, pentru mai multe cuvinte, refolosind tabelele gramaticii."""
+        for cuvant in cuvinte:
+            yield self.apartine(cuvant)
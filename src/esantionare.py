@@ -0,0 +1,129 @@
+import multiprocessing
+import random
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from src import instrumentare
+from src.gramatica import Gramatica
+
+# Numarul implicit de cuvinte generate de un worker intr-o sarcina
+DIMENSIUNE_LOT = 1_000
+
+# Gramatica folosita de procesul curent (setata o singura data per worker)
+_gramatica: Optional[Gramatica] = None
+
+
+def _initializare_worker(gramatica: Gramatica) -> None:
+    global _gramatica
+    _gramatica = gramatica
+    # Indexul productiilor se construieste o singura data per worker
+    _gramatica.indexare()
+
+
+def _generare_lot(
+    gramatica: Gramatica,
+    seed: int,
+    index: int,
+    dimensiune: int,
+    max_len: Optional[int] = None,
+    max_pasi: Optional[int] = None,
+) -> Tuple[List[str], int]:
+    """
+    Genereaza `dimensiune` cuvinte cu un flux aleator propriu, determinat doar de (seed, index),
+    cu limitele max_len / max_pasi ale lui Gramatica.generare.
+    Intoarce cuvintele si numarul de generari esuate (inclusiv cele care nu pot respecta limitele).
+    """
+    rng = random.Random(f"{seed}-{index}")
+    cuvinte: List[str] = list()
+    esecuri = 0
+    for _ in range(dimensiune):
+        try:
+            pasi = gramatica.generare(
+                should_print=False, cu_pasi=False, rng=rng, max_len=max_len, max_pasi=max_pasi
+            )
+            cuvinte.append(pasi[-1])
+        except ValueError:
+            esecuri += 1
+    return cuvinte, esecuri
+
+
+def _sarcina(
+    argumente: Tuple[int, int, int, Optional[int], Optional[int]]
+) -> Tuple[List[str], int]:
+    assert _gramatica is not None
+    return _generare_lot(_gramatica, *argumente)
+
+
+def esantionare_paralela(
+    gramatica: Gramatica,
+    numar_cuvinte: int,
+    seed: int = 0,
+    workers: Optional[int] = None,
+    dimensiune_lot: int = DIMENSIUNE_LOT,
+    max_incercari: int = 100_000,
+    statistici: Optional[Dict[str, int]] = None,
+    max_len: Optional[int] = None,
+    max_pasi: Optional[int] = None,
+) -> Iterator[str]:
+    """
+    Genereaza aleatoriu (cu generare) cel mult `numar_cuvinte` cuvinte distincte, impartind munca
+    pe un pool de procese.
+
+    Sarcina k genereaza `dimensiune_lot` cuvinte cu un random.Random initializat din (seed, k),
+    iar rezultatele sunt combinate in ordinea sarcinilor si deduplicate pe masura ce sosesc.
+    Astfel, acelasi seed produce aceleasi cuvinte, in aceeasi ordine, indiferent de numarul de
+    workeri sau de ordinea in care acestia termina. Se fac cel mult `max_incercari` generari.
+
+    max_len si max_pasi sunt transmise lui Gramatica.generare: cu oricare dintre ele, fiecare
+    generare se termina in numar limitat de pasi. Fara limite, o gramatica recursiva (de ex.
+    S ⟶ SS | a) poate bloca un worker oricat de mult.
+
+    Daca se da dictionarul `statistici`, in el se aduna numarul de generari si de esecuri
+    (generari care au ridicat ValueError, de ex. limite imposibil de respectat) din loturile
+    combinate.
+    """
+    if statistici is None:
+        statistici = dict()
+    statistici.setdefault("generari", 0)
+    statistici.setdefault("esecuri", 0)
+
+    numar_sarcini = -(-max_incercari // dimensiune_lot)
+    sarcini = [
+        (seed, k, min(dimensiune_lot, max_incercari - k * dimensiune_lot), max_len, max_pasi)
+        for k in range(numar_sarcini)
+    ]
+
+    vazute: Set[str] = set()
+
+    # Generarile din workeri nu apar in instrumentarea procesului curent; le raportam aici
+    instr = instrumentare.curenta()
+
+    def combinare(loturi: Iterator[Tuple[List[str], int]]) -> Iterator[str]:
+        for cuvinte, esecuri in loturi:
+            statistici["generari"] += len(cuvinte) + esecuri
+            statistici["esecuri"] += esecuri
+            instr.numara("esantionare.generari", len(cuvinte) + esecuri)
+            instr.numara("esantionare.esecuri", esecuri)
+            for cuvant in cuvinte:
+                if cuvant not in vazute:
+                    vazute.add(cuvant)
+                    yield cuvant
+                    if len(vazute) >= numar_cuvinte:
+                        return
+                else:
+                    # Cuvant deja generat: generarea a fost in zadar si se reincearca
+                    instr.numara("esantionare.duplicate")
+
+    if numar_cuvinte <= 0:
+        return
+
+    # Cu un singur worker nu are rost un pool: rezultatele sunt identice
+    if workers == 1:
+        gramatica.indexare()
+        yield from combinare(_generare_lot(gramatica, *sarcina) for sarcina in sarcini)
+        return
+
+    with multiprocessing.Pool(
+        workers, initializer=_initializare_worker, initargs=(gramatica,)
+    ) as pool:
+        # imap pastreaza ordinea sarcinilor, deci rezultatul nu depinde de planificare
+        yield from combinare(pool.imap(_sarcina, sarcini))
@@ -0,0 +1,219 @@
+import contextlib
+import itertools
+import mmap
+import multiprocessing
+import os
+import time
+from collections import deque
+from multiprocessing.pool import AsyncResult
+from pathlib import Path
+from typing import Deque, Iterable, Iterator, List, Optional, TextIO, Tuple, Union
+
+from src.afd import AFD, Verdict
+from src.afn import AFN
+
+# Dimensiunea implicită a unui bloc citit din fișier (în octeți)
+DIMENSIUNE_BLOC = 1 << 22
+
+
+class Statistici:
+    """
+    Statisticile unei clasificări în flux: câte cuvinte și câți octeți au fost procesați
+    și în cât timp, de unde rezultă debitul în cuvinte/s și MB/s.
+    """
+
+    def __init__(self) -> None:
+        self.cuvinte: int = 0
+        self.octeti: int = 0
+        self.secunde: float = 0.0
+
+    @property
+    def cuvinte_pe_secunda(self) -> float:
+        return self.cuvinte / self.secunde if self.secunde else 0.0
+
+    @property
+    def mb_pe_secunda(self) -> float:
+        return self.octeti / (1 << 20) / self.secunde if self.secunde else 0.0
+
+    def __str__(self) -> str:
+        return (
+            f"{self.cuvinte} cuvinte, {self.octeti / (1 << 20):.2f} MB in {self.secunde:.3f} s "
+            f"({self.cuvinte_pe_secunda:,.0f} cuvinte/s, {self.mb_pe_secunda:.2f} MB/s)"
+        )
+
+
+def citire_blocuri(
+    file_path: Path, dimensiune_bloc: int = DIMENSIUNE_BLOC
+) -> Iterator[Tuple[List[str], int]]:
+    """
+    Citește un fișier cu câte un cuvânt pe linie prin mmap, bloc cu bloc, fără a-l încărca
+    în memorie. Întoarce (leneș), pentru fiecare bloc, lista de linii și numărul de octeți.
+    """
+    with file_path.open("rb") as f:
+        # Un fișier gol nu poate fi mapat în memorie
+        if f.seek(0, 2) == 0:
+            return
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            inceput = 0
+            marime = len(mm)
+            while inceput < marime:
+                sfarsit = min(inceput + dimensiune_bloc, marime)
+
+                # Blocul se termină mereu la un sfârșit de linie (cu excepția ultimului)
+                if sfarsit < marime:
+                    linie_noua = mm.rfind(b"\n", inceput, sfarsit)
+                    if linie_noua == -1:
+                        # O linie mai lungă decât blocul: căutăm sfârșitul ei
+                        linie_noua = mm.find(b"\n", sfarsit)
+                        if linie_noua == -1:
+                            linie_noua = marime - 1
+                    sfarsit = linie_noua + 1
+
+                linii = mm[inceput:sfarsit].decode("utf-8").split("\n")
+                # Ultimul element este gol dacă blocul se termină cu "\n"
+                if not linii[-1]:
+                    linii.pop()
+                yield linii, sfarsit - inceput
+
+                inceput = sfarsit
+
+
+def clasificare_linii(
+    afd: AFD,
+    file_path: Path,
+    statistici: Optional[Statistici] = None,
+    dimensiune_bloc: int = DIMENSIUNE_BLOC,
+) -> Iterator[Tuple[str, Verdict]]:
+    """
+    Clasifică în flux fiecare linie (cuvânt) din fișier folosind tranzițiile compilate
+    ale AFD-ului. Întoarce (leneș) perechi (cuvant, verdict).
+    Dacă se dă un obiect Statistici, acesta este actualizat după fiecare bloc.
+    """
+    if statistici is None:
+        statistici = Statistici()
+
+    start = time.perf_counter()
+    for linii, numar_octeti in citire_blocuri(file_path, dimensiune_bloc):
+        verdicte = list(afd.verificare_lot(linii))
+
+        statistici.cuvinte += len(linii)
+        statistici.octeti += numar_octeti
+        statistici.secunde = time.perf_counter() - start
+
+        yield from zip(linii, verdicte)
+
+    statistici.secunde = time.perf_counter() - start
+
+
+def scriere_verdict(iesire: TextIO, cuvant: str, verdict: Verdict) -> None:
+    # O linie TSV: cuvant, rezultat și (pentru blocaj) poziția
+    pozitie = "" if verdict.pozitie is None else str(verdict.pozitie)
+    iesire.write(f"{cuvant.strip()}\t{verdict.rezultat}\t{pozitie}\n")
+
+
+def clasificare_fisier(
+    afd: AFD,
+    file_path: Path,
+    output: Union[Path, TextIO],
+    dimensiune_bloc: int = DIMENSIUNE_BLOC,
+) -> Statistici:
+    """
+    Clasifică toate cuvintele din `file_path` și scrie verdictele în fișierul `output` sau
+    într-un flux text deja deschis (de ex. stdout), câte o linie TSV per cuvânt.
+    Întoarce statisticile de debit.
+    """
+    statistici = Statistici()
+    with contextlib.ExitStack() as stiva:
+        iesire = (
+            stiva.enter_context(output.open("w", encoding="utf-8"))
+            if isinstance(output, Path)
+            else output
+        )
+        for cuvant, verdict in clasificare_linii(
+            afd, file_path, statistici, dimensiune_bloc
+        ):
+            scriere_verdict(iesire, cuvant, verdict)
+    return statistici
+
+
+# Numărul implicit de cuvinte dintr-un lot trimis unui worker
+DIMENSIUNE_LOT = 10_000
+
+# Automatul folosit de procesul curent (setat o singură dată per worker)
+_automat: Optional[Union[AFD, AFN]] = None
+
+
+def loturi_linii(
+    sursa: Union[Path, TextIO], dimensiune_lot: int = DIMENSIUNE_LOT
+) -> Iterator[List[str]]:
+    """
+    Împarte cuvintele (câte unul pe linie) din fișier sau dintr-un flux text (de ex. stdin)
+    în loturi de cel mult `dimensiune_lot` linii. Fișierele sunt citite prin citire_blocuri (mmap).
+    """
+    if isinstance(sursa, Path):
+        for linii, _ in citire_blocuri(sursa):
+            for inceput in range(0, len(linii), dimensiune_lot):
+                yield linii[inceput : inceput + dimensiune_lot]
+        return
+
+    linii_flux = (linie.rstrip("\n") for linie in sursa)
+    while True:
+        lot = list(itertools.islice(linii_flux, dimensiune_lot))
+        if not lot:
+            return
+        yield lot
+
+
+def _clasificare_lot(
+    automat: Union[AFD, AFN], linii: List[str]
+) -> List[Union[Verdict, bool]]:
+    # AFD: câte un Verdict per cuvânt; AFN: câte un bool (acceptat sau nu)
+    if isinstance(automat, AFD):
+        return list(automat.verificare_lot(linii))
+    return list(automat.accepta_lot(linii))
+
+
+def _initializare_worker(automat: Union[AFD, AFN]) -> None:
+    global _automat
+    _automat = automat
+    # Tabelul compilat se construiește o singură dată per worker
+    _automat.tabel()
+
+
+def _sarcina(linii: List[str]) -> List[Union[Verdict, bool]]:
+    assert _automat is not None
+    return _clasificare_lot(_automat, linii)
+
+
+def clasificare_paralela(
+    automat: Union[AFD, AFN],
+    loturi: Iterable[List[str]],
+    workers: Optional[int] = None,
+) -> Iterator[Tuple[str, Union[Verdict, bool]]]:
+    """
+    Clasifică loturile de cuvinte cu un AFD (Verdict) sau un AFN (bool), împărțindu-le pe un pool
+    de `workers` procese (implicit câte unul per procesor). Automatul este trimis o singură dată
+    fiecărui worker, care îl compilează o singură dată. Întoarce (leneș) perechi (cuvant, rezultat)
+    în ordinea de intrare; cel mult 2 loturi per worker sunt în lucru simultan, deci memoria
+    folosită nu depinde de dimensiunea intrării.
+    """
+    # Cu un singur worker nu are rost un pool: rezultatele sunt identice
+    if workers == 1:
+        for linii in loturi:
+            yield from zip(linii, _clasificare_lot(automat, linii))
+        return
+
+    numar_workeri = workers or os.cpu_count() or 1
+    with multiprocessing.Pool(
+        numar_workeri, initializer=_initializare_worker, initargs=(automat,)
+    ) as pool:
+        in_lucru: Deque[Tuple[List[str], AsyncResult]] = deque()
+        for linii in loturi:
+            in_lucru.append((linii, pool.apply_async(_sarcina, (linii,))))
+            if len(in_lucru) >= 2 * numar_workeri:
+                linii_gata, rezultat = in_lucru.popleft()
+                yield from zip(linii_gata, rezultat.get())
+        while in_lucru:
+            linii_gata, rezultat = in_lucru.popleft()
+            yield from zip(linii_gata, rezultat.get())
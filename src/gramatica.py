@@ -1,9 +1,27 @@
-from typing import List, Set
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 from pathlib import Path
+import heapq
+import itertools
+import math
 import random
 
+from src import instrumentare
+from src.afd import AFD
+from src.afn import AFN
+from src.reguli import ListaReguli
+from src.transformare import Transformator
+
+if TYPE_CHECKING:
+    from src.earley import ParserEarley
+
 
 class Productie:
+    # Fara __dict__: productiile din Gramatica.productiile sunt vederi construite la cerere
+    __slots__ = ("left", "right")
+
+    # Numele campurilor, in ordinea coloanelor din ListaReguli
+    CAMPURI = __slots__
+
     def __init__(self, left: str, right: str) -> None:
         # Membrul stang al regulii de productie
         self.left: str = left
@@ -14,8 +32,92 @@ class Productie:
         return f"{self.left} ⟶ {self.right}"
 
 
+def _convolutie_min(a: List[float], b: List[float]) -> List[float]:
+    # c[L] = min peste l <= L din a[l] + b[L - l]: numarul minim de pasi pentru doua bucati
+    # derivate independent, cu lungimea totala de cel mult L simboluri
+    c = [math.inf] * len(a)
+    for i, x in enumerate(a):
+        if x == math.inf:
+            continue
+        for j in range(len(a) - i):
+            if x + b[j] < c[i + j]:
+                c[i + j] = x + b[j]
+    return c
+
+
+class FormaPropozitionala:
+    """
+    Un cuvant intermediar (forma propozitionala) pastrat ca lista dublu inlantuita de simboluri,
+    impreuna cu un index al pozitiilor fiecarui neterminal.
+
+    Inlocuirea unui neterminal costa O(|membrul drept|), nu O(|cuvant|), iar alegerea aleatorie
+    a unei pozitii pentru un neterminal este O(1). Cuvantul ca string se construieste doar la cerere.
+    """
+
+    def __init__(self, start: str, neterminale: Set[str]) -> None:
+        self.neterminale = neterminale
+        # Nodul 0 este santinela: urm[0] este primul simbol, prec[0] ultimul
+        self.simbol: List[str] = [""]
+        self.urm: List[int] = [0]
+        self.prec: List[int] = [0]
+        # aparitii[X] = nodurile pe care se afla neterminalul X; loc[nod] = indexul in aparitii[X].
+        # Cheile sunt sortate: ordinea de iterare a unui set de stringuri difera intre procese
+        # (hash randomizat), iar generarea cu acelasi rng trebuie sa dea aceleasi cuvinte
+        self.aparitii: Dict[str, List[int]] = {x: list() for x in sorted(neterminale)}
+        self.loc: Dict[int, int] = dict()
+        self.lungime = 0
+
+        self._insereaza_dupa(0, start)
+
+    def _insereaza_dupa(self, nod: int, text: str) -> None:
+        # Insereaza simbolurile din text dupa nodul dat, actualizand indexul de aparitii
+        dupa = self.urm[nod]
+        for simbol in text:
+            nou = len(self.simbol)
+            self.simbol.append(simbol)
+            self.prec.append(nod)
+            self.urm.append(dupa)
+            self.urm[nod] = nou
+            self.prec[dupa] = nou
+            if simbol in self.neterminale:
+                self.loc[nou] = len(self.aparitii[simbol])
+                self.aparitii[simbol].append(nou)
+            nod = nou
+        self.lungime += len(text)
+
+    def inlocuieste(self, nod: int, text: str) -> None:
+        """Inlocuieste simbolul (neterminal) de pe nod cu text (gol pentru λ)."""
+        simbol = self.simbol[nod]
+
+        # Eliminam nodul din indexul de aparitii (interschimbare cu ultimul element)
+        lista = self.aparitii[simbol]
+        index = self.loc.pop(nod)
+        ultimul = lista.pop()
+        if ultimul != nod:
+            lista[index] = ultimul
+            self.loc[ultimul] = index
+
+        # Scoatem nodul din lista inlantuita si inseram membrul drept in locul lui
+        inainte, dupa = self.prec[nod], self.urm[nod]
+        self.urm[inainte] = dupa
+        self.prec[dupa] = inainte
+        self.lungime -= 1
+        self._insereaza_dupa(inainte, text)
+
+    def __str__(self) -> str:
+        simboluri: List[str] = list()
+        nod = self.urm[0]
+        while nod:
+            simboluri.append(self.simbol[nod])
+            nod = self.urm[nod]
+        return "".join(simboluri)
+
+
 class Gramatica:
     SIMBOL_VID = "*"  # pentru cuvantul vid λ
+    # Cu doar max_len, generarea are si o limita implicita de pasi: de atatea ori mai multi
+    # decat cea mai scurta derivare (dar cel putin max_len + 1), vezi generare
+    FACTOR_PASI_IMPLICITI = 4
 
     def __init__(self) -> None:
         # multimea neterminalelor
@@ -24,8 +126,29 @@ class Gramatica:
         self.VT: Set[str] = set()
         # simbolul de start
         self.S: str | None = None
-        # multimea de productii (reguli)
-        self.productiile: List[Productie] = list()
+        # multimea de productii (reguli), pastrata compact ca id-uri (vezi ListaReguli)
+        self.productiile: ListaReguli[Productie] = ListaReguli(Productie, Productie.CAMPURI)
+        # productiile indexate dupa membrul stang (vezi indexare), construit la nevoie
+        self._index: Dict[str, List[Productie]] | None = None
+        # parserul Earley (vezi apartine), construit la nevoie
+        self._parser: Optional["ParserEarley"] = None
+        # AFD-ul minimal pentru gramaticile regulate (vezi automat), construit la nevoie
+        self._automat: Optional[AFD] = None
+        # Daca gramatica este regulata (vezi apartine_lot), decis la nevoie
+        self._regulata: Optional[bool] = None
+
+    def indexare(self) -> Dict[str, List[Productie]]:
+        """
+        Indexeaza productiile dupa membrul stang, o singura data.
+        Se apeleaza automat la generare; trebuie reapelata daca productiile se modifica ulterior.
+        """
+        self._index = dict()
+        self._parser = None
+        self._automat = None
+        self._regulata = None
+        for productie in self.productiile:
+            self._index.setdefault(productie.left, list()).append(productie)
+        return self._index
 
     def citire(self, file_path: Path) -> None:
         """
@@ -38,6 +161,12 @@ class Gramatica:
         - nu exista linii goale.
         """
 
+        # O noua definitie invalideaza indexul productiilor si parserul
+        self._index = None
+        self._parser = None
+        self._automat = None
+        self._regulata = None
+
         # Se deschide fisierul text
         with file_path.open("r", encoding="utf-8") as f:
             # Se citeste linie cu linie pana la final
@@ -69,8 +198,7 @@ class Gramatica:
                 # Se citesc productiile pana la finalul fisierului
                 else:
                     [left, right] = line.split()
-                    productie = Productie(left, right)
-                    self.productiile.append(productie)
+                    self.productiile.adauga(left, right)
 
     def verificare(self, should_print: bool = True) -> bool:
         """
@@ -188,10 +316,34 @@ class Gramatica:
         for index, productie in enumerate(self.productiile, start=1):
             print(f"({index}) {productie}")
 
-    def generare(self, should_print: bool = True) -> List[str]:
+    @instrumentare.cronometrat("gramatica.generare")
+    def generare(
+        self,
+        should_print: bool = True,
+        cu_pasi: bool = True,
+        rng: Optional[random.Random] = None,
+        max_len: Optional[int] = None,
+        max_pasi: Optional[int] = None,
+    ) -> List[str]:
         """
         Genereaza un cuvant final incepand de la simbolul de start, cu afisarea fiecarui pas.
         Returneaza lista de pasi in ordine de la simbolul de start pana la cuvantul generat.
+        Daca cu_pasi este False (si nu se afiseaza nimic), pasii intermediari nu mai sunt construiti,
+        iar lista returnata contine doar cuvantul final.
+        Alegerile aleatorii folosesc `rng` daca este dat (pentru rezultate reproductibile),
+        altfel modulul global random.
+
+        Cu max_len si/sau max_pasi, generarea este limitata: se aleg doar productiile dupa care
+        cuvantul se mai poate termina in cel mult max_len simboluri, respectiv in cel mult max_pasi
+        pasi de derivare (folosind lungimile minime si numarul minim de pasi ai fiecarui neterminal).
+        Cand sunt date ambele limite, minimele separate nu ajung (pot fi atinse de derivari diferite),
+        asa ca se folosesc tabelele din pasi_minimi_pe_lungimi: numarul minim de pasi pentru fiecare
+        buget de lungime. Daca limitele nu pot fi respectate (separat sau impreuna), se ridica
+        ValueError inainte de generare.
+        Doar max_len nu margineste numarul de pasi (de ex. S ⟶ SSS | λ nu schimba lungimea), asa ca
+        se adauga o limita implicita max_pasi = FACTOR_PASI_IMPLICITI * max(numarul minim de pasi
+        pentru max_len simboluri, max_len + 1). Cu max_pasi dat (singur sau cu max_len), generarea
+        se opreste mereu in cel mult max_pasi pasi; fara limite, se poate sa nu se termine.
 
         Procesul de generare:
         - Se alege aleatoriu o regula de productie aplicabila.
@@ -201,88 +353,626 @@ class Gramatica:
         """
 
         intermediary_steps: List[str] = list()
+        aleator = rng if rng is not None else random
 
         # Daca nu exista simbol de start returneaza o lista goala de pasi intermediari
         if not self.S:
             return intermediary_steps
 
-        # Se initializeaza primul pas cu simbolul de start
-        word_step = self.S
-        intermediary_steps.append(word_step)
+        # Productiile indexate dupa membrul stang (construite o singura data)
+        index = self._index if self._index is not None else self.indexare()
+
+        # Pentru fiecare neterminal, productiile care il au ca membru stang
+        productii_neterminal: Dict[str, List[Productie]] = {
+            symbol: index.get(symbol, list()) for symbol in self.VN
+        }
+
+        # Pentru generarea limitata: marginile inferioare ale lungimii finale si ale numarului de pasi
+        limitat = max_len is not None or max_pasi is not None
+        if limitat:
+            lungimi = self.lungimi_minime()
+            pasi = self.pasi_minimi()
+            cost_lungime: Dict[int, float] = dict()
+            cost_pasi: Dict[int, float] = dict()
+            for productii in productii_neterminal.values():
+                for productie in productii:
+                    right = "" if productie.right == self.SIMBOL_VID else productie.right
+                    # Cu cat se schimba marginile cand productia inlocuieste membrul stang
+                    cost_lungime[id(productie)] = (
+                        sum(lungimi[c] if c in self.VN else 1 for c in right)
+                        - lungimi[productie.left]
+                    )
+                    cost_pasi[id(productie)] = (
+                        1 + sum(pasi[c] for c in right if c in self.VN) - pasi[productie.left]
+                    )
+
+            # margine_pasi = pasii deja facuti + numarul minim de pasi ramasi
+            margine_lungime = lungimi.get(self.S, math.inf)
+            margine_pasi = pasi.get(self.S, math.inf)
+            if max_len is not None and margine_lungime > max_len:
+                raise ValueError(
+                    f"[Eroare] Gramatica nu poate genera un cuvant cu cel mult {max_len} simboluri."
+                )
+            if max_pasi is not None and margine_pasi > max_pasi:
+                raise ValueError(
+                    f"[Eroare] Gramatica nu poate genera un cuvant in cel mult {max_pasi} pasi de derivare."
+                )
+            margine_pasi_maxima = math.inf if max_pasi is None else max_pasi
+            margine_lungime_maxima = math.inf if max_len is None else max_len
+
+        # Doar cu max_len, mersul aleator s-ar putea repeta oricat fara sa schimbe lungimea
+        # (productii care se anuleaza reciproc), deci se adauga limita implicita de pasi
+        tabele: Optional[Dict[str, List[float]]] = None
+        if max_len is not None and max_pasi is None:
+            tabele = self.pasi_minimi_pe_lungimi(max_len)
+            max_pasi = self.FACTOR_PASI_IMPLICITI * int(
+                max(tabele.get(self.S, [0])[-1], max_len + 1)
+            )
+
+        # Cu ambele limite: tabelele comune (pasi minimi pe buget de lungime) ale neterminalelor
+        # si ale membrilor drepti, plus puterile tabelelor (k aparitii ale aceluiasi neterminal)
+        comun = max_len is not None and max_pasi is not None
+        if comun:
+            if tabele is None:
+                tabele = self.pasi_minimi_pe_lungimi(max_len)
+            if tabele.get(self.S, [math.inf])[-1] > max_pasi:
+                raise ValueError(
+                    f"[Eroare] Gramatica nu poate genera un cuvant cu cel mult {max_len} simboluri in cel mult {max_pasi} pasi de derivare."
+                )
+            tabel_dreapta: Dict[int, List[float]] = {
+                id(productie): self._tabel_membru(productie.right, tabele, max_len)
+                for productii in productii_neterminal.values()
+                for productie in productii
+            }
+            neutru: List[float] = [0] * (max_len + 1)
+            puteri: Dict[str, List[List[float]]] = {symbol: [neutru] for symbol in tabele}
+
+            def putere(symbol: str, k: int) -> List[float]:
+                lista = puteri[symbol]
+                while len(lista) <= k:
+                    lista.append(_convolutie_min(lista[-1], tabele[symbol]))
+                return lista[k]
 
-        # Se initializeaza o lista care va contine neterminalele cuvantului cu simbolul de start
-        vn_symbols_in_word: List[str] = list(self.VN.intersection(word_step))
+        # Se initializeaza primul pas cu simbolul de start
+        word_step = FormaPropozitionala(self.S, self.VN)
+        pastreaza_pasii = cu_pasi or should_print
+        if pastreaza_pasii:
+            intermediary_steps.append(self.S)
 
         # Se printeaza primul pas (S) daca se doreste
         if should_print:
-            print(f"{word_step}", end="")
-
-        # Cat timp exista neterminale in cuvant
-        while vn_symbols_in_word:
-
-            # Definim setul de productii aplicabile pe acest cuvant
-            productii_aplicabile: Set[Productie] = set()
-            for symbol in vn_symbols_in_word:
-                for productie in self.productiile:
-                    # prin compararea fiecarui simbol al cuvantului cu membrul stang al fiecarei productii din gramatica
-                    if symbol == productie.left:
-                        productii_aplicabile.add(productie)
-
-            # In cazul in care nu exista productii aplicabile
-            if not productii_aplicabile:
-                # Se verifica daca la acest pas, cuvantul este format doar din terminale
-                just_terminals: bool = set(word_step).issubset(self.VT)
-
-                # Daca este, atunci iesire din ciclu. In caz contrar, ridica o eroare.
-                if just_terminals:
-                    break
-                else:
-                    raise ValueError(
-                        f"[Eroare] Cuvantul '{word_step}' nu este format doar din terminale, dar nu exista productii aplicabile. A se verifica gramatica"
-                    )
+            print(f"{self.S}", end="")
 
-            # Se alege aleatoriu o productie
-            prod_random = random.choice(list(productii_aplicabile))
+        aparitii = word_step.aparitii
+        pasi_derivare = 0
 
-            # Definim setul de pozitii posibile unde productia aleasa se poate aplica
-            possible_positions: Set[int] = set()
-            for index, symbol in enumerate(word_step):
-                # prin comparare fiecarui simbol al cuvantului cu membrul stang al productiei alese
-                if symbol == prod_random.left:
-                    possible_positions.add(index)
+        # Cat timp exista neterminale in cuvant
+        while True:
+            # Neterminalele prezente in cuvant si numarul total de productii aplicabile
+            vn_symbols_in_word = [symbol for symbol, noduri in aparitii.items() if noduri]
+            if not vn_symbols_in_word:
+                break
+            total_aplicabile = sum(
+                len(productii_neterminal[symbol]) for symbol in vn_symbols_in_word
+            )
 
-            # Se alege aleatoriu o pozitie in cuvant
-            pos_random = random.choice(list(possible_positions))
+            # In cazul in care nu exista productii aplicabile, cuvantul contine neterminale care nu pot fi rescrise
+            if not total_aplicabile:
+                raise ValueError(
+                    f"[Eroare] Cuvantul '{word_step}' nu este format doar din terminale, dar nu exista productii aplicabile. A se verifica gramatica"
+                )
 
-            # Se aplica productia prin inlocuirea simbolului cu membrul drept al productiei
-            new_word_step: str = ""
+            if comun:
+                # fara_unul[X] = tabelul tuturor neterminalelor din cuvant, mai putin o aparitie a lui X
+                # (din prefixele si sufixele produselor puterilor, in ordinea neterminalelor)
+                numar = [len(aparitii[symbol]) for symbol in vn_symbols_in_word]
+                prefix = [neutru]
+                for symbol, k in zip(vn_symbols_in_word, numar):
+                    prefix.append(_convolutie_min(prefix[-1], putere(symbol, k)))
+                sufix = neutru
+                fara_unul: Dict[str, List[float]] = dict()
+                for i in reversed(range(len(vn_symbols_in_word))):
+                    symbol = vn_symbols_in_word[i]
+                    fara_unul[symbol] = _convolutie_min(
+                        _convolutie_min(prefix[i], putere(symbol, numar[i] - 1)), sufix
+                    )
+                    sufix = _convolutie_min(sufix, putere(symbol, numar[i]))
+
+                # Bugetele ramase dupa aplicarea productiei (terminalele deja produse raman in cuvant)
+                rest_lungime = max_len - (word_step.lungime - sum(numar))
+                rest_pasi = max_pasi - pasi_derivare - 1
+
+                # Se alege aleatoriu (uniform) o productie dupa care forma ramane fezabila. Exista mereu
+                # una: forma curenta este fezabila (verificat la inceput, respectiv la pasul anterior),
+                # iar primul pas al unei derivari care respecta ambele limite o pastreaza fezabila.
+                fezabile = [
+                    productie
+                    for symbol in vn_symbols_in_word
+                    for productie in productii_neterminal[symbol]
+                    if min(
+                        fara_unul[symbol][l] + tabel_dreapta[id(productie)][rest_lungime - l]
+                        for l in range(rest_lungime + 1)
+                    )
+                    <= rest_pasi
+                ]
+                prod_random = aleator.choice(fezabile)
+            elif limitat:
+                # Doar cu max_pasi: se alege aleatoriu (uniform) o productie dintre cele aplicabile
+                # care respecta limita. Exista mereu una: cea care realizeaza minimul pentru un
+                # neterminal din cuvant (minimele neterminalelor se pot atinge independent).
+                fezabile = [
+                    productie
+                    for symbol in vn_symbols_in_word
+                    for productie in productii_neterminal[symbol]
+                    if margine_lungime + cost_lungime[id(productie)] <= margine_lungime_maxima
+                    and margine_pasi + cost_pasi[id(productie)] <= margine_pasi_maxima
+                ]
+                prod_random = aleator.choice(fezabile)
+                margine_lungime += cost_lungime[id(prod_random)]
+                margine_pasi += cost_pasi[id(prod_random)]
+            else:
+                # Se alege aleatoriu (uniform) o productie dintre cele aplicabile
+                alegere = aleator.randrange(total_aplicabile)
+                for symbol in vn_symbols_in_word:
+                    productii = productii_neterminal[symbol]
+                    if alegere < len(productii):
+                        prod_random = productii[alegere]
+                        break
+                    alegere -= len(productii)
+
+            # Se alege aleatoriu o pozitie in cuvant unde apare membrul stang al productiei
+            pos_random = aleator.choice(aparitii[prod_random.left])
+
+            # Se aplica productia prin inlocuirea simbolului cu membrul drept al productiei.
             # Daca membrul drept este vid atunci se elimina simbolul de tot, altfel se inlocuieste
             if prod_random.right == self.SIMBOL_VID:
-                new_word_step = word_step[:pos_random] + word_step[pos_random + 1 :]
+                word_step.inlocuieste(pos_random, "")
             else:
-                chars = list(word_step)
-                chars[pos_random] = prod_random.right
-                new_word_step = "".join(chars)
+                word_step.inlocuieste(pos_random, prod_random.right)
+            pasi_derivare += 1
 
-            # Se printeaza pas cu pas transformarile
-            if should_print:
-                print(f" ⟶ {new_word_step}", end="")
+            if pastreaza_pasii:
+                new_word_step = str(word_step)
 
-            # Se adauga noul cuvant format in lista finala
-            intermediary_steps.append(new_word_step)
+                # Se printeaza pas cu pas transformarile
+                if should_print:
+                    print(f" ⟶ {new_word_step}", end="")
 
-            # Si se reia procesul pana cand cuvantul este format doar din terminale, astfel spus len(vn_symbols_in_word) = 0
-            word_step = new_word_step
-            vn_symbols_in_word = list(self.VN.intersection(word_step))
+                # Se adauga noul cuvant format in lista finala
+                intermediary_steps.append(new_word_step)
 
         # Verificam daca cuvantul final este format doar din terminale. Daca nu ridicam o eroare.
-        final_word = intermediary_steps[-1]
+        final_word = intermediary_steps[-1] if pastreaza_pasii else str(word_step)
         if not set(final_word).issubset(self.VT):
             # Cum la iesirea din ciclu nu mai exista simboluri neterminale, atunci cuvantul final contine simboluri din afara VN ∪ VT
             raise ValueError(
                 f"[Eroare] Cuvantul final '{final_word}' trebuie sa fie format din simboluri terminale. A se verifica gramatica."
             )
 
+        if not pastreaza_pasii:
+            intermediary_steps.append(final_word)
+
+        instr = instrumentare.curenta()
+        if instr.activ:
+            instr.numara("gramatica.generari")
+            instr.numara("gramatica.pasi_derivare", pasi_derivare)
+            instr.observa("gramatica.pasi_per_generare", pasi_derivare)
+
         # printeaza new line si returneaza lista de pasi generate de productii
-        print()
+        if should_print:
+            print()
         return intermediary_steps
+
+    def neterminale_productive(self) -> Set[str]:
+        """
+        Neterminalele din care se poate deriva un cuvant terminal (punct fix, in timp liniar):
+        fiecare productie tine minte cate neterminale neproductive mai are in membrul drept,
+        iar cand un neterminal devine productiv se parcurg doar productiile in care apare.
+        Simbolurile din afara VN ∪ VT fac productia neproductiva.
+        """
+        # Doar productiile cu membrul stang un singur neterminal (ca la generare)
+        productii = [p for p in self.productiile if p.left in self.VN]
+
+        ramase: List[int] = [0] * len(productii)
+        aparitii: Dict[str, List[int]] = {symbol: list() for symbol in self.VN}
+        de_procesat: List[str] = list()
+        productive: Set[str] = set()
+
+        for i, productie in enumerate(productii):
+            if productie.right != self.SIMBOL_VID:
+                for symbol in productie.right:
+                    if symbol in self.VN:
+                        aparitii[symbol].append(i)
+                        ramase[i] += 1
+                    elif symbol not in self.VT:
+                        # Nu va deveni niciodata 0
+                        ramase[i] += 1
+            if ramase[i] == 0 and productie.left not in productive:
+                productive.add(productie.left)
+                de_procesat.append(productie.left)
+
+        while de_procesat:
+            symbol = de_procesat.pop()
+            for i in aparitii[symbol]:
+                ramase[i] -= 1
+                left = productii[i].left
+                if ramase[i] == 0 and left not in productive:
+                    productive.add(left)
+                    de_procesat.append(left)
+
+        return productive
+
+    def neterminale_accesibile(self, productive: Set[str] | None = None) -> Set[str]:
+        """
+        Neterminalele care apar in forme derivate din S. Daca se da multimea `productive`,
+        se folosesc doar productiile ale caror neterminale sunt toate productive.
+        """
+        index = self._index if self._index is not None else self.indexare()
+        if not self.S or self.S not in self.VN:
+            return set()
+        if productive is not None and self.S not in productive:
+            return set()
+
+        accesibile: Set[str] = {self.S}
+        de_procesat: List[str] = [self.S]
+        while de_procesat:
+            for productie in index.get(de_procesat.pop(), list()):
+                if productive is not None and not self._este_utila(productie, productive):
+                    continue
+                for symbol in productie.right:
+                    if symbol in self.VN and symbol not in accesibile:
+                        accesibile.add(symbol)
+                        de_procesat.append(symbol)
+        return accesibile
+
+    def _este_utila(self, productie: Productie, productive: Set[str]) -> bool:
+        # Productia are membrul stang si toate neterminalele din dreapta productive
+        if productie.left not in productive:
+            return False
+        if productie.right == self.SIMBOL_VID:
+            return True
+        return all(symbol in productive or symbol in self.VT for symbol in productie.right)
+
+    def eliminare_productii_inutile(self, should_print: bool = True) -> bool:
+        """
+        Elimina productiile inutile: cele care contin un neterminal neproductiv (din care nu se
+        poate ajunge la un cuvant terminal) sau inaccesibil din S. Productiile al caror membru stang
+        nu este un singur neterminal nu sunt atinse (generarea nu le foloseste).
+
+        Returneaza False daca limbajul generat este vid (S nu este productiv), True altfel.
+        """
+        productive = self.neterminale_productive()
+        accesibile = self.neterminale_accesibile(productive)
+
+        pastrate: ListaReguli[Productie] = ListaReguli(Productie, Productie.CAMPURI)
+        eliminate: List[Productie] = list()
+        for productie in self.productiile:
+            if productie.left not in self.VN or (
+                productie.left in accesibile and self._este_utila(productie, productive)
+            ):
+                pastrate.append(productie)
+            else:
+                eliminate.append(productie)
+
+        if eliminate:
+            self.productiile = pastrate
+            self.indexare()
+
+        if should_print:
+            neproductive = self.VN - productive
+            if neproductive:
+                print(f"\nNeterminale neproductive: {{{', '.join(sorted(neproductive))}}}")
+            for productie in eliminate:
+                print(f"Se elimina productia inutila: {productie}")
+
+        if self.S not in productive:
+            if should_print:
+                print("Limbajul generat de gramatica este vid.")
+            return False
+        return True
+
+    def este_independenta_de_context(self) -> bool:
+        """Verifica daca membrul stang al fiecarei productii este un singur neterminal."""
+        return all(productie.left in self.VN for productie in self.productiile)
+
+    def apartine(self, cuvant: str) -> bool:
+        """
+        Verifica daca gramatica (independenta de context) genereaza cuvantul.
+        Gramaticile regulate sunt verificate pe AFD-ul minimal echivalent (vezi automat),
+        celelalte cu parserul Earley (vezi src/earley.py). Ambele sunt construite o singura data.
+        """
+        return next(self.apartine_lot([cuvant]))
+
+    def apartine_lot(self, cuvinte: Iterable[str]) -> Iterator[bool]:
+        """Ca apartine, pentru mai multe cuvinte."""
+        # Alegerea motorului (o parcurgere a productiilor) se face o singura data, ca si constructia
+        # lui. Decizia se retine dupa constructie, care poate reindexa productiile (vezi indexare)
+        if self._regulata is None:
+            regulata = self.este_regulata()
+            if regulata:
+                self.automat()
+            else:
+                self.parser()
+            self._regulata = regulata
+        if self._regulata:
+            return (
+                verdict.rezultat == "acceptat"
+                for verdict in self.automat().verificare_lot(cuvinte)
+            )
+        return self.parser().apartine_lot(cuvinte)
+
+    def _este_liniara(self, la_dreapta: bool) -> bool:
+        # Fiecare membru drept este λ, un sir de terminale, sau un sir de terminale
+        # urmat (la_dreapta) / precedat (la stanga) de un singur neterminal
+        if not self.este_independenta_de_context():
+            return False
+        for productie in self.productiile:
+            if productie.right == self.SIMBOL_VID:
+                continue
+            right = productie.right if la_dreapta else productie.right[::-1]
+            for index, symbol in enumerate(right):
+                if symbol in self.VN:
+                    if index != len(right) - 1:
+                        return False
+                elif symbol not in self.VT:
+                    return False
+        return True
+
+    def este_liniara_dreapta(self) -> bool:
+        """Productiile sunt de forma A ⟶ wB sau A ⟶ w (w sir de terminale, eventual λ)."""
+        return self._este_liniara(la_dreapta=True)
+
+    def este_liniara_stanga(self) -> bool:
+        """Productiile sunt de forma A ⟶ Bw sau A ⟶ w (w sir de terminale, eventual λ)."""
+        return self._este_liniara(la_dreapta=False)
+
+    def este_regulata(self) -> bool:
+        """Gramatica este liniara la dreapta sau la stanga (genereaza un limbaj regulat)."""
+        return self.este_liniara_dreapta() or self.este_liniara_stanga()
+
+    def in_afn(self) -> AFN:
+        """
+        Construieste un AFN (cu λ-tranzitii) echivalent cu o gramatica liniara.
+
+        - liniara la dreapta: starile sunt neterminalele plus o stare finala noua; A ⟶ a1..akB devine
+          un drum A --a1--> ... --ak--> B, A ⟶ a1..ak un drum spre starea finala, iar λ devine λ-tranzitie.
+        - liniara la stanga: starile sunt neterminalele plus o stare initiala noua, iar S este finala;
+          A ⟶ Ba1..ak devine un drum B --a1--> ... --ak--> A, iar A ⟶ a1..ak un drum din starea initiala spre A.
+        """
+        la_dreapta = self.este_liniara_dreapta()
+        if not la_dreapta and not self.este_liniara_stanga():
+            raise ValueError("[Eroare] Doar gramaticile liniare pot fi transformate in AFN.")
+        if not self.S:
+            raise ValueError("[Eroare] Gramatica nu are simbol de start.")
+
+        afn = AFN()
+        afn.Sigma = sorted(self.VT)
+        afn.Stari = sorted(self.VN)
+
+        def stare_noua() -> str:
+            # Nume de stare care nu se confunda cu un neterminal
+            nume = f"q{len(afn.Stari)}"
+            while nume in self.VN:
+                nume += "'"
+            afn.Stari.append(nume)
+            return nume
+
+        def drum(sursa: str, cuvant: str, destinatie: str) -> None:
+            # Tranzitii sursa --cuvant--> destinatie prin stari intermediare noi (λ daca e gol)
+            if not cuvant:
+                afn.adauga_tranzitie(sursa, AFN.SIMBOL_VID, destinatie)
+                return
+            for symbol in cuvant[:-1]:
+                intermediar = stare_noua()
+                afn.adauga_tranzitie(sursa, symbol, intermediar)
+                sursa = intermediar
+            afn.adauga_tranzitie(sursa, cuvant[-1], destinatie)
+
+        capat = stare_noua()
+        if la_dreapta:
+            afn.StareInitiala = self.S
+            afn.StariFinale = [capat]
+        else:
+            afn.StareInitiala = capat
+            afn.StariFinale = [self.S]
+
+        for productie in self.productiile:
+            right = "" if productie.right == self.SIMBOL_VID else productie.right
+            if la_dreapta:
+                if right and right[-1] in self.VN:
+                    drum(productie.left, right[:-1], right[-1])
+                else:
+                    drum(productie.left, right, capat)
+            else:
+                if right and right[0] in self.VN:
+                    drum(right[0], right[1:], productie.left)
+                else:
+                    drum(capat, right, productie.left)
+
+        return afn
+
+    def esantion(self, n: int, rng: Optional[random.Random] = None) -> str:
+        """
+        Un cuvant de lungime n ales uniform aleator dintre cele generate de o gramatica regulata,
+        prin AFD-ul echivalent (vezi AFD.esantion), fara generari repetate si respingeri.
+        """
+        if not self.este_regulata():
+            raise ValueError(
+                "[Eroare] Esantionarea uniforma este disponibila doar pentru gramatici regulate."
+            )
+        return self.automat().esantion(n, rng)
+
+    def automat(self) -> AFD:
+        """AFD-ul minimal echivalent cu o gramatica regulata (AFN -> determinizare -> minimizare)."""
+        if self._automat is None:
+            afn = self.in_afn()
+            afd = Transformator(afn).transformare_AFN_in_AFD(should_print=False)
+            self._automat = afd.minimizeaza(should_print=False)
+        return self._automat
+
+    def parser(self) -> "ParserEarley":
+        # Parserul Earley pentru gramatica curenta, construit la nevoie
+        if self._parser is None:
+            from src.earley import ParserEarley
+
+            self._parser = ParserEarley(self)
+        return self._parser
+
+    def lungimi_minime(self) -> Dict[str, float]:
+        """
+        Pentru fiecare neterminal, lungimea minima a unui cuvant terminal derivat din el
+        (math.inf daca neterminalul nu poate genera niciun cuvant terminal).
+        Se folosesc doar productiile cu membrul stang un singur neterminal, ca la generare.
+        """
+        return self._minime(cost_terminal=1, cost_pas=0)
+
+    def pasi_minimi(self) -> Dict[str, float]:
+        """
+        Pentru fiecare neterminal, numarul minim de pasi de derivare (aplicari de productii)
+        pana la un cuvant terminal (math.inf daca nu exista).
+        """
+        return self._minime(cost_terminal=0, cost_pas=1)
+
+    def pasi_minimi_pe_lungimi(self, max_len: int) -> Dict[str, List[float]]:
+        """
+        Pentru fiecare neterminal, tabelul t in care t[L] (0 <= L <= max_len) este numarul minim
+        de pasi de derivare pana la un cuvant terminal de cel mult L simboluri (math.inf daca nu
+        exista). Spre deosebire de lungimi_minime si pasi_minimi, tine cont de ambele limite deodata.
+        """
+        index = self._index if self._index is not None else self.indexare()
+        tabele: Dict[str, List[float]] = {symbol: [math.inf] * (max_len + 1) for symbol in self.VN}
+
+        # Relaxam pana la punctul fix
+        schimbat = True
+        while schimbat:
+            schimbat = False
+            for symbol in self.VN:
+                tabel = tabele[symbol]
+                for productie in index.get(symbol, list()):
+                    membru = self._tabel_membru(productie.right, tabele, max_len)
+                    for lungime, valoare in enumerate(membru):
+                        if valoare + 1 < tabel[lungime]:
+                            tabel[lungime] = valoare + 1
+                            schimbat = True
+        return tabele
+
+    def _tabel_membru(
+        self, right: str, tabele: Dict[str, List[float]], max_len: int
+    ) -> List[float]:
+        # Tabelul (pasi minimi pe buget de lungime) al unui membru drept: un terminal ocupa un
+        # simbol fara pasi, iar simbolurile se deriva independent unul de altul
+        tabel: List[float] = [0] * (max_len + 1)
+        if right == self.SIMBOL_VID:
+            return tabel
+        terminal: List[float] = [math.inf] + [0] * max_len
+        for symbol in right:
+            tabel = _convolutie_min(tabel, tabele[symbol] if symbol in self.VN else terminal)
+        return tabel
+
+    def _minime(self, cost_terminal: int, cost_pas: int) -> Dict[str, float]:
+        # Costul minim al unei derivari complete din fiecare neterminal, unde fiecare terminal
+        # produs costa cost_terminal, iar fiecare productie aplicata costa cost_pas
+        index = self._index if self._index is not None else self.indexare()
+        minime: Dict[str, float] = {symbol: math.inf for symbol in self.VN}
+
+        def cost(right: str) -> float:
+            if right == self.SIMBOL_VID:
+                return cost_pas
+            return cost_pas + sum(
+                minime[symbol] if symbol in self.VN else cost_terminal for symbol in right
+            )
+
+        # Relaxam pana la punctul fix
+        schimbat = True
+        while schimbat:
+            schimbat = False
+            for symbol in self.VN:
+                for productie in index.get(symbol, list()):
+                    valoare = cost(productie.right)
+                    if valoare < minime[symbol]:
+                        minime[symbol] = valoare
+                        schimbat = True
+        return minime
+
+    def _productii_fara_lambda(self) -> Tuple[Dict[str, List[str]], Set[str]]:
+        """
+        Elimina λ-productiile: intoarce, pentru fiecare neterminal, membrii drepti nevizi obtinuti
+        omitand in toate felurile posibile neterminalele care pot deriva λ, plus multimea acestora.
+        """
+        minime = self.lungimi_minime()
+        anulabile = {symbol for symbol, valoare in minime.items() if valoare == 0}
+        index = self._index if self._index is not None else self.indexare()
+
+        fara_lambda: Dict[str, List[str]] = dict()
+        for symbol in self.VN:
+            variante: Dict[str, None] = dict()
+            for productie in index.get(symbol, list()):
+                if productie.right == self.SIMBOL_VID:
+                    continue
+                optiuni = [
+                    (c, "") if c in anulabile else (c,) for c in productie.right
+                ]
+                for varianta in itertools.product(*optiuni):
+                    right = "".join(varianta)
+                    # Productiile goale si cele de forma X ⟶ X nu aduc cuvinte noi
+                    if right and right != symbol:
+                        variante[right] = None
+            fara_lambda[symbol] = list(variante)
+        return fara_lambda, anulabile
+
+    def enumerare(self, max_len: Optional[int] = None) -> Iterator[str]:
+        """
+        Genereaza lenes cuvintele terminale distincte ale gramaticii, in ordinea crescatoare a lungimii
+        (cel mult max_len, daca este dat).
+
+        Se exploreaza formele propozitionale prin derivari de stanga, intr-o coada de prioritate ordonata
+        dupa o margine inferioara a lungimii cuvintelor care se mai pot obtine din forma
+        (terminalele + lungimile minime ale neterminalelor). Formele deja vazute sunt ignorate, iar cele
+        a caror margine depaseste max_len sunt taiate. Ca la generare, se folosesc doar productiile
+        cu membrul stang un singur neterminal.
+
+        Fara max_len, generatorul se opreste doar daca limbajul este finit.
+        Pentru gramaticile regulate, cuvintele sunt enumerate direct pe AFD-ul minimal (vezi automat).
+        """
+        if not self.S or self.S not in self.VN:
+            return
+
+        if self.este_regulata():
+            yield from self.automat().enumerare(max_len)
+            return
+
+        productii, anulabile = self._productii_fara_lambda()
+        minime = self.lungimi_minime()
+
+        # Cuvantul vid este singurul care nu apare din productiile fara λ
+        if self.S in anulabile and (max_len is None or max_len >= 0):
+            yield ""
+
+        def margine(forma: str) -> float:
+            # Fiecare neterminal produce cel putin max(1, lungimea minima) simboluri (nu mai exista λ)
+            return sum(max(1, minime[c]) if c in self.VN else 1 for c in forma)
+
+        vazute: Set[str] = {self.S}
+        coada: List[Tuple[float, str]] = [(margine(self.S), self.S)]
+
+        while coada:
+            lungime, forma = heapq.heappop(coada)
+
+            # Primul neterminal din forma (derivare de stanga)
+            pozitie = next((i for i, c in enumerate(forma) if c in self.VN), -1)
+            if pozitie == -1:
+                # Forma terminala: este un cuvant al limbajului (daca are doar simboluri din VT)
+                if set(forma).issubset(self.VT):
+                    yield forma
+                continue
+
+            prefix, symbol, sufix = forma[:pozitie], forma[pozitie], forma[pozitie + 1 :]
+            for right in productii[symbol]:
+                forma_noua = prefix + right + sufix
+                if forma_noua in vazute:
+                    continue
+                margine_noua = margine(forma_noua)
+                if margine_noua == math.inf or (max_len is not None and margine_noua > max_len):
+                    continue
+                vazute.add(forma_noua)
+                heapq.heappush(coada, (margine_noua, forma_noua))
@@ -0,0 +1,195 @@
+"""
+Instrumentare optionala (contoare, histograme si cronometre) pentru motoarele din src/.
+
+Implicit instrumentarea este inactiva: motoarele primesc InstrumentareNula, ale carei metode nu
+fac nimic, si verifica `activ` o singura data per apel sau per cuvant, deci costul este neglijabil.
+Pentru a colecta date:
+
+    from src import instrumentare
+
+    instrumentare.activeaza()
+    afd.verificare_lot(cuvinte) ...
+    print(instrumentare.instantaneu())
+    instrumentare.reseteaza()
+
+Contoarele sunt per proces: generarile facute in workerii din esantionare.py nu sunt vazute aici,
+doar rezultatele combinate in procesul principal.
+"""
+
+import cProfile
+import functools
+import pstats
+import sys
+import time
+from collections import Counter, defaultdict
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any, Callable, ContextManager, DefaultDict, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Cronometru:
+    # Context manager pentru un cronometru: aduna durata si numarul de apeluri
+    __slots__ = ("instrumentare", "nume", "start")
+
+    def __init__(self, instrumentare: "Instrumentare", nume: str) -> None:
+        self.instrumentare = instrumentare
+        self.nume = nume
+        self.start = 0.0
+
+    def __enter__(self) -> None:
+        self.start = time.perf_counter()
+
+    def __exit__(self, tip, valoare, traceback) -> None:
+        self.instrumentare.timpi[self.nume] += time.perf_counter() - self.start
+        self.instrumentare.apeluri[self.nume] += 1
+        if tip is not None:
+            self.instrumentare.erori[self.nume] += 1
+
+
+class Instrumentare:
+    """
+    Colecteaza masuratorile motoarelor:
+        contoare    - nume -> valoare (de ex. "afd.tranzitii")
+        histograme  - nume -> {valoare observata -> de cate ori} (de ex. "afd.pozitie_blocaj")
+        timpi       - nume -> secunde cumulate in cronometrul cu acel nume
+        apeluri     - nume -> de cate ori a rulat cronometrul
+        erori       - nume -> de cate ori s-a iesit din cronometru printr-o exceptie
+    """
+
+    activ = True
+
+    def __init__(self) -> None:
+        self.reseteaza()
+
+    def reseteaza(self) -> None:
+        self.contoare: Counter = Counter()
+        self.histograme: DefaultDict[str, Counter] = defaultdict(Counter)
+        self.timpi: DefaultDict[str, float] = defaultdict(float)
+        self.apeluri: Counter = Counter()
+        self.erori: Counter = Counter()
+
+    def numara(self, nume: str, valoare: int = 1) -> None:
+        self.contoare[nume] += valoare
+
+    def observa(self, nume: str, valoare: Any) -> None:
+        self.histograme[nume][valoare] += 1
+
+    def cronometru(self, nume: str) -> ContextManager[None]:
+        return _Cronometru(self, nume)
+
+    def instantaneu(self) -> Dict[str, Dict]:
+        """O copie a masuratorilor curente (nu se modifica la masuratorile ulterioare)."""
+        return {
+            "contoare": dict(sorted(self.contoare.items())),
+            "histograme": {
+                nume: dict(sorted(valori.items()))
+                for nume, valori in sorted(self.histograme.items())
+            },
+            "timpi": dict(sorted(self.timpi.items())),
+            "apeluri": dict(sorted(self.apeluri.items())),
+            "erori": dict(sorted(self.erori.items())),
+        }
+
+    def __str__(self) -> str:
+        linii = [f"{nume}: {valoare}" for nume, valoare in sorted(self.contoare.items())]
+        linii += [
+            f"{nume}: {self.timpi[nume]:.4f}s in {self.apeluri[nume]} apeluri"
+            + (f" ({self.erori[nume]} cu eroare)" if self.erori[nume] else "")
+            for nume in sorted(self.timpi)
+        ]
+        linii += [
+            f"{nume}: {dict(sorted(valori.items()))}"
+            for nume, valori in sorted(self.histograme.items())
+        ]
+        return "\n".join(linii)
+
+
+class InstrumentareNula(Instrumentare):
+    """Instrumentarea implicita: nu colecteaza nimic."""
+
+    activ = False
+
+    def numara(self, nume: str, valoare: int = 1) -> None:
+        pass
+
+    def observa(self, nume: str, valoare: Any) -> None:
+        pass
+
+    def cronometru(self, nume: str) -> ContextManager[None]:
+        return _FARA_CRONOMETRU
+
+
+_FARA_CRONOMETRU = nullcontext()
+_NULA = InstrumentareNula()
+
+# Instrumentarea in care raporteaza motoarele
+_curenta: Instrumentare = _NULA
+
+
+def curenta() -> Instrumentare:
+    return _curenta
+
+
+def activeaza(instrumentare: Optional[Instrumentare] = None) -> Instrumentare:
+    """Porneste colectarea (intr-o instrumentare noua, daca nu se da una) si o intoarce."""
+    global _curenta
+    _curenta = instrumentare if instrumentare is not None else Instrumentare()
+    return _curenta
+
+
+def dezactiveaza() -> Instrumentare:
+    """Opreste colectarea si intoarce instrumentarea folosita pana acum."""
+    global _curenta
+    precedenta, _curenta = _curenta, _NULA
+    return precedenta
+
+
+def instantaneu() -> Dict[str, Dict]:
+    return _curenta.instantaneu()
+
+
+def reseteaza() -> None:
+    _curenta.reseteaza()
+
+
+def cronometrat(nume: str) -> Callable[[Callable[..., T]], Callable[..., T]]:
+    """
+    Decorator: cand instrumentarea este activa, fiecare apel al functiei este cronometrat sub
+    `nume` (iar apelurile terminate cu exceptie sunt numarate in erori[nume]).
+    """
+
+    def decorator(functie: Callable[..., T]) -> Callable[..., T]:
+        @functools.wraps(functie)
+        def cronometrata(*args: Any, **kwargs: Any) -> T:
+            instrumentare = _curenta
+            if not instrumentare.activ:
+                return functie(*args, **kwargs)
+            with instrumentare.cronometru(nume):
+                return functie(*args, **kwargs)
+
+        return cronometrata
+
+    return decorator
+
+
+def profilare(
+    functie: Callable[..., T],
+    *args: Any,
+    sortare: str = "cumulative",
+    limita: int = 25,
+    fisier: Optional[Path] = None,
+    **kwargs: Any,
+) -> T:
+    """
+    Ruleaza functie(*args, **kwargs) sub cProfile si afiseaza primele `limita` intrari, sortate
+    dupa `sortare`. Cu `fisier`, profilul este salvat si pentru analiza ulterioara (pstats, snakeviz).
+    """
+    profil = cProfile.Profile()
+    try:
+        return profil.runcall(functie, *args, **kwargs)
+    finally:
+        if fisier is not None:
+            profil.dump_stats(str(fisier))
+        pstats.Stats(profil, stream=sys.stdout).sort_stats(sortare).print_stats(limita)
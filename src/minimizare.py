@@ -0,0 +1,145 @@
+from typing import Dict, List, Set, Tuple
+
+from src.afd import AFD, TabelTranzitii
+
+
+def stari_accesibile(tabel: TabelTranzitii) -> List[int]:
+    """Id-urile stărilor accesibile din starea inițială, în ordinea parcurgerii în lățime."""
+    vizitate = [False] * len(tabel.stari)
+    vizitate[tabel.initiala] = True
+    ordine = [tabel.initiala]
+    for q in ordine:
+        baza = q * tabel.nr_simboluri
+        for p in tabel.tranzitii[baza : baza + tabel.nr_simboluri]:
+            if p >= 0 and not vizitate[p]:
+                vizitate[p] = True
+                ordine.append(p)
+    return ordine
+
+
+def minimizare_hopcroft(afd: AFD, should_print: bool = True) -> AFD:
+    """
+    Întoarce AFD-ul minimal (complet) echivalent cu `afd`:
+        1. se elimină stările inaccesibile;
+        2. dacă lipsesc tranziții, se adaugă o stare „moartă” care le primește;
+        3. se rafinează partiția {F, Q \\ F} cu algoritmul lui Hopcroft, O(n log n).
+    """
+    if afd.StareInitiala is None:
+        raise ValueError("Starea initiala in AFD trebuie sa existe")
+
+    tabel = afd.tabel()
+    nr_simboluri = tabel.nr_simboluri
+
+    # (1) Stările accesibile primesc id-uri noi 0..n-1
+    accesibile = stari_accesibile(tabel)
+    id_nou = {q: i for i, q in enumerate(accesibile)}
+    n = len(accesibile)
+
+    # (2) Tabelul complet pe stările accesibile; starea moartă are id-ul n
+    moarta = n
+    delta: List[int] = [moarta] * (n * nr_simboluri)
+    are_moarta = False
+    for i, q in enumerate(accesibile):
+        baza = q * nr_simboluri
+        for a in range(nr_simboluri):
+            p = tabel.tranzitii[baza + a]
+            if p >= 0:
+                delta[i * nr_simboluri + a] = id_nou[p]
+            else:
+                are_moarta = True
+    if are_moarta:
+        delta.extend([moarta] * nr_simboluri)
+        n += 1
+    finale = [tabel.finale[q] for q in accesibile] + [False] * (n - len(accesibile))
+
+    # Tranzițiile inverse: inverse[a][p] = stările q cu δ(q, a) = p
+    inverse: List[List[List[int]]] = [
+        [list() for _ in range(n)] for _ in range(nr_simboluri)
+    ]
+    for q in range(n):
+        for a in range(nr_simboluri):
+            inverse[a][delta[q * nr_simboluri + a]].append(q)
+
+    # (3) Partiția inițială {F, Q \ F} (fără blocuri goale)
+    blocuri: List[Set[int]] = [
+        b
+        for b in ({q for q in range(n) if finale[q]}, {q for q in range(n) if not finale[q]})
+        if b
+    ]
+    bloc_al: List[int] = [0] * n
+    for b, bloc in enumerate(blocuri):
+        for q in bloc:
+            bloc_al[q] = b
+
+    # Lista de lucru: (bloc, simbol); ajunge blocul mai mic dintre F și Q \ F
+    de_procesat: Set[Tuple[int, int]] = set()
+    if len(blocuri) == 2:
+        mai_mic = 0 if len(blocuri[0]) <= len(blocuri[1]) else 1
+        de_procesat = {(mai_mic, a) for a in range(nr_simboluri)}
+
+    while de_procesat:
+        b, a = de_procesat.pop()
+
+        # Predecesorii blocului b pe simbolul a, grupați după blocul în care se află
+        atinse: Dict[int, List[int]] = dict()
+        inverse_a = inverse[a]
+        for p in blocuri[b]:
+            for q in inverse_a[p]:
+                atinse.setdefault(bloc_al[q], list()).append(q)
+
+        for y, membri in atinse.items():
+            if len(membri) == len(blocuri[y]):
+                continue
+
+            # Blocul y se împarte în y ∩ X (noul bloc) și y \ X (rămâne pe y)
+            nou = len(blocuri)
+            parte = set(membri)
+            blocuri[y] -= parte
+            blocuri.append(parte)
+            for q in parte:
+                bloc_al[q] = nou
+
+            for c in range(nr_simboluri):
+                if (y, c) in de_procesat:
+                    de_procesat.add((nou, c))
+                else:
+                    de_procesat.add((nou, c) if len(parte) <= len(blocuri[y]) else (y, c))
+
+    # Construim AFD-ul minimal, parcurgând blocurile în lățime din blocul stării inițiale
+    nume_existente = set(tabel.stari)
+    nume_moarta = "MORT"
+    while nume_moarta in nume_existente:
+        nume_moarta += "_"
+
+    def nume_stare(q: int) -> str:
+        return nume_moarta if q == moarta and are_moarta else str(tabel.stari[accesibile[q]])
+
+    # Fiecare bloc poartă numele stării cu cel mai mic id (starea moartă e ultima),
+    # calculat o singură dată per bloc, nu per tranziție emisă
+    nume_bloc = [nume_stare(min(bloc)) for bloc in blocuri]
+
+    minimal = AFD()
+    minimal.Sigma = list(tabel.simboluri)
+    ordine = [bloc_al[0]]
+    vizitate = {bloc_al[0]}
+    for b in ordine:
+        q = next(iter(blocuri[b]))
+        stare = nume_bloc[b]
+        minimal.Stari.append(stare)
+        if finale[q]:
+            minimal.StariFinale.append(stare)
+        for a in range(nr_simboluri):
+            tinta = bloc_al[delta[q * nr_simboluri + a]]
+            if tinta not in vizitate:
+                vizitate.add(tinta)
+                ordine.append(tinta)
+            minimal.Reguli.append(minimal.Delta(stare, tabel.simboluri[a], nume_bloc[tinta]))
+    minimal.StareInitiala = minimal.Stari[0]
+
+    if should_print:
+        print(
+            f"\nMinimizare: {len(tabel.stari)} stari -> {len(minimal.Stari)} stari "
+            f"({len(accesibile)} accesibile{', plus starea moarta' if are_moarta else ''})."
+        )
+
+    return minimal
@@ -0,0 +1,182 @@
+import random
+from typing import List, Optional
+
+from src.afd import AFD, TabelTranzitii
+
+Matrice = List[List[int]]
+
+
+def _matrice_numarare(tabel: TabelTranzitii, modul: Optional[int]) -> Matrice:
+    # M[q][p] = numărul de simboluri a cu δ(q, a) = p
+    n = len(tabel.stari)
+    matrice: Matrice = [[0] * n for _ in range(n)]
+    for cheie, p in enumerate(tabel.tranzitii):
+        if p >= 0:
+            matrice[cheie // tabel.nr_simboluri][p] += 1
+    if modul is not None:
+        matrice = [[x % modul for x in rand] for rand in matrice]
+    return matrice
+
+
+def _inmultire(a: Matrice, b: Matrice, modul: Optional[int]) -> Matrice:
+    # Produsul a · b, sărind peste elementele nule (matricele de tranziții sunt de obicei rare)
+    n = len(b[0]) if b else 0
+    rezultat: Matrice = list()
+    for rand_a in a:
+        rand = [0] * n
+        for k, x in enumerate(rand_a):
+            if x:
+                for j, y in enumerate(b[k]):
+                    if y:
+                        rand[j] += x * y
+        if modul is not None:
+            rand = [x % modul for x in rand]
+        rezultat.append(rand)
+    return rezultat
+
+
+def _vector_ori_putere(
+    vector: List[int], matrice: Matrice, putere: int, modul: Optional[int]
+) -> List[int]:
+    # vector · matrice^putere, prin ridicare la putere rapidă (O(|Q|^3 log putere))
+    rezultat = [vector]
+    while putere:
+        if putere & 1:
+            rezultat = _inmultire(rezultat, matrice, modul)
+        putere >>= 1
+        if putere:
+            matrice = _inmultire(matrice, matrice, modul)
+    return rezultat[0]
+
+
+def _prin_programare_dinamica(tabel: TabelTranzitii, n: int, modul: Optional[int]) -> List[int]:
+    """
+    numar[k] = câte cuvinte de lungime k sunt acceptate, pentru k = 0..n.
+    Vectorul de stări (câte drumuri din q0 ajung în fiecare stare) avansează cu un pas pe lungime.
+    """
+    nr_simboluri = tabel.nr_simboluri
+    tranzitii = tabel.tranzitii
+    finale = [q for q, finala in enumerate(tabel.finale) if finala]
+
+    vector = [0] * len(tabel.stari)
+    vector[tabel.initiala] = 1
+    numar = [sum(vector[q] for q in finale)]
+    for _ in range(n):
+        urmatorul = [0] * len(vector)
+        for q, x in enumerate(vector):
+            if x:
+                for p in tranzitii[q * nr_simboluri : (q + 1) * nr_simboluri]:
+                    if p >= 0:
+                        urmatorul[p] += x
+        if modul is not None:
+            urmatorul = [x % modul for x in urmatorul]
+        vector = urmatorul
+        total = sum(vector[q] for q in finale)
+        numar.append(total if modul is None else total % modul)
+    return numar
+
+
+def _foloseste_matrice(tabel: TabelTranzitii, n: int) -> bool:
+    # Alegem metoda mai ieftină: n · |δ| pentru programare dinamică, |Q|^3 · log n pentru matrice
+    nr_stari = len(tabel.stari)
+    cost_dinamic = n * max(1, len(tabel.tranzitii))
+    cost_matrice = nr_stari**3 * max(1, n.bit_length())
+    return cost_matrice < cost_dinamic
+
+
+def numara(afd: AFD, n: int, modul: Optional[int] = None) -> int:
+    """
+    Numărul de cuvinte de lungime exact n acceptate de AFD (exact, ca întreg mare, sau modulo `modul`).
+    Pentru n moderat se folosește programarea dinamică pe tabelul compilat, iar pentru n foarte mare
+    ridicarea la putere rapidă a matricei de numărare a tranzițiilor.
+    """
+    if n < 0:
+        return 0
+    tabel = afd.tabel()
+    if not _foloseste_matrice(tabel, n):
+        return _prin_programare_dinamica(tabel, n, modul)[n]
+
+    vector = [0] * len(tabel.stari)
+    vector[tabel.initiala] = 1
+    final = _vector_ori_putere(vector, _matrice_numarare(tabel, modul), n, modul)
+    total = sum(x for q, x in enumerate(final) if tabel.finale[q])
+    return total if modul is None else total % modul
+
+
+def numara_pana_la(afd: AFD, n: int, modul: Optional[int] = None) -> int:
+    """
+    Numărul de cuvinte de lungime cel mult n acceptate de AFD.
+    Varianta cu matrice adaugă o stare „colector” T: din fiecare stare finală există un drum spre T,
+    iar T are o buclă, deci drumurile de lungime n + 1 care se termină în T sunt exact
+    cuvintele acceptate de lungime 0..n.
+    """
+    if n < 0:
+        return 0
+    tabel = afd.tabel()
+    if not _foloseste_matrice(tabel, n):
+        total = sum(_prin_programare_dinamica(tabel, n, modul))
+        return total if modul is None else total % modul
+
+    matrice = _matrice_numarare(tabel, modul)
+    for q, rand in enumerate(matrice):
+        rand.append(1 if tabel.finale[q] else 0)
+    matrice.append([0] * len(tabel.stari) + [1])
+
+    vector = [0] * (len(tabel.stari) + 1)
+    vector[tabel.initiala] = 1
+    total = _vector_ori_putere(vector, matrice, n + 1, modul)[-1]
+    return total if modul is None else total % modul
+
+
+class EsantionatorUniform:
+    """
+    Extrage cuvinte de lungime exact n, uniform aleator dintre cele acceptate de AFD, fără respingeri.
+
+    ramase[k][q] = câte cuvinte de lungime k duc din starea q într-o stare finală. Pornind din q0,
+    fiecare simbol a este ales cu probabilitatea ramase[k - 1][δ(q, a)] / ramase[k][q], deci un
+    eșantion costă O(n · |Σ|). Tabelele sunt păstrate și extinse la nevoie pentru n mai mari.
+    """
+
+    def __init__(self, afd: AFD) -> None:
+        self.tabel = afd.tabel()
+        self.ramase: List[List[int]] = [[1 if f else 0 for f in self.tabel.finale]]
+
+    def _extinde(self, n: int) -> None:
+        # Calculează ramase[k] pentru k până la n, refolosind ce există deja
+        tabel = self.tabel
+        nr_simboluri = tabel.nr_simboluri
+        while len(self.ramase) <= n:
+            anterior = self.ramase[-1]
+            curent = [0] * len(tabel.stari)
+            for q in range(len(tabel.stari)):
+                total = 0
+                for p in tabel.tranzitii[q * nr_simboluri : (q + 1) * nr_simboluri]:
+                    if p >= 0:
+                        total += anterior[p]
+                curent[q] = total
+            self.ramase.append(curent)
+
+    def esantion(self, n: int, rng: Optional[random.Random] = None) -> str:
+        """Un cuvânt acceptat de lungime n, ales uniform; ValueError dacă nu există niciunul."""
+        aleator = rng if rng is not None else random
+        self._extinde(n)
+        tabel = self.tabel
+        nr_simboluri = tabel.nr_simboluri
+
+        q = tabel.initiala
+        if self.ramase[n][q] == 0:
+            raise ValueError(f"[Eroare] Automatul nu accepta niciun cuvant de lungime {n}.")
+
+        simboluri: List[str] = list()
+        for k in range(n, 0, -1):
+            alegere = aleator.randrange(self.ramase[k][q])
+            for a in range(nr_simboluri):
+                p = tabel.tranzitii[q * nr_simboluri + a]
+                if p < 0:
+                    continue
+                if alegere < self.ramase[k - 1][p]:
+                    simboluri.append(tabel.simboluri[a])
+                    q = p
+                    break
+                alegere -= self.ramase[k - 1][p]
+        return "".join(simboluri)
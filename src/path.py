@@ -78,3 +78,17 @@ class PathMaker:
             raise FileNotFoundError(
                 f"Fisierul nu exista or cale incorecta : '{file_path}'"
             )
+
+    def get_independent_OS_dir(self, *parts: str) -> Path:
+        """
+        Ca get_independent_OS_path, dar pentru un director: daca nu exista, este creat
+        (impreuna cu directoarele parinte lipsa).
+
+        Exemplu:
+
+            path_maker = PathMaker(__file__, "data")
+            cache_dir = path_maker.get_independent_OS_dir("cache")
+        """
+        dir_path = self.root_dir.joinpath(*self.base_parts, *parts)
+        dir_path.mkdir(parents=True, exist_ok=True)
+        return dir_path
@@ -0,0 +1,178 @@
+from collections import deque
+from typing import Callable, Deque, Dict, List, Optional, Tuple
+
+from src.afd import AFD, TabelTranzitii
+
+# Starea moartă implicită (lipsa tranziției) în construcțiile de mai jos
+MOARTA = -1
+
+
+def _alfabet_comun(a: TabelTranzitii, b: TabelTranzitii) -> List[str]:
+    # Σ1 ∪ Σ2, păstrând ordinea din primul automat
+    return list(dict.fromkeys(a.simboluri + b.simboluri))
+
+
+def _pas(tabel: TabelTranzitii, q: int, simbol: str) -> int:
+    # δ(q, simbol) ca id, sau MOARTA dacă nu există (inclusiv pentru simboluri din afara lui Σ)
+    a = tabel.simbol_id.get(simbol)
+    if q == MOARTA or a is None:
+        return MOARTA
+    return tabel.tranzitii[q * tabel.nr_simboluri + a]
+
+
+def _finala(tabel: TabelTranzitii, q: int) -> bool:
+    return q != MOARTA and tabel.finale[q]
+
+
+def _nume(tabel: TabelTranzitii, q: int) -> str:
+    return "∅" if q == MOARTA else str(tabel.stari[q])
+
+
+def produs(
+    afd1: AFD, afd2: AFD, conditie: Callable[[bool, bool], bool]
+) -> AFD:
+    """
+    Construcția produs, explorând doar perechile de stări accesibile din (q0, q0').
+    O pereche este finală dacă `conditie(finala în afd1, finala în afd2)` este adevărată.
+    Perechea (moartă, moartă) nu este creată: lipsa tranziției înseamnă blocaj.
+    """
+    if afd1.StareInitiala is None or afd2.StareInitiala is None:
+        raise ValueError("Starea initiala in AFD trebuie sa existe")
+
+    t1, t2 = afd1.tabel(), afd2.tabel()
+    sigma = _alfabet_comun(t1, t2)
+
+    rezultat = AFD()
+    rezultat.Sigma = sigma
+
+    start = (t1.initiala, t2.initiala)
+    nume: Dict[Tuple[int, int], str] = {start: f"({_nume(t1, start[0])},{_nume(t2, start[1])})"}
+    coada: Deque[Tuple[int, int]] = deque([start])
+    while coada:
+        pereche = coada.popleft()
+        p, q = pereche
+        stare = nume[pereche]
+        rezultat.Stari.append(stare)
+        if conditie(_finala(t1, p), _finala(t2, q)):
+            rezultat.StariFinale.append(stare)
+
+        for simbol in sigma:
+            urmatoarea = (_pas(t1, p, simbol), _pas(t2, q, simbol))
+            if urmatoarea == (MOARTA, MOARTA):
+                continue
+            if urmatoarea not in nume:
+                nume[urmatoarea] = f"({_nume(t1, urmatoarea[0])},{_nume(t2, urmatoarea[1])})"
+                coada.append(urmatoarea)
+            rezultat.Reguli.append(rezultat.Delta(stare, simbol, nume[urmatoarea]))
+
+    rezultat.StareInitiala = nume[start]
+    return rezultat
+
+
+def intersectie(afd1: AFD, afd2: AFD) -> AFD:
+    """AFD pentru L1 ∩ L2."""
+    return produs(afd1, afd2, lambda f1, f2: f1 and f2)
+
+
+def reuniune(afd1: AFD, afd2: AFD) -> AFD:
+    """AFD pentru L1 ∪ L2."""
+    return produs(afd1, afd2, lambda f1, f2: f1 or f2)
+
+
+def diferenta(afd1: AFD, afd2: AFD) -> AFD:
+    """AFD pentru L1 \\ L2."""
+    return produs(afd1, afd2, lambda f1, f2: f1 and not f2)
+
+
+def complement(afd: AFD) -> AFD:
+    """
+    AFD pentru Σ* \\ L: automatul este completat cu o stare moartă (doar dacă este accesibilă)
+    și stările finale sunt inversate. Se păstrează doar stările accesibile.
+    """
+    if afd.StareInitiala is None:
+        raise ValueError("Starea initiala in AFD trebuie sa existe")
+
+    tabel = afd.tabel()
+    nume_existente = set(tabel.stari)
+    nume_moarta = "MORT"
+    while nume_moarta in nume_existente:
+        nume_moarta += "_"
+
+    def nume(q: int) -> str:
+        return nume_moarta if q == MOARTA else str(tabel.stari[q])
+
+    rezultat = AFD()
+    rezultat.Sigma = list(tabel.simboluri)
+    vizitate = {tabel.initiala}
+    coada: Deque[int] = deque([tabel.initiala])
+    while coada:
+        q = coada.popleft()
+        rezultat.Stari.append(nume(q))
+        if not _finala(tabel, q):
+            rezultat.StariFinale.append(nume(q))
+        for simbol in tabel.simboluri:
+            p = _pas(tabel, q, simbol)
+            if p not in vizitate:
+                vizitate.add(p)
+                coada.append(p)
+            rezultat.Reguli.append(rezultat.Delta(nume(q), simbol, nume(p)))
+
+    rezultat.StareInitiala = nume(tabel.initiala)
+    return rezultat
+
+
+def echivalent(afd1: AFD, afd2: AFD) -> Optional[str]:
+    """
+    Verifică dacă cele două AFD-uri acceptă același limbaj (algoritmul Hopcroft–Karp).
+
+    Stările celor două automate (plus câte o stare moartă implicită) sunt unite într-o structură
+    union-find, începând cu (q0, q0'). Pentru fiecare pereche nouă se unesc succesorii pe fiecare
+    simbol; produsul complet nu este construit. La prima pereche în care doar una dintre stări este
+    finală, se întoarce cuvântul care duce în ea (contraexemplu). Întoarce None dacă sunt echivalente.
+    """
+    t1, t2 = afd1.tabel(), afd2.tabel()
+    sigma = _alfabet_comun(t1, t2)
+
+    # Stările primesc chei unice: (1, q) pentru afd1 și (2, q) pentru afd2
+    parinte: Dict[Tuple[int, int], Tuple[int, int]] = dict()
+
+    def radacina(x: Tuple[int, int]) -> Tuple[int, int]:
+        parinte.setdefault(x, x)
+        while parinte[x] != x:
+            parinte[x] = parinte[parinte[x]]
+            x = parinte[x]
+        return x
+
+    start = (t1.initiala, t2.initiala)
+    parinte[radacina((1, start[0]))] = radacina((2, start[1]))
+
+    # Pentru fiecare pereche: perechea din care s-a ajuns în ea și simbolul folosit
+    provenienta: Dict[Tuple[int, int], Tuple[Optional[Tuple[int, int]], str]] = {
+        start: (None, "")
+    }
+    coada: Deque[Tuple[int, int]] = deque([start])
+    while coada:
+        pereche = coada.popleft()
+        p, q = pereche
+
+        if _finala(t1, p) != _finala(t2, q):
+            # Reconstituim cuvântul mergând înapoi pe proveniență
+            simboluri: List[str] = list()
+            curenta: Optional[Tuple[int, int]] = pereche
+            while curenta is not None:
+                anterioara, simbol = provenienta[curenta]
+                simboluri.append(simbol)
+                curenta = anterioara
+            return "".join(reversed(simboluri))
+
+        for simbol in sigma:
+            p2, q2 = _pas(t1, p, simbol), _pas(t2, q, simbol)
+            r1, r2 = radacina((1, p2)), radacina((2, q2))
+            if r1 != r2:
+                parinte[r1] = r2
+                urmatoarea = (p2, q2)
+                if urmatoarea not in provenienta:
+                    provenienta[urmatoarea] = (pereche, simbol)
+                coada.append(urmatoarea)
+
+    return None
@@ -0,0 +1,192 @@
+from array import array
+from itertools import islice, starmap
+from typing import (
+    Callable,
+    Container,
+    Dict,
+    Generic,
+    Iterable,
+    Iterator,
+    List,
+    Sequence,
+    Set,
+    Tuple,
+    TypeVar,
+    Union,
+    overload,
+)
+
+T = TypeVar("T")
+
+
+class _Internare(dict):
+    # Dicționar valoare -> id care dă următorul id unei valori la prima ei căutare
+    def __missing__(self, valoare: str) -> int:
+        i = self[valoare] = len(self)
+        return i
+
+
+class ListaReguli(Generic[T]):
+    """
+    Listă compactă de reguli (tranziții sau producții), cu interfața unei liste Python.
+
+    Fiecare regulă are aceleași câmpuri (de ex. membrul_stang, simbol, membrul_drept).
+    Valorile sunt internate într-un tabel de nume comun, iar fiecare câmp este păstrat ca o
+    coloană array('I') de id-uri: o regulă costă 4 octeți per câmp, nu un obiect Python.
+    Obiectele regulă (vederi construite cu `fabrica`) sunt create doar la cerere, la iterare
+    sau indexare, deci codul care parcurge lista și citește atributele funcționează neschimbat.
+
+    Atribute:
+        fabrica   - clasa regulilor (primește valorile câmpurilor, în ordine)
+        campuri   - numele atributelor regulii, în ordinea coloanelor
+        nume      - id -> valoare (stare, simbol, membru drept...)
+        nume_id   - valoare -> id
+        coloane   - câte un array('I') de id-uri pentru fiecare câmp
+    """
+
+    def __init__(self, fabrica: Callable[..., T], campuri: Sequence[str]) -> None:
+        self.fabrica = fabrica
+        self.campuri: Tuple[str, ...] = tuple(campuri)
+        self.nume: List[str] = list()
+        self.nume_id: Dict[str, int] = dict()
+        self.coloane: Tuple[array, ...] = tuple(array("I") for _ in self.campuri)
+
+    @classmethod
+    def din_coloane(
+        cls,
+        fabrica: Callable[..., T],
+        campuri: Sequence[str],
+        nume: List[str],
+        coloane: Sequence[Iterable[int]],
+    ) -> "ListaReguli[T]":
+        """
+        Reconstruiește lista din tabelul de nume și coloanele de id-uri (de ex. din cache).
+        Coloanele pot fi orice secvențe de int-uri, inclusiv memoryview-uri; sunt copiate.
+        """
+        reguli = cls(fabrica, campuri)
+        reguli.nume = list(nume)
+        reguli.nume_id = {valoare: i for i, valoare in enumerate(reguli.nume)}
+        reguli.coloane = tuple(array("I", coloana) for coloana in coloane)
+        if len(reguli.coloane) != len(reguli.campuri) or len({len(c) for c in reguli.coloane}) > 1:
+            raise ValueError("[Eroare] Coloanele regulilor nu corespund campurilor.")
+        return reguli
+
+    def interneaza(self, valoare: str) -> int:
+        # Id-ul valorii în tabelul de nume, adăugând-o la prima apariție
+        i = self.nume_id.get(valoare)
+        if i is None:
+            i = self.nume_id[valoare] = len(self.nume)
+            self.nume.append(valoare)
+        return i
+
+    def adauga(self, *valori: str) -> None:
+        """Adaugă o regulă direct din valorile câmpurilor, fără a construi obiectul regulă."""
+        if len(valori) != len(self.campuri):
+            raise ValueError(
+                f"[Eroare] O regula are {len(self.campuri)} campuri: {', '.join(self.campuri)}."
+            )
+        for coloana, valoare in zip(self.coloane, valori):
+            coloana.append(self.interneaza(valoare))
+
+    def adauga_randuri(self, valori: Sequence[str]) -> None:
+        """
+        Adaugă mai multe reguli dintr-o secvență plată de valori (câmpurile regulilor, rând cu rând).
+        Valorile sunt internate deodată, deci id-urile sunt aceleași ca la apeluri repetate de adauga.
+        """
+        k = len(self.campuri)
+        if len(valori) % k:
+            raise ValueError(
+                f"[Eroare] O regula are {k} campuri: {', '.join(self.campuri)}."
+            )
+        # O singură căutare per valoare; doar valorile noi trec prin cod Python (__missing__)
+        nume_id = _Internare(self.nume_id)
+        ids = array("I", map(nume_id.__getitem__, valori))
+        self.nume.extend(islice(nume_id, len(self.nume), None))
+        self.nume_id = dict(nume_id)
+        for i, coloana in enumerate(self.coloane):
+            coloana.extend(ids[i::k])
+
+    def append(self, regula: T) -> None:
+        self.adauga(*(getattr(regula, camp) for camp in self.campuri))
+
+    def extend(self, reguli: Iterable[T]) -> None:
+        for regula in reguli:
+            self.append(regula)
+
+    def apartenenta(self, valori: Container[str]) -> bytearray:
+        """
+        Tabloul indexat după id: 1 dacă valoarea cu id-ul respectiv se află în `valori`, 0 altfel.
+        Permite verificarea unei coloane întregi fără a reconstrui numele (vezi AFD.validare).
+        """
+        return bytearray(valoare in valori for valoare in self.nume)
+
+    def valori(self) -> Iterator[Tuple[str, ...]]:
+        """Valorile câmpurilor fiecărei reguli, ca tupluri, fără a construi obiectele regulă."""
+        nume = self.nume.__getitem__
+        return zip(*(map(nume, coloana) for coloana in self.coloane))
+
+    def __iter__(self) -> Iterator[T]:
+        return starmap(self.fabrica, self.valori())
+
+    def __len__(self) -> int:
+        return len(self.coloane[0])
+
+    def _regula(self, index: int) -> T:
+        return self.fabrica(*(self.nume[coloana[index]] for coloana in self.coloane))
+
+    @overload
+    def __getitem__(self, index: int) -> T: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[T]: ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[T, List[T]]:
+        if isinstance(index, slice):
+            return [self._regula(i) for i in range(*index.indices(len(self)))]
+        return self._regula(index)
+
+    def __setitem__(self, index: int, regula: T) -> None:
+        for coloana, camp in zip(self.coloane, self.campuri):
+            coloana[index] = self.interneaza(getattr(regula, camp))
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        for coloana in self.coloane:
+            del coloana[index]
+
+    def pop(self, index: int = -1) -> T:
+        regula = self._regula(index)
+        del self[index]
+        return regula
+
+    def clear(self) -> None:
+        # Tabelul de nume este păstrat: id-urile rămân valabile pentru reguli adăugate ulterior
+        for coloana in self.coloane:
+            del coloana[:]
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}([{', '.join(str(regula) for regula in self)}])"
+
+
+def valori_reguli(reguli: Iterable, campuri: Sequence[str]) -> Iterator[Tuple[str, ...]]:
+    """
+    Valorile câmpurilor fiecărei reguli, ca tupluri. Pentru o ListaReguli se citesc direct
+    coloanele; pentru o listă obișnuită de obiecte regulă se citesc atributele.
+    """
+    if isinstance(reguli, ListaReguli):
+        return reguli.valori()
+    return (tuple(getattr(regula, camp) for camp in campuri) for regula in reguli)
+
+
+def pozitii_nule(*verificari: bytes) -> List[int]:
+    """
+    Pozițiile (crescătoare, fără repetiții) la care cel puțin una dintre verificări are octetul 0,
+    de ex. regulile în care un câmp nu trece testul din apartenenta. Căutarea se face cu bytes.find,
+    deci costul în Python este proporțional doar cu numărul de poziții găsite.
+    """
+    pozitii: Set[int] = set()
+    for verificare in verificari:
+        pozitie = verificare.find(0)
+        while pozitie != -1:
+            pozitii.add(pozitie)
+            pozitie = verificare.find(0, pozitie + 1)
+    return sorted(pozitii)
@@ -1,66 +1,90 @@
-from typing import Set, List, Dict, FrozenSet, Tuple, Optional
+import time
+from collections import deque
+from typing import Deque, Dict, List
+from src import instrumentare
+from src.afd import AFD
 from src.afn import AFN
 
-Stare = str
-Simbol = str
-
-class AFD:
-    Stari: List[str] = list()
-    Sigma: List[str] = list()
-    Delta: Dict[Tuple[Stare, Simbol], Stare] = {}
-    StareInitiala: Optional[str] = None
-    StariFinale: List[str] = list()
-
-class StariFinale:
-    name_to_set: Dict[str, FrozenSet[str]] = {}
-    set_to_name: Dict[FrozenSet[str], str] = {}
-    names: List[str] = list()
-    
-    def add(self, name:str, s:Set[str]):
-        fs = frozenset(s)
-        self.name_to_set[name] = fs
-        self.set_to_name[fs] = name
-        self.names.append(name)
-    
-    def get_set(self, name:str) -> FrozenSet[str]:
-        return self.name_to_set[name]
-
-    def get_name(self, s:Set[str]) -> str:
-        return self.set_to_name[frozenset(s)]
-
 
 class Transformator:
-    def __init__(self, afn:AFN) -> None:
+    """
+    Transforma un AFN intr-un AFD echivalent prin constructia submultimilor.
+
+    Starile AFD sunt multimi de stari AFN, reprezentate ca masti de biti (vezi TabelBitset),
+    deci doua multimi egale sunt recunoscute printr-o singura cautare in dictionar.
+    Se genereaza doar starile accesibile din starea initiala, folosind o coada de lucru.
+    Multimea vida nu devine stare: lipsa tranzitiei inseamna blocaj.
+    λ-tranzitiile sunt tratate prin λ-inchiderile precalculate in TabelBitset.
+    """
+
+    def __init__(self, afn: AFN) -> None:
         self.afn = afn
-        
-    def transformare_AFN_in_AFD(self) -> AFD:
-        if self.afn.StareInitiala:
-            stari_finale:StariFinale = StariFinale()
-            stari_finale.add("S1", set(self.afn.StareInitiala))
-            
-            Sigma:List[str] = self.afn.Sigma
-            Delta: Dict[Tuple[Stare, Simbol], Stare] = {}
-
-            for name in stari_finale.names:
-                for simbol in Sigma:
-                    stare_noua:List[str] = list()
-                    for stare_afn in stari_finale.get_set(name):
-                        stare_noua.extend(set(self.afn.Delta[(stare_afn, simbol)]))
-                    new_name = f"S{len(stari_finale.names) + 1}"
-                    stari_finale.add(new_name, set(stare_noua))
-                    Delta[(name, simbol)] = new_name
-            
-            final_names = stari_finale.names
-            final_names.remove("S1")
-            
-            afd = AFD()
-            afd.Stari = stari_finale.names
-            afd.Sigma = Sigma
-            afd.Delta = Delta
-            afd.StareInitiala = "S1"
-            afd.StariFinale = final_names
-            return afd
-        else:
+        # Statistici despre ultima transformare
+        self.numar_stari: int = 0
+        self.durata: float = 0.0
+        # Starea AFD -> multimea de stari AFN pe care o reprezinta
+        self.multimi: Dict[str, frozenset] = dict()
+
+    @instrumentare.cronometrat("transformare.determinizare")
+    def transformare_AFN_in_AFD(self, should_print: bool = True) -> AFD:
+        if self.afn.StareInitiala is None:
             raise ValueError("Starea initiala in AFN trebuie sa existe")
 
-            
\ No newline at end of file
+        start = time.perf_counter()
+
+        tabel = self.afn.tabel()
+        simboluri: List[str] = list(tabel.simbol_id)
+        # succesori_stare[q][a] = masca lui δ(q, a); accesul pe stare evita o parcurgere per simbol
+        succesori_stare = list(zip(*tabel.succesori))
+
+        # Fiecare multime (masca) primeste un nume S1, S2, ... in ordinea descoperirii
+        nume: Dict[int, str] = {tabel.initiala: "S1"}
+        coada: Deque[int] = deque([tabel.initiala])
+
+        afd = AFD()
+        afd.Sigma = list(simboluri)
+        afd.StareInitiala = "S1"
+
+        while coada:
+            masca = coada.popleft()
+            stare = nume[masca]
+            afd.Stari.append(stare)
+            if masca & tabel.finale:
+                afd.StariFinale.append(stare)
+
+            # Daca Σ contine doar λ, AFD-ul are doar starea initiala (λ-inchisa) si nicio tranzitie
+            if not simboluri:
+                continue
+
+            # Calculam simultan succesorii pentru toate simbolurile
+            urmatoare = [0] * len(simboluri)
+            m = masca
+            while m:
+                bit = m & -m
+                for a, succesor in enumerate(succesori_stare[bit.bit_length() - 1]):
+                    urmatoare[a] |= succesor
+                m ^= bit
+
+            for a, masca_noua in enumerate(urmatoare):
+                # Multimea vida: nu exista tranzitie (blocaj)
+                if not masca_noua:
+                    continue
+                if masca_noua not in nume:
+                    nume[masca_noua] = f"S{len(nume) + 1}"
+                    coada.append(masca_noua)
+                afd.Reguli.append(afd.Delta(stare, simboluri[a], nume[masca_noua]))
+
+        self.multimi = {n: frozenset(tabel.multime(m)) for m, n in nume.items()}
+        self.numar_stari = len(afd.Stari)
+        self.durata = time.perf_counter() - start
+
+        instr = instrumentare.curenta()
+        instr.numara("transformare.stari_create", self.numar_stari)
+        instr.numara("transformare.tranzitii_create", len(afd.Reguli))
+
+        if should_print:
+            print(
+                f"\nAu fost generate {self.numar_stari} stari AFD in {self.durata:.4f} secunde."
+            )
+
+        return afd
@@ -0,0 +1,25 @@
+import itertools
+from pathlib import Path
+from typing import Callable, Type, TypeVar
+
+import pytest
+
+T = TypeVar("T")
+
+
+@pytest.fixture
+def din_text(tmp_path: Path) -> Callable[[Type[T], str], T]:
+    """
+    Construieste un AFD, AFN sau o Gramatica citita (cu metoda citire a clasei) dintr-un
+    fisier temporar cu textul dat. Fiecare apel scrie un fisier nou.
+    """
+    contor = itertools.count()
+
+    def construieste(clasa: Type[T], text: str) -> T:
+        fisier = tmp_path / f"{clasa.__name__.lower()}_{next(contor)}.txt"
+        fisier.write_text(text, encoding="utf-8")
+        obiect = clasa()
+        obiect.citire(fisier)  # type: ignore[attr-defined]
+        return obiect
+
+    return construieste
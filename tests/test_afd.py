@@ -0,0 +1,58 @@
+import pytest
+
+from src.afd import AFD
+
+ANTET = "q0 q1 q2\nq0\nq2\na b\n"
+
+
+def test_tranzitie_repetata_este_duplicat(din_text, capsys):
+    afd = din_text(AFD, ANTET + "q0 a q1\nq0 a q1\nq1 b q2\n")
+    assert not afd.validare(should_print=True)
+    iesire = capsys.readouterr().out
+    assert "repeta tranzitia 0" in iesire
+    assert "nu este determinist" not in iesire
+
+
+def test_tranzitie_nedeterminista(din_text, capsys):
+    afd = din_text(AFD, ANTET + "q0 a q1\nq0 a q2\n")
+    assert not afd.validare(should_print=True)
+    assert "In tranzitia 1 δ(q0, a) este deja definita in tranzitia 0" in capsys.readouterr().out
+
+
+def test_validare_raporteaza_in_ordine(din_text, capsys):
+    afd = din_text(AFD, ANTET + "q0 a q9\nqx b q1\nq1 c q2\nq2 b q2\n")
+    assert not afd.validare(should_print=True)
+    linii = capsys.readouterr().out.splitlines()
+    assert [linie.split("tranzitia ")[1][:1] for linie in linii] == ["0", "1", "2"]
+
+
+def test_afd_valid(din_text):
+    afd = din_text(AFD, ANTET + "q0 a q1\nq1 b q2\nq2 a q2\n")
+    assert afd.validare(should_print=False)
+    assert afd.verificare("ab", should_print=False) == "acceptat"
+    assert afd.verificare("aba", should_print=False) == "acceptat"
+    assert afd.verificare("b", should_print=False) == "blocaj"
+
+
+def test_compilare_prima_tranzitie_are_prioritate(din_text):
+    afd = din_text(AFD, ANTET + "q0 a q1\nq0 a q2\nq1 b q2\n")
+    assert afd.verificare("ab", should_print=False) == "acceptat"
+
+
+def test_compilare_stari_din_afara_lui_q(din_text):
+    # Stările care apar doar în tranziții sunt internate, simbolurile din afara lui Σ ignorate
+    afd = din_text(AFD, ANTET + "q0 a q9\nq9 b q2\nq0 c q2\n")
+    tabel = afd.compilare()
+    assert tabel.stari == ["q0", "q1", "q2", "q9"]
+    assert afd.verificare("ab", should_print=False) == "acceptat"
+
+
+@pytest.mark.parametrize("linie", ["q0 a", "q0 a q1 q2"])
+def test_citire_linie_cu_campuri_gresite(din_text, linie: str):
+    with pytest.raises(ValueError, match="Linia 6 trebuie sa aiba 3 campuri"):
+        din_text(AFD, ANTET + f"q0 b q1\n{linie}\nq1 b q2\n")
+
+
+def test_citire_linie_goala(din_text):
+    with pytest.raises(ValueError, match="Linia 6 este goala"):
+        din_text(AFD, ANTET + "q0 b q1\n\nq1 b q2\n")
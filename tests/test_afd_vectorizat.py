@@ -0,0 +1,22 @@
+from src.afd import AFD
+from src.afd_vectorizat import ACCEPTAT, BLOCAJ, NEACCEPTAT, MotorVectorizat
+from tests.utilitare import afd_aleator, cuvinte_aleatoare
+
+
+def test_acelasi_verdict_ca_verificare_lot(din_text):
+    # Densitatea sub 1 produce blocaje, iar "z" este în afara alfabetului
+    afd = din_text(AFD, afd_aleator(30, 3, densitate=0.7, seed=8))
+    cuvinte = cuvinte_aleatoare(afd.Sigma + ["z"], 500, 12, seed=9)
+    asteptat = list(afd.verificare_lot(cuvinte))
+    assert {verdict.rezultat for verdict in asteptat} == {"acceptat", "neacceptat", "blocaj"}
+    assert MotorVectorizat(afd).verificare_lot(cuvinte) == asteptat
+
+
+def test_matrice_de_aceeasi_lungime(din_text):
+    afd = din_text(AFD, "q0 q1\nq0\nq1\na b\nq0 a q1\nq1 b q0\n")
+    motor = MotorVectorizat(afd)
+    rezultate, pozitii = motor.executare(motor.codificare(["ab", "aa", "ba", "az"]))
+    assert rezultate.tolist() == [NEACCEPTAT, BLOCAJ, BLOCAJ, NEACCEPTAT]
+    assert pozitii.tolist() == [-1, 1, 0, -1]
+    rezultate, _ = motor.executare(motor.codificare(["a", "b"]))
+    assert rezultate.tolist() == [ACCEPTAT, BLOCAJ]
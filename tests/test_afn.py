@@ -0,0 +1,39 @@
+import pytest
+
+from src.afn import AFN
+
+ANTET = "q0 q1 q2\nq0\nq2\na b\n"
+
+
+def test_citire_construieste_delta(din_text):
+    afn = din_text(AFN, ANTET + "q0 a q0\nq0 a q1\nq0 a q1\nq1 * q2\n")
+    assert afn.Delta == {("q0", "a"): {"q0", "q1"}, ("q1", "*"): {"q2"}}
+    assert len(afn.Reguli) == 4
+    assert afn.validare(should_print=False)
+    assert afn.accepta("a")
+    assert not afn.accepta("b")
+
+
+@pytest.mark.parametrize(
+    "reguli, mesaj",
+    [
+        ("q0 a q1\nq0 c q1\nq9 a q1\n", "Simbolul trebuie"),
+        ("q0 a q1\nq9 c q1\nq0 c q1\n", "Starile trebuie"),
+        ("q0 a q1\nq0 a q9\n", "Starile trebuie"),
+    ],
+)
+def test_citire_prima_tranzitie_gresita(din_text, reguli: str, mesaj: str):
+    with pytest.raises(ValueError, match=mesaj):
+        din_text(AFN, ANTET + reguli)
+
+
+def test_validare_reguli_adaugate_direct(capsys):
+    afn = AFN()
+    afn.Stari, afn.Sigma, afn.StareInitiala, afn.StariFinale = ["q0", "q1"], ["a"], "q0", ["q1"]
+    afn.Reguli.adauga("q0", "a", "q1")
+    afn.Reguli.adauga("q0", "b", "q7")
+    assert not afn.validare(should_print=True)
+    linii = capsys.readouterr().out.splitlines()
+    assert len(linii) == 2
+    assert "In tranzitia 2 simbolul" in linii[0]
+    assert "In tranzitia 2 membrul drept" in linii[1]
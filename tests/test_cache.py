@@ -0,0 +1,36 @@
+import pytest
+
+from src.afd import AFD
+from src.cache import CacheAutomate
+from src.path import PathMaker
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return CacheAutomate(PathMaker(tmp_path / "main.py", "cache"))
+
+
+def test_intrare_refolosita_si_invalidata(cache, tmp_path, monkeypatch):
+    sursa = tmp_path / "afd.txt"
+    sursa.write_text("q0 q1\nq0\nq1\na b\nq0 a q1\nq1 b q0\n", encoding="utf-8")
+
+    # Prima incarcare: sursa este citita si intrarea este scrisa pe disc
+    afd = cache.afd(sursa)
+    assert list(cache.director.iterdir()) == [cache.cale(sursa, "afd")]
+
+    # A doua incarcare: intrarea din cache este folosita, fara citirea textului
+    def citire_interzisa(self, file_path):
+        raise AssertionError("sursa nu trebuia recitita")
+
+    with monkeypatch.context() as m:
+        m.setattr(AFD, "citire", citire_interzisa)
+        din_cache = cache.afd(sursa)
+    assert din_cache.Stari == afd.Stari
+    assert [str(t) for t in din_cache.Reguli] == [str(t) for t in afd.Reguli]
+
+    # Dupa modificarea sursei, cheia se schimba si automatul este reconstruit
+    sursa.write_text("q0 q1\nq0\nq0\na b\nq0 a q1\n", encoding="utf-8")
+    modificat = cache.afd(sursa)
+    assert modificat.StariFinale == ["q0"]
+    assert modificat.verificare("ab", should_print=False) != "acceptat"
+    assert len(list(cache.director.iterdir())) == 2
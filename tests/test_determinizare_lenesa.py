@@ -0,0 +1,36 @@
+import pytest
+
+from src.afn import AFN
+from src.determinizare_lenesa import COST_INTRARE, AFDLenes
+from tests.utilitare import afn_aleator, cuvinte_aleatoare
+
+
+def test_rezultate_ca_simularea_afn(din_text):
+    afn = din_text(AFN, afn_aleator(40, 3, seed=1))
+    cuvinte = cuvinte_aleatoare(afn.Sigma, 300, 12, seed=2)
+    # Un cache foarte mic forțează evacuări, fără să schimbe rezultatele
+    lenes = AFDLenes(afn, capacitate=5 * COST_INTRARE)
+    assert list(lenes.accepta_lot(cuvinte)) == list(afn.accepta_lot(cuvinte))
+    assert lenes.evictari > 0
+
+
+def test_capacitatea_este_in_octeti(din_text):
+    # Bugetul include și măștile: cu 200 de stări, fiecare mască are ~25 de octeți
+    mic = din_text(AFN, afn_aleator(8, 2, seed=3))
+    mare = din_text(AFN, afn_aleator(200, 2, seed=3))
+    capacitate = 20 * COST_INTRARE
+    for afn in (mic, mare):
+        lenes = AFDLenes(afn, capacitate=capacitate)
+        cuvinte = cuvinte_aleatoare(afn.Sigma, 200, 20, seed=4)
+        list(lenes.accepta_lot(cuvinte))
+        statistici = lenes.statistici()
+        assert statistici["octeti_in_cache"] <= capacitate
+        assert statistici["octeti_in_cache"] == sum(
+            lenes._cost(masca, urmatoarea) for (masca, _), urmatoarea in lenes._cache.items()
+        )
+
+
+def test_capacitate_invalida(din_text):
+    afn = din_text(AFN, afn_aleator(4, 2))
+    with pytest.raises(ValueError):
+        AFDLenes(afn, capacitate=0)
@@ -0,0 +1,35 @@
+import itertools
+
+from src.gramatica import Gramatica
+
+
+def cuvinte_pana_la(alfabet: str, lungime: int):
+    for n in range(lungime + 1):
+        for simboluri in itertools.product(alfabet, repeat=n):
+            yield "".join(simboluri)
+
+
+def test_earley_ca_automatul_pe_gramatica_regulata(din_text):
+    gramatica = din_text(Gramatica, "S A\na b\nS\nS aA\nS ab\nA aA\nA b\nA *\n")
+    assert gramatica.este_regulata()
+    cuvinte = list(cuvinte_pana_la("ab", 7))
+    assert list(gramatica.parser().apartine_lot(cuvinte)) == list(gramatica.apartine_lot(cuvinte))
+
+
+def test_earley_pe_gramatica_independenta_de_context(din_text):
+    # a^n b^n, n >= 0, cu λ-productie
+    gramatica = din_text(Gramatica, "S\na b\nS\nS aSb\nS *\n")
+    assert not gramatica.este_regulata()
+    for cuvant in cuvinte_pana_la("ab", 8):
+        n = len(cuvant) // 2
+        assert gramatica.apartine(cuvant) == (cuvant == "a" * n + "b" * n)
+
+
+def test_alegerea_motorului_se_face_o_data(din_text, monkeypatch):
+    gramatica = din_text(Gramatica, "S\na b\nS\nS aSb\nS ab\n")
+    apeluri = []
+    original = gramatica.este_regulata
+    monkeypatch.setattr(gramatica, "este_regulata", lambda: apeluri.append(1) or original())
+    for cuvant in ["ab", "aabb", "abab", ""]:
+        gramatica.apartine(cuvant)
+    assert len(apeluri) == 1
@@ -0,0 +1,38 @@
+from src.esantionare import esantionare_paralela
+from src.gramatica import Gramatica
+
+# S ⟶ SS | a: fara limite, o generare se poate prelungi oricat
+RECURSIVA = "S\na\nS\nS SS\nS a\n"
+
+
+def test_acelasi_seed_aceleasi_cuvinte(din_text):
+    gramatica = din_text(Gramatica, "S A\na b\nS\nS abS\nS aSAb\nS aA\nA aAb\nA a\n")
+    argumente = dict(seed=7, dimensiune_lot=50, max_incercari=400, max_len=12)
+    secvential = list(esantionare_paralela(gramatica, 20, workers=1, **argumente))
+    paralel = list(esantionare_paralela(gramatica, 20, workers=2, **argumente))
+    assert secvential == paralel
+    assert len(set(secvential)) == len(secvential)
+
+
+def test_limitele_ajung_la_generare(din_text):
+    gramatica = din_text(Gramatica, RECURSIVA)
+    statistici: dict = dict()
+    cuvinte = list(
+        esantionare_paralela(
+            gramatica, 5, workers=2, max_len=5, max_incercari=200, statistici=statistici
+        )
+    )
+    assert cuvinte and all(len(cuvant) <= 5 for cuvant in cuvinte)
+    assert statistici["esecuri"] == 0
+
+
+def test_limite_imposibile_sunt_esecuri(din_text):
+    gramatica = din_text(Gramatica, "S\na\nS\nS aaS\nS aa\n")
+    statistici: dict = dict()
+    cuvinte = list(
+        esantionare_paralela(
+            gramatica, 3, workers=1, max_len=1, max_incercari=30, statistici=statistici
+        )
+    )
+    assert cuvinte == []
+    assert statistici == {"generari": 30, "esecuri": 30}
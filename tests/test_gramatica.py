@@ -0,0 +1,55 @@
+import random
+
+import pytest
+
+from src.gramatica import Gramatica
+
+
+@pytest.mark.parametrize(
+    "text, max_len, max_pasi",
+    [
+        # Lungimea minima (1) si numarul minim de pasi (1) sunt atinse de derivari diferite
+        ("S Y\na\nS\nS aaaa\nS Y\nY a\n", 1, 1),
+        ("S X Y\na\nS\nS XX\nX aaaa\nX Y\nY a\n", 3, 3),
+    ],
+)
+def test_generare_limite_imposibile_impreuna(din_text, text: str, max_len: int, max_pasi: int):
+    gramatica = din_text(Gramatica, text)
+    with pytest.raises(ValueError):
+        gramatica.generare(False, rng=random.Random(0), max_len=max_len, max_pasi=max_pasi)
+
+
+def test_generare_respecta_ambele_limite(din_text):
+    # Singurul cuvant posibil este aaaaa (un X ⟶ aaaa, celalalt X ⟶ Y ⟶ a)
+    gramatica = din_text(Gramatica, "S X Y\na\nS\nS XX\nX aaaa\nX Y\nY a\n")
+    for seed in range(50):
+        pasi = gramatica.generare(False, rng=random.Random(seed), max_len=5, max_pasi=4)
+        assert pasi[-1] == "aaaaa"
+        assert len(pasi) - 1 <= 4
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        # S ⟶ SSS urmat de S ⟶ λ nu schimba marginea lungimii: fara limita de pasi,
+        # mersul aleator se putea repeta la nesfarsit
+        "S\na\nS\nS SSS\nS *\nS a\n",
+        "S A\na b\nS\nA AAA\nA Ab\nS aSA\nS SaA\nS *\nS SSS\n",
+    ],
+)
+def test_generare_doar_max_len_se_termina(din_text, text: str):
+    gramatica = din_text(Gramatica, text)
+    max_pasi = gramatica.FACTOR_PASI_IMPLICITI * int(
+        max(gramatica.pasi_minimi_pe_lungimi(3)["S"][-1], 4)
+    )
+    for seed in range(10):
+        pasi = gramatica.generare(False, rng=random.Random(seed), max_len=3)
+        assert len(pasi[-1]) <= 3
+        assert len(pasi) - 1 <= max_pasi
+
+
+def test_pasi_minimi_pe_lungimi(din_text):
+    gramatica = din_text(Gramatica, "S Y\na\nS\nS aaaa\nS Y\nY a\n")
+    tabele = gramatica.pasi_minimi_pe_lungimi(4)
+    assert tabele["Y"] == [float("inf"), 1, 1, 1, 1]
+    assert tabele["S"] == [float("inf"), 2, 2, 2, 1]
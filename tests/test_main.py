@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+import main
+
+AFD_TEXT = "q0 q1\nq0\nq1\na b\nq0 a q1\nq1 b q0\n"
+GRAMATICA_TEXT = "S\na b\nS\nS aSb\nS *\n"
+
+
+@pytest.fixture
+def fisiere(tmp_path):
+    afd = tmp_path / "afd.txt"
+    afd.write_text(AFD_TEXT, encoding="utf-8")
+    gramatica = tmp_path / "gramatica.txt"
+    gramatica.write_text(GRAMATICA_TEXT, encoding="utf-8")
+    cuvinte = tmp_path / "cuvinte.txt"
+    cuvinte.write_text("a\nab\naa\naba\n", encoding="utf-8")
+    return afd, gramatica, cuvinte
+
+
+def linii_json(text):
+    return [json.loads(linie) for linie in text.splitlines()]
+
+
+def test_validate(fisiere, tmp_path, capsys):
+    afd, _, _ = fisiere
+    # Starea finala q1 nu apartine lui Q
+    invalid = tmp_path / "invalid.txt"
+    invalid.write_text("q0\nq0\nq1\na\nq0 a q0\n", encoding="utf-8")
+    assert main.main(["validate", "afd", str(afd), "--no-cache"]) == 0
+    assert main.main(["validate", "afd", str(invalid), "--no-cache"]) == 1
+    iesire = capsys.readouterr()
+    assert [r["valid"] for r in linii_json(iesire.out)] == [True, False]
+    assert "Starile finale F" in iesire.err
+
+
+def test_accept_tsv(fisiere, capsys):
+    afd, _, cuvinte = fisiere
+    argumente = ["accept", "afd", str(afd), str(cuvinte), "--format", "tsv", "--no-cache"]
+    assert main.main(argumente) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        "a\tacceptat\t",
+        "ab\tneacceptat\t",
+        "aa\tblocaj\t1",
+        "aba\tacceptat\t",
+    ]
+
+
+def test_enumerate_si_generate(fisiere, tmp_path, capsys):
+    _, gramatica, _ = fisiere
+    assert main.main(["enumerate", str(gramatica), "-n", "3", "--no-cache"]) == 0
+    assert [r["cuvant"] for r in linii_json(capsys.readouterr().out)] == ["", "ab", "aabb"]
+
+    iesire = tmp_path / "generate.jsonl"
+    argumente = ["generate", str(gramatica), "-n", "3", "--max-len", "6", "--no-cache"]
+    assert main.main(argumente + ["-o", str(iesire)]) == 0
+    cuvinte = [r["cuvant"] for r in linii_json(iesire.read_text(encoding="utf-8"))]
+    assert len(cuvinte) == 3 and set(cuvinte) <= {"", "ab", "aabb", "aaabbb"}
+
+
+def test_enumerate_fara_limite(fisiere, capsys):
+    _, gramatica, _ = fisiere
+    assert main.main(["enumerate", str(gramatica), "--no-cache"]) == 2
+    assert "[Eroare]" in capsys.readouterr().err
@@ -0,0 +1,22 @@
+from src.afd import AFD
+from tests.utilitare import afd_aleator, cuvinte_aleatoare
+
+
+def test_minimizare_pastreaza_limbajul(din_text):
+    afd = din_text(AFD, afd_aleator(60, 3, densitate=0.8, seed=5))
+    minimal = afd.minimizeaza(should_print=False)
+    assert len(minimal.Stari) <= len(afd.Stari) + 1
+    assert afd.echivalent(minimal) is None
+    for cuvant in cuvinte_aleatoare(afd.Sigma, 200, 10, seed=6):
+        assert (afd.verificare(cuvant, should_print=False) == "acceptat") == (
+            minimal.verificare(cuvant, should_print=False) == "acceptat"
+        )
+
+
+def test_stari_echivalente_unite(din_text):
+    # q1 și q2 sunt echivalente: blocul lor poartă numele stării cu id-ul mai mic
+    afd = din_text(AFD, "q0 q1 q2\nq0\nq1 q2\na\nq0 a q1\nq1 a q2\nq2 a q1\n")
+    minimal = afd.minimizeaza(should_print=False)
+    assert minimal.Stari == ["q0", "q1"]
+    assert minimal.StariFinale == ["q1"]
+    assert [str(t) for t in minimal.Reguli] == ["δ(q0, a) = q1", "δ(q1, a) = q1"]
@@ -0,0 +1,37 @@
+import itertools
+import random
+
+import pytest
+
+from src import numarare
+from src.afd import AFD
+from tests.utilitare import afd_aleator
+
+
+def numara_brut(afd: AFD, n: int) -> int:
+    return sum(
+        afd.verificare("".join(cuvant), should_print=False) == "acceptat"
+        for cuvant in itertools.product(afd.Sigma, repeat=n)
+    )
+
+
+@pytest.mark.parametrize("matrice", [False, True])
+def test_numara_ca_enumerarea_bruta(din_text, monkeypatch, matrice):
+    # Ambele metode (programare dinamică și putere de matrice) dau același rezultat
+    monkeypatch.setattr(numarare, "_foloseste_matrice", lambda tabel, n: matrice)
+    afd = din_text(AFD, afd_aleator(8, 3, densitate=0.8, seed=2))
+    brut = [numara_brut(afd, n) for n in range(7)]
+    assert [afd.numara(n) for n in range(7)] == brut
+    assert afd.numara_pana_la(6) == sum(brut)
+    assert afd.numara(6, modul=7) == brut[6] % 7
+    assert afd.numara_pana_la(6, modul=7) == sum(brut) % 7
+
+
+def test_enumerare_si_esantion(din_text):
+    afd = din_text(AFD, afd_aleator(6, 2, seed=3))
+    cuvinte = list(afd.enumerare(5))
+    assert len(cuvinte) == afd.numara_pana_la(5)
+    rng = random.Random(0)
+    for _ in range(20):
+        cuvant = afd.esantion(5, rng)
+        assert len(cuvant) == 5 and cuvant in cuvinte
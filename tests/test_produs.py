@@ -0,0 +1,30 @@
+from src.afd import AFD
+from tests.utilitare import afd_aleator, cuvinte_aleatoare
+
+
+def accepta(afd: AFD, cuvant: str) -> bool:
+    return afd.verificare(cuvant, should_print=False) == "acceptat"
+
+
+def test_operatii_ca_logica_pe_cuvinte(din_text):
+    a = din_text(AFD, afd_aleator(12, 2, densitate=0.7, seed=1))
+    b = din_text(AFD, afd_aleator(9, 2, densitate=0.7, seed=2))
+    intersectie, reuniune = a.intersectie(b), a.reuniune(b)
+    diferenta, complement = a.diferenta(b), a.complement()
+    for cuvant in cuvinte_aleatoare(a.Sigma, 300, 8, seed=3):
+        x, y = accepta(a, cuvant), accepta(b, cuvant)
+        assert accepta(intersectie, cuvant) == (x and y)
+        assert accepta(reuniune, cuvant) == (x or y)
+        assert accepta(diferenta, cuvant) == (x and not y)
+        assert accepta(complement, cuvant) == (not x)
+
+
+def test_echivalent(din_text):
+    a = din_text(AFD, afd_aleator(20, 2, densitate=0.8, seed=4))
+    assert a.echivalent(a.minimizeaza(should_print=False)) is None
+    assert a.echivalent(a.complement().complement()) is None
+
+    b = din_text(AFD, afd_aleator(20, 2, densitate=0.8, seed=5))
+    contraexemplu = a.echivalent(b)
+    assert contraexemplu is not None
+    assert accepta(a, contraexemplu) != accepta(b, contraexemplu)
@@ -0,0 +1,22 @@
+from src.afn import AFN
+from src.transformare import Transformator
+
+
+def test_alfabet_doar_lambda(din_text):
+    # Σ contine doar λ: AFD-ul are doar starea initiala (λ-inchisa) si nicio tranzitie
+    afn = din_text(AFN, "q0 q1\nq0\nq1\n*\nq0 * q1\n")
+    afd = Transformator(afn).transformare_AFN_in_AFD(should_print=False)
+    assert afd.Stari == ["S1"]
+    assert afd.StareInitiala == "S1"
+    assert afd.StariFinale == ["S1"]
+    assert len(afd.Reguli) == 0
+    assert afd.verificare("", should_print=False) == "acceptat"
+    assert afd.verificare("a", should_print=False) != "acceptat"
+
+
+def test_determinizare_pastreaza_limbajul(din_text):
+    # Cuvintele peste {a, b} care se termina in ab
+    afn = din_text(AFN, "q0 q1 q2\nq0\nq2\na b\nq0 a q0\nq0 b q0\nq0 a q1\nq1 b q2\n")
+    afd = Transformator(afn).transformare_AFN_in_AFD(should_print=False)
+    for cuvant in ["", "a", "ab", "bab", "aba", "aab", "abb"]:
+        assert (afd.verificare(cuvant, should_print=False) == "acceptat") == afn.accepta(cuvant)
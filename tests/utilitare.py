@@ -0,0 +1,43 @@
+"""Automate si cuvinte aleatoare (deterministe pentru un seed dat), in formatul din data/."""
+
+import random
+from typing import List
+
+ALFABET = "abcdefghijklmnopqrstuvwxyz"
+
+
+def afd_aleator(nr_stari: int, nr_simboluri: int, densitate: float = 1.0, seed: int = 0) -> str:
+    # Fiecare pereche (q, a) are o tranzitie cu probabilitatea `densitate`
+    rng = random.Random(seed)
+    stari = [f"q{i}" for i in range(nr_stari)]
+    sigma = list(ALFABET[:nr_simboluri])
+    finale = [q for q in stari if rng.random() < 0.3] or [stari[-1]]
+    reguli = [
+        f"{q} {a} {rng.choice(stari)}"
+        for q in stari
+        for a in sigma
+        if rng.random() < densitate
+    ]
+    return "\n".join([" ".join(stari), stari[0], " ".join(finale), " ".join(sigma), *reguli])
+
+
+def afn_aleator(nr_stari: int, nr_simboluri: int, tranzitii_per_stare: int = 3, seed: int = 0) -> str:
+    # Tranzitii aleatorii din fiecare stare; aproximativ una din zece este o λ-tranzitie
+    rng = random.Random(seed)
+    stari = [f"q{i}" for i in range(nr_stari)]
+    sigma = list(ALFABET[:nr_simboluri])
+    finale = [q for q in stari if rng.random() < 0.3] or [stari[-1]]
+    reguli = [
+        f"{q} {'*' if rng.random() < 0.1 else rng.choice(sigma)} {rng.choice(stari)}"
+        for q in stari
+        for _ in range(tranzitii_per_stare)
+    ]
+    return "\n".join([" ".join(stari), stari[0], " ".join(finale), " ".join(sigma), *reguli])
+
+
+def cuvinte_aleatoare(sigma: List[str], numar: int, lungime_maxima: int, seed: int = 0) -> List[str]:
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(sigma) for _ in range(rng.randint(0, lungime_maxima)))
+        for _ in range(numar)
+    ]